@@ -0,0 +1,7 @@
+"""Local engines behind the personal assistant's skills and commands.
+
+The AppleScript skills in ``.gemini/scripts`` talk to Mail, Calendar and
+Reminders directly. The modules in this package keep local indexes of that
+data so commands can answer from disk instead of re-reading every item on
+every run.
+"""
@@ -0,0 +1,29 @@
+"""Local article store in front of the engblogs MCP.
+
+``refresh`` asks the MCP only for articles newer than the newest one the
+``ArticleStore`` holds, and only once its TTL has passed. Articles are
+deduplicated by canonical URL and indexed with SQLite FTS5, so ``/search``
+is answered with BM25 ranking, and the category commands and ``/weekly``
+are answered from the store.
+"""
+
+from assistant.articles.ingest import RefreshReport, refresh
+from assistant.articles.mcp import MCPClient, MCPError
+from assistant.articles.models import Article, canonical_url, from_mcp
+from assistant.articles.store import ArticleStore, Hit, SyncState
+from assistant.articles.topics import TOPICS, Topic
+
+__all__ = [
+    "Article",
+    "ArticleStore",
+    "Hit",
+    "MCPClient",
+    "MCPError",
+    "RefreshReport",
+    "SyncState",
+    "TOPICS",
+    "Topic",
+    "canonical_url",
+    "from_mcp",
+    "refresh",
+]
@@ -0,0 +1,252 @@
+"""Article store benchmark, and a stand-in engblogs MCP server.
+
+``StandInServer`` speaks just enough Streamable HTTP MCP to serve fixture
+articles through ``search_articles``. The tests use it, and so does ``main``.
+``main`` fills a store with synthetic articles, then times a delta refresh
+against the stand-in and the local search, topic and weekly queries. Those
+are compared with one live ``search_articles`` round trip, which is what
+every command cost before.
+"""
+
+import json
+import random
+import statistics
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from assistant.articles.ingest import refresh
+from assistant.articles.mcp import MCPClient
+from assistant.articles.models import from_mcp, parse_published
+from assistant.articles.store import ArticleStore
+from assistant.articles.topics import TOPICS
+
+BLOGS = (
+    ("Vercel", "Frontend"),
+    ("Netflix TechBlog", "Backend"),
+    ("Cloudflare", "Cloud"),
+    ("Uber Engineering", "Backend"),
+    ("OpenAI", "AI/ML"),
+    ("Hugging Face", "AI/ML"),
+    ("AWS Architecture", "Cloud"),
+    ("Shopify Engineering", "Frontend"),
+    ("GitHub Blog", "DevTools"),
+    ("Stripe Engineering", "Backend"),
+)
+WORDS = {
+    "Frontend": ("react", "css", "hydration", "bundle", "vite", "accessibility", "rendering"),
+    "Backend": ("postgres", "kafka", "api", "sharding", "latency", "graphql", "caching"),
+    "Cloud": ("kubernetes", "serverless", "terraform", "edge", "autoscaling", "observability"),
+    "AI/ML": ("llm", "agents", "inference", "embeddings", "fine-tuning", "evaluation", "rag"),
+    "DevTools": ("ci", "monorepo", "testing", "copilot", "debugging", "git", "workflow"),
+}
+FILLER = ("how", "we", "scaled", "rebuilt", "lessons", "from", "migrating", "our", "at", "scale")
+
+
+def make_articles(count: int, now: float, days: float = 28, seed: int = 7, start: int = 0):
+    """``count`` MCP article records spread over the ``days`` before ``now``."""
+    rng = random.Random(seed)
+    records = []
+    for i in range(start, start + count):
+        blog, category = BLOGS[rng.randrange(len(BLOGS))]
+        words = rng.sample(WORDS[category], 3) + rng.sample(FILLER, 3)
+        rng.shuffle(words)
+        published = now - days * 86400 * rng.random()
+        slug = "-".join(words)
+        records.append(
+            {
+                "id": i,
+                "title": " ".join(words).capitalize(),
+                "link": f"https://{blog.split()[0].lower()}.example.com/blog/{slug}-{i}",
+                "pubDate": datetime.fromtimestamp(published, timezone.utc).isoformat(),
+                "feedTitle": blog,
+                "feedCategory": category,
+                "excerpt": " ".join(rng.choices(WORDS[category] + FILLER, k=24)),
+                "status": "unread",
+            }
+        )
+    return records
+
+
+# -- stand-in MCP server ----------------------------------------------------
+
+
+class StandInServer:
+    """Serves ``articles`` from ``search_articles`` on a local port.
+
+    Filters by ``since``, ``query`` and ``category`` and pages with
+    ``limit``/``offset``, newest first. ``calls`` records every tool call.
+    ``stream`` answers as server-sent events instead of plain JSON.
+    """
+
+    def __init__(self, articles: list[dict], stream: bool = False) -> None:
+        self.articles: list[dict] = []
+        self._published: list[float] = []
+        self.add(articles)
+        self.stream = stream
+        self.calls: list[tuple[str, dict]] = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/mcp"
+
+    def __enter__(self) -> "StandInServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def add(self, articles: list[dict]) -> None:
+        """Publish more articles, as the aggregator does between syncs."""
+        self.articles = sorted(
+            self.articles + list(articles), key=lambda record: record["pubDate"], reverse=True
+        )
+        self._published = [parse_published(record["pubDate"]) for record in self.articles]
+
+    def search(self, arguments: dict) -> list[dict]:
+        since = parse_published(arguments.get("since")) or 0.0
+        query = (arguments.get("query") or "").lower()
+        category = (arguments.get("category") or "").lower()
+        found = [
+            record
+            for record, published in zip(self.articles, self._published)
+            if published >= since
+            and (not category or record["feedCategory"].lower() == category)
+            and (not query or query in f"{record['title']} {record['excerpt']}".lower())
+        ]
+        offset = int(arguments.get("offset", 0))
+        return found[offset : offset + int(arguments.get("limit", 20))]
+
+    def _reply(self, message: dict) -> dict | None:
+        method = message.get("method")
+        if "id" not in message:
+            return None
+        if method == "initialize":
+            result = {
+                "protocolVersion": message["params"]["protocolVersion"],
+                "capabilities": {"tools": {}},
+                "serverInfo": {"name": "engblogs-stand-in", "version": "0"},
+            }
+        elif method == "tools/call":
+            name, arguments = message["params"]["name"], message["params"]["arguments"]
+            self.calls.append((name, arguments))
+            if name == "search_articles":
+                text = json.dumps(self.search(arguments))
+                result = {"content": [{"type": "text", "text": text}]}
+            else:
+                text = f"no tool {name}"
+                result = {"content": [{"type": "text", "text": text}], "isError": True}
+        else:
+            error = {"code": -32601, "message": f"no method {method}"}
+            return {"jsonrpc": "2.0", "id": message["id"], "error": error}
+        return {"jsonrpc": "2.0", "id": message["id"], "result": result}
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                reply = server._reply(json.loads(self.rfile.read(length)))
+                if reply is None:
+                    self.send_response(202)
+                    self.end_headers()
+                    return
+                body = json.dumps(reply)
+                if server.stream:
+                    payload, kind = f"event: message\ndata: {body}\n\n", "text/event-stream"
+                else:
+                    payload, kind = body, "application/json"
+                data = payload.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", kind)
+                self.send_header("Content-Length", str(len(data)))
+                self.send_header("Mcp-Session-Id", "stand-in")
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        return Handler
+
+
+# -- benchmark --------------------------------------------------------------
+
+QUERIES = ("graphql performance", "kubernetes autoscaling", "llm agents", "react hydration")
+
+
+def _median_ms(action, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        action()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def run(count: int = 50_000, new: int = 25, repeat: int = 50) -> dict:
+    now = time.time()
+    # A year of posts from a few hundred blogs, then the last hour's new ones.
+    records = make_articles(count, now - 3600, days=365)
+    latest = make_articles(new, now, days=1 / 24, seed=8, start=count)
+    with tempfile.TemporaryDirectory() as tmp, ArticleStore(Path(tmp) / "a.sqlite3") as store:
+        started = time.perf_counter()
+        # Oldest first, the order in which refresh would have added them.
+        articles = sorted(map(from_mcp, records), key=lambda article: article.published)
+        store.add(articles, fetched_at=now - 7200)
+        ingest_s = time.perf_counter() - started
+        store.mark_synced("engblogs", store.newest(), now - 7200)
+
+        with StandInServer(records + latest) as server:
+            client = MCPClient(server.url)
+            report = refresh(store, client, now=now)
+            live_ms = _median_ms(
+                lambda: client.call_tool("search_articles", {"query": "kubernetes", "limit": 20}),
+                repeat,
+            )
+        since = now - 7 * 86400
+        local = {
+            "search": statistics.median(
+                _median_ms(lambda q=q: store.search(q, limit=10), repeat) for q in QUERIES
+            ),
+            **{
+                f"/{name}": _median_ms(lambda t=topic: store.topic(t, since), repeat)
+                for name, topic in TOPICS.items()
+            },
+            "/weekly": _median_ms(lambda: store.since(since), max(repeat // 5, 1)),
+        }
+        return {
+            "articles": len(store),
+            "ingest_s": ingest_s,
+            "delta_calls": report.calls,
+            "delta_fetched": report.fetched,
+            "delta_added": report.added,
+            "delta_ms": report.seconds * 1000,
+            "live_ms": live_ms,
+            "local_ms": local,
+        }
+
+
+def main(count: int = 50_000) -> None:
+    row = run(count)
+    print(f"{row['articles']} articles, ingested in {row['ingest_s']:.1f}s")
+    print(
+        f"delta refresh: {row['delta_calls']} call(s), {row['delta_fetched']} fetched, "
+        f"{row['delta_added']} new, {row['delta_ms']:.1f} ms"
+    )
+    print(f"live search_articles round trip (stand-in, localhost): {row['live_ms']:.1f} ms")
+    for name, ms in row["local_ms"].items():
+        print(f"  local {name:<10} {ms:>7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
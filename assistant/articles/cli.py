@@ -0,0 +1,163 @@
+"""``main.py articles`` subcommands."""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timezone
+
+from assistant.articles import benchmark
+from assistant.articles.digest import group_by_category, render_articles, render_weekly
+from assistant.articles.ingest import DEFAULT_TTL, FEED, refresh
+from assistant.articles.mcp import URL_ENV, MCPClient, MCPError
+from assistant.articles.store import ArticleStore
+from assistant.articles.topics import TOPICS
+from assistant.bench.metrics import EXTRACT, FETCH, FILTER, SERIALIZE, stage
+
+
+def register(subparsers) -> None:
+    parser = subparsers.add_parser("articles", help="local engineering-blog article index")
+    parser.add_argument("--store", help="store file (default: in the assistant data dir)")
+    parser.add_argument("--mcp-url", help=f"engblogs MCP endpoint (default: ${URL_ENV})")
+    commands = parser.add_subparsers(dest="articles_command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--ttl", type=float, default=DEFAULT_TTL, help="seconds between MCP syncs")
+    common.add_argument("--offline", action="store_true", help="answer without asking the MCP")
+    common.add_argument("--json", action="store_true", help="MCP-shaped JSON instead of markdown")
+
+    search_parser = commands.add_parser("search", parents=[common], help="BM25 full-text search")
+    search_parser.add_argument("query", nargs="+")
+    search_parser.add_argument("--days", type=int, help="only articles from the last N days")
+    search_parser.add_argument("--limit", type=int, default=10)
+    search_parser.set_defaults(handler=_search)
+
+    for topic in TOPICS.values():
+        topic_parser = commands.add_parser(topic.name, parents=[common], help=topic.description)
+        topic_parser.add_argument("--days", type=int, default=7)
+        topic_parser.add_argument("--limit", type=int, default=20)
+        topic_parser.set_defaults(handler=_topic, topic=topic.name)
+
+    weekly_parser = commands.add_parser("weekly", parents=[common], help="last 7 days by category")
+    weekly_parser.add_argument("--days", type=int, default=7)
+    weekly_parser.set_defaults(handler=_weekly)
+
+    sync_parser = commands.add_parser("sync", help="pull new articles from the MCP now")
+    sync_parser.add_argument("--force", action="store_true", help="ignore the TTL")
+    sync_parser.add_argument("--ttl", type=float, default=DEFAULT_TTL)
+    sync_parser.set_defaults(handler=_sync)
+
+    bench_parser = commands.add_parser("bench", help="local query latency benchmark")
+    bench_parser.add_argument("--count", type=int, default=50_000)
+    bench_parser.set_defaults(handler=_bench)
+
+
+def _iso(timestamp: float | None) -> str | None:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat(timespec="seconds")
+
+
+def _freshen(store: ArticleStore, args: argparse.Namespace) -> dict:
+    """Sync deltas if the TTL has passed; report how current the answer is."""
+    client = MCPClient.from_env(args.mcp_url)
+    if client is not None and not args.offline:
+        try:
+            refresh(store, client, ttl=args.ttl)
+        except MCPError as exc:
+            print(f"engblogs MCP unavailable, answering locally: {exc}", file=sys.stderr)
+    state = store.sync_state(FEED)
+    return {"stale": not state.fresh(args.ttl), "syncedAt": _iso(state.synced_at)}
+
+
+def _print(result: dict, markdown: str, as_json: bool) -> None:
+    if as_json:
+        print(json.dumps({"success": True} | result, indent=2, ensure_ascii=False))
+    else:
+        print(markdown)
+
+
+def _search(args: argparse.Namespace) -> int:
+    query = " ".join(args.query)
+    with ArticleStore(args.store) as store:
+        with stage("articles.search", FETCH):
+            freshness = _freshen(store, args)
+        with stage("articles.search", FILTER):
+            since = time.time() - args.days * 86400 if args.days else None
+            hits = store.search(query, since, args.limit)
+    with stage("articles.search", EXTRACT):
+        articles = [hit.article.as_dict() | {"score": round(hit.score, 3)} for hit in hits]
+        result = {"command": "search", "query": query, **freshness, "articles": articles}
+    with stage("articles.search", SERIALIZE):
+        title = f"🔎 Articles about “{query}”"
+        _print(result, render_articles(title, [hit.article for hit in hits]), args.json)
+    return 0
+
+
+def _topic(args: argparse.Namespace) -> int:
+    topic = TOPICS[args.topic]
+    with ArticleStore(args.store) as store:
+        with stage("articles.topic", FETCH):
+            freshness = _freshen(store, args)
+        with stage("articles.topic", FILTER):
+            found = store.topic(topic, time.time() - args.days * 86400, args.limit)
+    with stage("articles.topic", EXTRACT):
+        result = {
+            "command": topic.name,
+            **freshness,
+            "articles": [article.as_dict() for article in found],
+        }
+    with stage("articles.topic", SERIALIZE):
+        _print(result, render_articles(topic.description, found), args.json)
+    return 0
+
+
+def _weekly(args: argparse.Namespace) -> int:
+    with ArticleStore(args.store) as store:
+        with stage("articles.weekly", FETCH):
+            freshness = _freshen(store, args)
+        with stage("articles.weekly", FILTER):
+            found = store.since(time.time() - args.days * 86400)
+    with stage("articles.weekly", EXTRACT):
+        result = {
+            "command": "weekly",
+            **freshness,
+            "total": len(found),
+            "categories": [
+                {"category": name, "articles": [article.as_dict() for article in members]}
+                for name, members in group_by_category(found)
+            ],
+        }
+    with stage("articles.weekly", SERIALIZE):
+        _print(result, render_weekly(found), args.json)
+    return 0
+
+
+def _sync(args: argparse.Namespace) -> int:
+    client = MCPClient.from_env(args.mcp_url)
+    if client is None:
+        print(f"no MCP endpoint: pass --mcp-url or set {URL_ENV}", file=sys.stderr)
+        return 1
+    with ArticleStore(args.store) as store:
+        try:
+            with stage("articles.sync", FETCH):
+                report = refresh(store, client, ttl=args.ttl, force=args.force)
+        except MCPError as exc:
+            print(exc, file=sys.stderr)
+            return 1
+        total = len(store)
+    with stage("articles.sync", SERIALIZE):
+        if report.skipped:
+            print(f"up to date (synced {_iso(report.state.synced_at)}, {total} articles)")
+        else:
+            print(
+                f"{report.calls} call(s): +{report.added} ~{report.updated} "
+                f"({report.fetched} fetched, {report.rejected} rejected, "
+                f"{report.seconds * 1000:.0f} ms, {total} articles)"
+            )
+    return 0
+
+
+def _bench(args: argparse.Namespace) -> int:
+    benchmark.main(args.count)
+    return 0
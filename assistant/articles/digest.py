@@ -0,0 +1,52 @@
+"""Markdown in the shapes defined by docs/TECH_DIGEST_FORMAT.md."""
+
+from collections.abc import Iterable
+from datetime import datetime, timezone
+
+from assistant.articles.models import Article
+
+
+def display_date(published: float) -> str:
+    """``October 23, 2025``: the digest format never shows ISO dates."""
+    day = datetime.fromtimestamp(published, timezone.utc)
+    return f"{day:%B} {day.day}, {day.year}"
+
+
+def format_article(article: Article, excerpt: bool = True) -> str:
+    lines = [
+        f"**[{article.title or article.link}]({article.link})**",
+        f"*{article.source or 'Unknown blog'} • {display_date(article.published)}*",
+    ]
+    if excerpt and article.excerpt:
+        lines += ["", f"> {article.excerpt}"]
+    return "\n".join(lines)
+
+
+def render_articles(title: str, articles: Iterable[Article]) -> str:
+    articles = list(articles)
+    if not articles:
+        return f"## {title}\n\nNo matching articles."
+    body = "\n\n".join(format_article(article) for article in articles)
+    return f"## {title}\n\n{body}"
+
+
+def group_by_category(articles: Iterable[Article]) -> list[tuple[str, list[Article]]]:
+    """Articles per ``feedCategory``, largest group first, newest first within."""
+    groups: dict[str, list[Article]] = {}
+    for article in articles:
+        groups.setdefault(article.category or "Other", []).append(article)
+    for members in groups.values():
+        members.sort(key=lambda article: article.published, reverse=True)
+    return sorted(groups.items(), key=lambda item: (-len(item[1]), item[0].lower()))
+
+
+def render_weekly(articles: Iterable[Article]) -> str:
+    articles = list(articles)
+    sections = ["## 🗓️ Weekly Tech Digest"]
+    for category, members in group_by_category(articles):
+        entries = "\n\n".join(format_article(article, excerpt=False) for article in members)
+        sections.append(f"## {category}\n\n{entries}")
+    sections.append(
+        f"---\n\n**{len(articles)} articles** tracked this week from engineering blogs."
+    )
+    return "\n\n".join(sections)
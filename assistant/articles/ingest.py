@@ -0,0 +1,95 @@
+"""Pull new articles from the engblogs MCP into an ``ArticleStore``.
+
+The store remembers the newest publication date it has seen and when it
+last asked. Within the TTL the MCP is not called at all. After that, only
+articles published since the newest one (less a small overlap for posts the
+aggregator picks up late) are requested, page by page.
+"""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from assistant.articles.mcp import MCPClient
+from assistant.articles.models import from_mcp
+from assistant.articles.store import ArticleStore, SyncState
+
+FEED = "engblogs"
+DELTA_TOOL = "search_articles"
+DEFAULT_TTL = 60 * 60
+PAGE_SIZE = 100
+BACKFILL_DAYS = 30
+OVERLAP = 6 * 60 * 60
+
+
+@dataclass(slots=True)
+class RefreshReport:
+    state: SyncState
+    skipped: bool = False  # still within the TTL; the MCP was not asked
+    calls: int = 0
+    fetched: int = 0
+    added: int = 0
+    updated: int = 0
+    rejected: int = 0  # records without a usable link or a readable date
+    seconds: float = 0.0
+
+
+def delta_arguments(since: float, offset: int) -> dict:
+    """``search_articles`` arguments for one page of articles since ``since``."""
+    day = datetime.fromtimestamp(since, timezone.utc).isoformat(timespec="seconds")
+    return {"since": day, "limit": PAGE_SIZE, "offset": offset}
+
+
+def records_in(result: Any) -> list[dict]:
+    """The article records in a tool result: a list, or a list under a known key."""
+    if isinstance(result, dict):
+        for key in ("articles", "results", "items"):
+            if isinstance(result.get(key), list):
+                result = result[key]
+                break
+    if not isinstance(result, list):
+        return []
+    return [record for record in result if isinstance(record, dict)]
+
+
+def refresh(
+    store: ArticleStore,
+    client: MCPClient,
+    ttl: float = DEFAULT_TTL,
+    force: bool = False,
+    now: float | None = None,
+) -> RefreshReport:
+    """Fetch what the store is missing, unless it was refreshed within ``ttl``.
+
+    Raises ``MCPError`` if the server cannot be reached; the store and its
+    sync state are then left as they were.
+    """
+    started = time.perf_counter()
+    now = time.time() if now is None else now
+    state = store.sync_state(FEED)
+    if not force and state.fresh(ttl, now):
+        return RefreshReport(state, skipped=True)
+
+    report = RefreshReport(state)
+    since = state.newest - OVERLAP if state.newest else now - BACKFILL_DAYS * 24 * 60 * 60
+    records: list[dict] = []
+    links: set[str] = set()
+    while True:
+        page = records_in(client.call_tool(DELTA_TOOL, delta_arguments(since, len(records))))
+        report.calls += 1
+        records += page
+        unseen = {str(record.get("link")) for record in page} - links
+        links |= unseen
+        # A short page is the last; a page of known links means offsets are ignored.
+        if len(page) < PAGE_SIZE or not unseen:
+            break
+
+    articles = [article for article in map(from_mcp, records) if article is not None]
+    report.fetched = len(records)
+    report.rejected = len(records) - len(articles)
+    report.added, report.updated = store.add(articles, fetched_at=now)
+    newest = max([a.published for a in articles] + [state.newest or 0.0]) or None
+    report.state = store.mark_synced(FEED, newest, now)
+    report.seconds = time.perf_counter() - started
+    return report
@@ -0,0 +1,125 @@
+"""Minimal client for the engblogs MCP server over Streamable HTTP.
+
+Only what the article store needs: the ``initialize`` handshake, then
+``tools/call``. Replies may come back as plain JSON or as a server-sent
+event stream; both are read. Tool results are expected as JSON, either in
+``structuredContent`` or as the text of the first content block.
+"""
+
+import json
+import os
+import urllib.error
+import urllib.request
+from typing import Any
+
+PROTOCOL_VERSION = "2025-06-18"
+CLIENT_INFO = {"name": "my-personal-assistant", "version": "0.1.0"}
+DEFAULT_TIMEOUT = 10.0
+URL_ENV = "ENGBLOGS_MCP_URL"
+
+
+class MCPError(RuntimeError):
+    """The MCP server could not be reached or returned an error."""
+
+
+class MCPClient:
+    """One session with an MCP server at ``url``."""
+
+    def __init__(self, url: str, timeout: float = DEFAULT_TIMEOUT) -> None:
+        self.url = url
+        self.timeout = timeout
+        self._session: str | None = None
+        self._next_id = 0
+        self._ready = False
+
+    @classmethod
+    def from_env(cls, url: str | None = None) -> "MCPClient | None":
+        """A client for ``url`` or ``$ENGBLOGS_MCP_URL``, or None if neither is set."""
+        url = url or os.environ.get(URL_ENV)
+        return cls(url) if url else None
+
+    def _post(self, message: dict) -> Any:
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json, text/event-stream",
+            "MCP-Protocol-Version": PROTOCOL_VERSION,
+        }
+        if self._session:
+            headers["Mcp-Session-Id"] = self._session
+        request = urllib.request.Request(
+            self.url, json.dumps(message).encode("utf-8"), headers, method="POST"
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                self._session = response.headers.get("Mcp-Session-Id") or self._session
+                raw = response.read()
+                kind = response.headers.get_content_type()
+        except urllib.error.HTTPError as exc:
+            raise MCPError(f"{self.url}: HTTP {exc.code} {exc.reason}") from exc
+        except (urllib.error.URLError, TimeoutError, OSError) as exc:
+            raise MCPError(f"{self.url}: {getattr(exc, 'reason', exc)}") from exc
+        if "id" not in message or not raw.strip():
+            return None
+        try:
+            body = raw.decode("utf-8")
+            replies = _events(body) if kind == "text/event-stream" else [json.loads(body)]
+        except ValueError as exc:  # UnicodeDecodeError and JSONDecodeError
+            raise MCPError(f"{self.url}: unreadable reply to {message['method']}: {exc}") from exc
+        for reply in replies:
+            if isinstance(reply, dict) and reply.get("id") == message["id"]:
+                if "error" in reply:
+                    error = reply["error"]
+                    detail = error.get("message") if isinstance(error, dict) else error
+                    raise MCPError(f"{message['method']}: {detail}")
+                return reply.get("result")
+        raise MCPError(f"{message['method']}: no reply from {self.url}")
+
+    def _request(self, method: str, params: dict) -> Any:
+        self._next_id += 1
+        message = {"jsonrpc": "2.0", "id": self._next_id, "method": method, "params": params}
+        return self._post(message)
+
+    def initialize(self) -> None:
+        if self._ready:
+            return
+        self._request(
+            "initialize",
+            {"protocolVersion": PROTOCOL_VERSION, "capabilities": {}, "clientInfo": CLIENT_INFO},
+        )
+        self._post({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        self._ready = True
+
+    def call_tool(self, name: str, arguments: dict) -> Any:
+        """The tool's result, decoded from JSON."""
+        self.initialize()
+        result = self._request("tools/call", {"name": name, "arguments": arguments}) or {}
+        if not isinstance(result, dict):
+            raise MCPError(f"{name}: expected a result object, got {type(result).__name__}")
+        content = result.get("content", [])
+        if not isinstance(content, list) or not all(isinstance(b, dict) for b in content):
+            raise MCPError(f"{name}: expected a list of content blocks")
+        texts = [
+            block["text"]
+            for block in content
+            if block.get("type") == "text" and isinstance(block.get("text"), str)
+        ]
+        if result.get("isError"):
+            raise MCPError(f"{name}: {' '.join(texts) or 'tool error'}")
+        if "structuredContent" in result:
+            return result["structuredContent"]
+        try:
+            return json.loads(texts[0])
+        except (IndexError, ValueError) as exc:
+            raise MCPError(f"{name}: expected a JSON result") from exc
+
+
+def _events(body: str) -> list[Any]:
+    """JSON payloads of the ``data:`` lines in a server-sent event stream."""
+    replies, data = [], []
+    for line in body.splitlines() + [""]:
+        if line.startswith("data:"):
+            data.append(line[5:].strip())
+        elif not line and data:
+            replies.append(json.loads("\n".join(data)))
+            data = []
+    return replies
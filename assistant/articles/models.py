@@ -0,0 +1,101 @@
+"""Article records as the engblogs MCP returns them and as the store keeps them."""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only say where a click came from.
+TRACKING_PARAMS = frozenset(
+    {"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "ref_src", "source", "src", "via"}
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Article:
+    """One blog post.
+
+    ``url`` is the canonical form of ``link`` and identifies the article;
+    ``link`` is kept as published so digests link to what the blog printed.
+    """
+
+    url: str
+    link: str
+    title: str
+    source: str
+    category: str
+    published: float
+    excerpt: str = ""
+    status: str = ""
+
+    def as_dict(self) -> dict:
+        """The article under the MCP's field names, as the digest format expects."""
+        return {
+            "title": self.title,
+            "link": self.link,
+            "feedTitle": self.source,
+            "feedCategory": self.category,
+            "pubDate": datetime.fromtimestamp(self.published, timezone.utc).isoformat(),
+            "excerpt": self.excerpt,
+            "status": self.status,
+        }
+
+
+def canonical_url(link: str) -> str:
+    """Collapse the spellings of one article URL.
+
+    http and https, ``www.``, default ports, fragments, trailing slashes,
+    tracking parameters and the order of the remaining parameters do not
+    make a different article. Raises ``ValueError`` for a link ``urlsplit``
+    cannot read, such as one with a non-numeric port.
+    """
+    parts = urlsplit(link.strip())
+    host = (parts.hostname or "").lower().removeprefix("www.")
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(("https", host, path, urlencode(query), ""))
+
+
+def parse_published(text: str | None) -> float | None:
+    """Unix time for an ISO 8601 or RFC 2822 date; naive dates are UTC."""
+    if not text:
+        return None
+    text = text.strip()
+    try:
+        parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(text)
+        except (TypeError, ValueError):
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def from_mcp(record: dict) -> Article | None:
+    """An article from one MCP result record, or None without a usable link or date."""
+    link = record.get("link") or record.get("url")
+    published = parse_published(record.get("pubDate") or record.get("published"))
+    if not isinstance(link, str) or not link.strip() or published is None:
+        return None
+    try:
+        url = canonical_url(link)
+    except ValueError:
+        return None
+    return Article(
+        url=url,
+        link=link.strip(),
+        title=" ".join((record.get("title") or "").split()),
+        source=record.get("feedTitle") or record.get("source") or "",
+        category=record.get("feedCategory") or record.get("category") or "",
+        published=published,
+        excerpt=" ".join((record.get("excerpt") or "").split()),
+        status=record.get("status") or "",
+    )
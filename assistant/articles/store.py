@@ -0,0 +1,245 @@
+"""SQLite article store with an FTS5 full-text index ranked by BM25."""
+
+import re
+import sqlite3
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from assistant.articles.models import Article
+from assistant.articles.topics import Topic
+from assistant.paths import data_dir
+from assistant.sqlite import select_in
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id         INTEGER PRIMARY KEY,
+    url        TEXT    NOT NULL UNIQUE,
+    link       TEXT    NOT NULL,
+    title      TEXT    NOT NULL,
+    source     TEXT    NOT NULL,
+    category   TEXT    NOT NULL COLLATE NOCASE,
+    published  REAL    NOT NULL,
+    excerpt    TEXT    NOT NULL,
+    status     TEXT    NOT NULL,
+    fetched_at REAL    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS articles_by_date ON articles (published);
+CREATE INDEX IF NOT EXISTS articles_by_category ON articles (category, published);
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, excerpt, source, content='articles', content_rowid='id',
+    tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, excerpt, source)
+    VALUES (new.id, new.title, new.excerpt, new.source);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, excerpt, source)
+    VALUES ('delete', old.id, old.title, old.excerpt, old.source);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, excerpt, source)
+    VALUES ('delete', old.id, old.title, old.excerpt, old.source);
+    INSERT INTO articles_fts (rowid, title, excerpt, source)
+    VALUES (new.id, new.title, new.excerpt, new.source);
+END;
+CREATE TABLE IF NOT EXISTS sync_state (
+    feed      TEXT PRIMARY KEY,
+    newest    REAL,
+    synced_at REAL
+);
+"""
+
+# BM25 column weights: title, excerpt, source blog.
+BM25_WEIGHTS = (4.0, 1.0, 0.5)
+_COLUMNS = "url, link, title, source, category, published, excerpt, status"
+_TOKEN = re.compile(r"\w+")
+
+
+def default_store_path() -> Path:
+    return data_dir() / "articles.sqlite3"
+
+
+@dataclass(frozen=True, slots=True)
+class SyncState:
+    """Newest publication date seen from a feed and when it was last asked."""
+
+    feed: str
+    newest: float | None
+    synced_at: float | None
+
+    def fresh(self, ttl: float, now: float | None = None) -> bool:
+        now = time.time() if now is None else now
+        return self.synced_at is not None and now - self.synced_at < ttl
+
+
+@dataclass(frozen=True, slots=True)
+class Hit:
+    article: Article
+    score: float  # BM25, higher is better
+
+
+def match_expression(terms: Iterable[str]) -> str:
+    """An FTS5 query matching any of ``terms``; phrases stay phrases.
+
+    Words are quoted, so user input never reaches FTS5 as query syntax.
+    """
+    quoted = []
+    for term in terms:
+        words = _TOKEN.findall(term.lower())
+        if words:
+            quoted.append('"' + " ".join(words) + '"')
+    return " OR ".join(dict.fromkeys(quoted))
+
+
+class ArticleStore:
+    """Articles keyed by canonical URL, with a BM25-ranked full-text index."""
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path) if path is not None else default_store_path()
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "ArticleStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # -- writes -----------------------------------------------------------
+
+    def add(self, articles: Iterable[Article], fetched_at: float | None = None) -> tuple[int, int]:
+        """Insert new articles and refresh changed ones; returns (added, updated).
+
+        Articles sharing a canonical URL are one article; the last copy wins.
+        """
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        by_url = {article.url: article for article in articles}
+        rows = select_in(self._conn, f"SELECT {_COLUMNS} FROM articles WHERE url IN", by_url)
+        known = {row[0]: row for row in rows}
+
+        fresh = [a for url, a in by_url.items() if url not in known]
+        changed = [a for url, a in by_url.items() if url in known and _row(a) != known[url]]
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT INTO articles ({_COLUMNS}, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(*_row(a), fetched_at) for a in fresh],
+            )
+            self._conn.executemany(
+                "UPDATE articles SET link = ?, title = ?, source = ?, category = ?, "
+                "published = ?, excerpt = ?, status = ?, fetched_at = ? WHERE url = ?",
+                [(*_row(a)[1:], fetched_at, a.url) for a in changed],
+            )
+        return len(fresh), len(changed)
+
+    def sync_state(self, feed: str) -> SyncState:
+        row = self._conn.execute(
+            "SELECT newest, synced_at FROM sync_state WHERE feed = ?", (feed,)
+        ).fetchone()
+        return SyncState(feed, *row) if row else SyncState(feed, None, None)
+
+    def mark_synced(self, feed: str, newest: float | None, synced_at: float) -> SyncState:
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)", (feed, newest, synced_at)
+            )
+        return SyncState(feed, newest, synced_at)
+
+    # -- queries ----------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def newest(self) -> float | None:
+        return self._conn.execute("SELECT MAX(published) FROM articles").fetchone()[0]
+
+    def _first_id(self, since: float | None) -> int | None:
+        """Lowest id published since ``since``, to bound full-text scans.
+
+        Articles arrive roughly in publication order, so on a store kept up
+        to date by ``refresh`` a recent window only spans the newest ids.
+        ``+id`` keeps SQLite on the date index instead of walking every row.
+        """
+        return self._conn.execute(
+            "SELECT MIN(+id) FROM articles WHERE published >= ?", (since or 0.0,)
+        ).fetchone()[0]
+
+    def search(self, query: str, since: float | None = None, limit: int = 10) -> list[Hit]:
+        """Articles matching any word of ``query``, best BM25 score first."""
+        expression = match_expression(_TOKEN.findall(query))
+        first = self._first_id(since)
+        if not expression or first is None:
+            return []
+        weights = ", ".join(str(w) for w in BM25_WEIGHTS)
+        rows = self._conn.execute(
+            f"SELECT {_prefixed('a')}, -bm25(articles_fts, {weights}) AS score "
+            "FROM articles_fts JOIN articles AS a ON a.id = articles_fts.rowid "
+            "WHERE articles_fts MATCH ? AND articles_fts.rowid >= ? AND a.published >= ? "
+            "ORDER BY score DESC, a.published DESC LIMIT ?",
+            (expression, first, since or 0.0, limit),
+        )
+        return [Hit(_article(row[:-1]), row[-1]) for row in rows]
+
+    def topic(self, topic: Topic, since: float | None = None, limit: int = 20) -> list[Article]:
+        """Newest articles filed under the topic's categories or mentioning its terms."""
+        first = self._first_id(since)
+        if first is None:
+            return []
+        sql = f"SELECT {_prefixed('a')} FROM articles AS a WHERE a.published >= ?"
+        params: list = [since or 0.0]
+        if not topic.everything:
+            conditions = []
+            if topic.categories:
+                # ``+`` keeps the category index out, so rows come newest first
+                # from the date index and the scan stops at ``limit``.
+                marks = ",".join("?" * len(topic.categories))
+                conditions.append(f"+a.category IN ({marks})")
+                params += topic.categories
+            expression = match_expression(topic.terms)
+            if expression:
+                conditions.append(
+                    "a.id IN (SELECT rowid FROM articles_fts "
+                    "WHERE articles_fts MATCH ? AND rowid >= ?)"
+                )
+                params += [expression, first]
+            sql += f" AND ({' OR '.join(conditions)})"
+        sql += " ORDER BY a.published DESC LIMIT ?"
+        params.append(limit)
+        return [_article(row) for row in self._conn.execute(sql, params)]
+
+    def since(self, since: float) -> list[Article]:
+        """Every article published since ``since``, newest first."""
+        rows = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM articles WHERE published >= ? ORDER BY published DESC",
+            (since,),
+        )
+        return [_article(row) for row in rows]
+
+
+def _row(article: Article) -> tuple:
+    return (
+        article.url,
+        article.link,
+        article.title,
+        article.source,
+        article.category,
+        article.published,
+        article.excerpt,
+        article.status,
+    )
+
+
+def _prefixed(alias: str) -> str:
+    return ", ".join(f"{alias}.{name.strip()}" for name in _COLUMNS.split(","))
+
+
+def _article(row: tuple) -> Article:
+    return Article(*row)
@@ -0,0 +1,53 @@
+"""What ``/ai``, ``/backend``, ``/cloud``, ``/frontend`` and ``/tech`` cover.
+
+Each topic mirrors its command's prompt in ``.gemini/commands``. An article
+belongs to a topic if the aggregator filed its blog under one of the
+topic's categories, or if its title or excerpt mentions one of the terms.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class Topic:
+    name: str
+    description: str
+    categories: tuple[str, ...]  # ``feedCategory`` values, compared case-insensitively
+    terms: tuple[str, ...]  # words or phrases matched in the full-text index
+
+    @property
+    def everything(self) -> bool:
+        return not self.categories and not self.terms
+
+
+TOPICS = {
+    "tech": Topic("tech", "Tech news across all categories", (), ()),
+    "ai": Topic(
+        "ai",
+        "AI and machine learning",
+        ("ai", "ai/ml", "machine learning", "ml", "data science"),
+        ("ai", "machine learning", "llm", "llms", "gpt", "agent", "agents", "inference",
+         "embeddings", "neural", "model training", "genai"),
+    ),
+    "backend": Topic(
+        "backend",
+        "Backend engineering: databases, APIs, microservices, distributed systems",
+        ("backend", "databases", "distributed systems"),
+        ("backend", "database", "databases", "postgres", "mysql", "api", "apis", "graphql",
+         "microservices", "distributed systems", "kafka", "queue", "caching", "scalability"),
+    ),
+    "cloud": Topic(
+        "cloud",
+        "Cloud and infrastructure: Kubernetes, AWS, serverless, DevOps",
+        ("cloud", "infrastructure", "devops", "sre"),
+        ("cloud", "kubernetes", "k8s", "aws", "gcp", "azure", "serverless", "devops",
+         "terraform", "docker", "containers", "observability", "infrastructure"),
+    ),
+    "frontend": Topic(
+        "frontend",
+        "Frontend development: React, Vue, performance, UX, build tools",
+        ("frontend", "web", "mobile"),
+        ("frontend", "react", "vue", "svelte", "css", "javascript", "typescript", "browser",
+         "web performance", "ux", "accessibility", "webpack", "vite"),
+    ),
+}
@@ -0,0 +1,45 @@
+"""Synthetic-load benchmarks and per-stage latency metrics for the skills.
+
+``stage`` is the timing hook the command handlers and briefing collectors
+wrap their fetch, filter, extract and serialize steps in. It records into
+log-bucketed ``Histogram``s only while a ``Recorder`` is installed.
+``build`` generates a mailbox, calendar, reminder lists and ledger at scale,
+and ``run`` drives the skills over them for ``main.py bench``, which
+compares throughput and p50/p95/p99 with a stored baseline.
+"""
+
+from assistant.bench.generators import SCALES, Dataset, Scale, build
+from assistant.bench.metrics import (
+    EXTRACT,
+    FETCH,
+    FILTER,
+    SERIALIZE,
+    STAGES,
+    Histogram,
+    MetricsError,
+    Recorder,
+    stage,
+)
+from assistant.bench.suite import BenchError, Change, Result, Workload, compare, run
+
+__all__ = [
+    "BenchError",
+    "Change",
+    "Dataset",
+    "EXTRACT",
+    "FETCH",
+    "FILTER",
+    "Histogram",
+    "MetricsError",
+    "Recorder",
+    "Result",
+    "SCALES",
+    "SERIALIZE",
+    "STAGES",
+    "Scale",
+    "Workload",
+    "build",
+    "compare",
+    "run",
+    "stage",
+]
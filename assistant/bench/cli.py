@@ -0,0 +1,164 @@
+"""``main.py bench``: the synthetic-load suite and the recorded stage metrics."""
+
+import argparse
+import dataclasses
+import json
+import sys
+import tempfile
+
+from assistant.bench import metrics
+from assistant.bench.generators import SCALES, build
+from assistant.bench.suite import (
+    DEFAULT_THRESHOLD,
+    GROUPS,
+    BenchError,
+    compare,
+    default_baseline_path,
+    load_baseline,
+    report,
+    run,
+    save_baseline,
+)
+
+_LABELS = {"opsPerSec": "ops/s", "p50Ms": "p50", "p95Ms": "p95"}
+
+
+def register(subparsers) -> None:
+    parser = subparsers.add_parser(
+        "bench", help="throughput and latency percentiles against a baseline"
+    )
+    parser.add_argument("--scale", choices=SCALES, default="full", help="synthetic data size")
+    parser.add_argument("--messages", type=int, help="mailbox size (default: 50000 at full)")
+    parser.add_argument("--only", nargs="+", choices=GROUPS, default=list(GROUPS))
+    parser.add_argument(
+        "--iterations", type=int, default=20, help="fewest timed calls per workload"
+    )
+    parser.add_argument("--warmup", type=int, default=1, help="untimed calls per workload")
+    parser.add_argument("--baseline", help="baseline JSON (default: in the assistant data dir)")
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="store this run as the new baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="relative change that counts as a regression (default: 0.25)",
+    )
+    parser.add_argument("--json", action="store_true")
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help=f"summarize the stage timings recorded while {metrics.METRICS_ENV}=1, then exit",
+    )
+    parser.set_defaults(handler=_bench)
+
+
+def _bench(args: argparse.Namespace) -> int:
+    if args.metrics:
+        return _metrics(args)
+    scale = SCALES[args.scale]
+    if args.messages:
+        scale = dataclasses.replace(scale, messages=args.messages)
+    with tempfile.TemporaryDirectory(prefix="assistant-bench-") as tmp:
+        if not args.json:
+            print(f"generating {_describe(scale)}...", file=sys.stderr)
+        dataset = build(tmp, scale)
+        try:
+            results = run(dataset, args.only, args.iterations, args.warmup)
+        except BenchError as exc:
+            print(exc, file=sys.stderr)
+            return 1
+    current = report(results, dataset, args.iterations)
+
+    baseline_path = args.baseline or default_baseline_path()
+    try:
+        baseline = load_baseline(baseline_path)
+    except BenchError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    if baseline is not None and baseline.get("scale") != current["scale"]:
+        print(f"baseline {baseline_path} was run at another scale; not compared", file=sys.stderr)
+        baseline = None
+    changes = compare(current, baseline, args.threshold) if baseline is not None else []
+    regressions = [change for change in changes if change.regressed]
+
+    if args.json:
+        result = {"success": True} | current | {
+            "baseline": str(baseline_path) if baseline is not None else None,
+            "changes": [dataclasses.asdict(change) for change in changes],
+            "regressions": [f"{c.workload} {c.metric}" for c in regressions],
+        }
+        print(json.dumps(result, indent=2))
+    else:
+        _print_report(current, changes, baseline is not None)
+    if args.save_baseline:
+        print(f"baseline saved to {save_baseline(current, baseline_path)}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+def _describe(scale) -> str:
+    return (
+        f"{scale.messages:,} messages, {scale.events:,} events + {scale.series:,} series, "
+        f"{scale.tasks:,} tasks, {scale.transactions:,} transactions"
+    )
+
+
+def _print_report(current: dict, changes: list, have_baseline: bool) -> None:
+    setup = ", ".join(f"{name} {seconds:.1f}s" for name, seconds in current["setupSeconds"].items())
+    print(f"setup: {setup}")
+    by_workload: dict[str, list] = {}
+    for change in changes:
+        by_workload.setdefault(change.workload, []).append(change)
+    print(
+        f"{'workload':<18} {'calls':>5} {'ops/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+        "  vs baseline"
+    )
+    for name, row in current["workloads"].items():
+        deltas = " ".join(
+            f"{_LABELS[c.metric]} {c.ratio - 1:+.0%}{'!' if c.regressed else ''}"
+            for c in by_workload.get(name, [])
+        )
+        print(
+            f"{name:<18} {row['calls']:>5} {row['opsPerSec']:>9.1f} {row['p50Ms']:>9.2f} "
+            f"{row['p95Ms']:>9.2f} {row['p99Ms']:>9.2f}  {deltas or '-'}"
+        )
+        for stage, timing in row["stages"].items():
+            print(
+                f"  {stage:<32} {timing['p50Ms']:>9.2f} {timing['p95Ms']:>9.2f} "
+                f"{timing['p99Ms']:>9.2f}"
+            )
+    regressions = [c for c in changes if c.regressed]
+    for c in regressions:
+        print(f"REGRESSION {c.workload} {c.metric}: {c.baseline:g} -> {c.current:g}")
+    if not have_baseline:
+        print("no baseline yet; run with --save-baseline to store one")
+
+
+def _metrics(args: argparse.Namespace) -> int:
+    try:
+        histograms = metrics.load()
+    except metrics.MetricsError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    summary = {
+        skill: {
+            name: stages[name].summary() for name in sorted(stages, key=metrics.stage_key)
+        }
+        for skill, stages in sorted(histograms.items())
+    }
+    if args.json:
+        path = str(metrics.default_metrics_path())
+        print(json.dumps({"success": True, "path": path, "skills": summary}, indent=2))
+        return 0
+    if not summary:
+        print(f"nothing recorded yet; run commands with {metrics.METRICS_ENV}=1")
+        return 0
+    print(f"{'skill / stage':<28} {'calls':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for skill, stages in summary.items():
+        print(skill)
+        for name, timing in stages.items():
+            print(
+                f"  {name:<26} {timing['count']:>7} {timing['p50Ms']:>9.2f} "
+                f"{timing['p95Ms']:>9.2f} {timing['p99Ms']:>9.2f}"
+            )
+    return 0
@@ -0,0 +1,100 @@
+"""Synthetic data sets at the size a heavy user's machine holds.
+
+``build`` writes one of each source the skills read: a Maildir, a calendar
+export with many recurring series, Reminders list exports and a bank CSV
+ledger, using the generators from each engine's own benchmark. It then
+indexes the Maildir and imports the ledger, so that the suite times the
+queries a skill runs and not the one-off first sync.
+"""
+
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+
+from assistant.calendar.benchmark import write_ics
+from assistant.finance.benchmark import write_csv
+from assistant.finance.ingest import import_csv
+from assistant.finance.store import TransactionStore
+from assistant.mail.benchmark import build_maildir
+from assistant.mail.index import MailIndex
+from assistant.mail.ingest import sync
+from assistant.mail.sources import MaildirSource
+from assistant.schedule.benchmark import write_reminders
+
+
+@dataclass(frozen=True, slots=True)
+class Scale:
+    messages: int = 50_000
+    events: int = 3_000
+    series: int = 2_000  # recurring events, on top of ``events``
+    tasks: int = 5_000
+    transactions: int = 200_000
+
+    def as_dict(self) -> dict[str, int]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+SCALES = {
+    "full": Scale(),
+    "small": Scale(messages=2_000, events=300, series=100, tasks=500, transactions=10_000),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Dataset:
+    root: Path
+    scale: Scale
+    day: date
+    maildir: Path
+    mail_index: Path
+    calendar: Path
+    reminders: Path
+    ledger: Path
+    finance_store: Path
+    # Seconds spent writing and indexing each source.
+    setup: dict[str, float] = field(default_factory=dict)
+
+
+def build(root: str | Path, scale: Scale = Scale(), now: datetime | None = None) -> Dataset:
+    """Generate every source under ``root``, centred on ``now``."""
+    root = Path(root)
+    now = now or datetime.now().astimezone()
+    root.mkdir(parents=True, exist_ok=True)
+    setup = {}
+
+    started = time.perf_counter()
+    maildir = build_maildir(root / "Maildir", scale.messages, int(now.timestamp()))
+    mail_index = root / "mail.sqlite3"
+    with MailIndex(mail_index) as index:
+        sync(index, MaildirSource(maildir))
+    setup["mailbox"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    calendar = write_ics(root / "calendar.ics", scale.events, scale.series, now)
+    setup["calendar"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    reminders = root / "reminders"
+    reminders.mkdir(exist_ok=True)
+    write_reminders(reminders, scale.tasks, now.date())
+    setup["reminders"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    ledger = write_csv(root / "ledger.csv", scale.transactions)
+    finance_store = root / "finance"
+    import_csv(TransactionStore(finance_store), ledger)
+    setup["ledger"] = time.perf_counter() - started
+
+    return Dataset(
+        root,
+        scale,
+        now.date(),
+        maildir,
+        mail_index,
+        calendar,
+        reminders,
+        ledger,
+        finance_store,
+        setup,
+    )
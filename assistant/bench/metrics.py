@@ -0,0 +1,253 @@
+"""Per-stage latency histograms for skill and collector invocations.
+
+A handler wraps each step of its work in ``stage(skill, name)``: fetching
+from a store, filtering or ranking, extracting skill records, serializing
+the reply. Nothing is recorded unless a ``Recorder`` is installed, which
+``main.py`` does when ``ASSISTANT_METRICS`` is set; the timings are then
+merged into ``metrics.json`` in the data dir when the command exits.
+
+Latencies go into log-spaced histogram buckets, so the file stays the same
+size however many calls it has seen and percentiles are read back to
+within half a bucket (about 4%).
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from assistant.paths import data_dir
+
+FETCH, FILTER, EXTRACT, SERIALIZE = "fetch", "filter", "extract", "serialize"
+STAGES = (FETCH, FILTER, EXTRACT, SERIALIZE)
+METRICS_ENV = "ASSISTANT_METRICS"
+FORMAT_VERSION = 1
+
+# Bucket i holds latencies in [FLOOR * GROWTH**i, FLOOR * GROWTH**(i + 1)).
+FLOOR = 1e-6
+GROWTH = 1.08
+_LOG_GROWTH = math.log(GROWTH)
+
+
+class MetricsError(RuntimeError):
+    """A metrics file that cannot be read back."""
+
+
+def default_metrics_path() -> Path:
+    return data_dir() / "metrics.json"
+
+
+def stage_key(name: str) -> tuple[int, str]:
+    """Sort key putting the known stages first, in pipeline order."""
+    return (STAGES.index(name) if name in STAGES else len(STAGES), name)
+
+
+@dataclass(slots=True)
+class Histogram:
+    """Latency counts in log-spaced buckets, plus exact count, sum, min and max."""
+
+    buckets: dict[int, int] = field(default_factory=dict)
+    count: int = 0
+    total: float = 0.0
+    low: float = math.inf
+    high: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        index = max(0, int(math.log(max(seconds, FLOOR) / FLOOR) / _LOG_GROWTH))
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.low = min(self.low, seconds)
+        self.high = max(self.high, seconds)
+
+    def merge(self, other: "Histogram") -> None:
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.low = min(self.low, other.low)
+        self.high = max(self.high, other.high)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Nearest-rank percentile ``q`` (0-100), from the middle of its bucket."""
+        if not self.count:
+            return 0.0
+        target = max(1, math.ceil(q / 100 * self.count))
+        if target >= self.count:
+            return self.high
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= target:
+                middle = FLOOR * GROWTH ** (index + 0.5)
+                return min(max(middle, self.low), self.high)
+        return self.high
+
+    def summary(self) -> dict:
+        """Count and mean/p50/p95/p99/max in milliseconds."""
+        return {
+            "count": self.count,
+            "meanMs": round(self.mean * 1000, 3),
+            "p50Ms": round(self.percentile(50) * 1000, 3),
+            "p95Ms": round(self.percentile(95) * 1000, 3),
+            "p99Ms": round(self.percentile(99) * 1000, 3),
+            "maxMs": round(self.high * 1000, 3),
+        }
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.low if self.count else None,
+            "max": self.high,
+            "buckets": {str(index): count for index, count in sorted(self.buckets.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Histogram":
+        return cls(
+            {int(index): count for index, count in data["buckets"].items()},
+            data["count"],
+            data["sum"],
+            math.inf if data["min"] is None else data["min"],
+            data["max"],
+        )
+
+
+Histograms = dict[str, dict[str, Histogram]]  # skill -> stage -> histogram
+
+
+class Recorder:
+    """Histograms per (skill, stage), safe to feed from collector threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: Histograms = {}
+
+    def record(self, skill: str, stage: str, seconds: float) -> None:
+        with self._lock:
+            stages = self._histograms.setdefault(skill, {})
+            stages.setdefault(stage, Histogram()).add(seconds)
+
+    def snapshot(self) -> Histograms:
+        """A copy of everything recorded so far."""
+        with self._lock:
+            return {
+                skill: {name: _copy(histogram) for name, histogram in stages.items()}
+                for skill, stages in self._histograms.items()
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._histograms = {}
+
+    def flush(self, path: str | Path | None = None) -> Path:
+        """Merge the recorded timings into ``path`` and start over.
+
+        The file is rewritten through a temporary file and ``os.replace``,
+        so a reader never sees half of it. Two commands exiting at the same
+        moment can still lose one's timings to the other.
+        """
+        path = Path(path) if path else default_metrics_path()
+        with self._lock:
+            recorded, self._histograms = self._histograms, {}
+        merged = load(path)
+        for skill, stages in recorded.items():
+            for name, histogram in stages.items():
+                merged.setdefault(skill, {}).setdefault(name, Histogram()).merge(histogram)
+        save(merged, path)
+        return path
+
+
+def _copy(histogram: Histogram) -> Histogram:
+    return Histogram(
+        dict(histogram.buckets), histogram.count, histogram.total, histogram.low, histogram.high
+    )
+
+
+def load(path: str | Path | None = None) -> Histograms:
+    """The histograms in a metrics file; empty if there is no file yet."""
+    path = Path(path) if path else default_metrics_path()
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        raise MetricsError(f"cannot read metrics file {path}: {exc}") from exc
+    if data.get("version") != FORMAT_VERSION:
+        raise MetricsError(f"{path} has metrics format {data.get('version')!r}")
+    return {
+        skill: {name: Histogram.from_dict(entry) for name, entry in stages.items()}
+        for skill, stages in data["skills"].items()
+    }
+
+
+def save(histograms: Histograms, path: str | Path | None = None) -> Path:
+    path = Path(path) if path else default_metrics_path()
+    data = {
+        "version": FORMAT_VERSION,
+        "updatedAt": time.time(),
+        "skills": {
+            skill: {name: stages[name].as_dict() for name in sorted(stages, key=stage_key)}
+            for skill, stages in sorted(histograms.items())
+        },
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    scratch = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    scratch.write_text(json.dumps(data, indent=1), encoding="utf-8")
+    os.replace(scratch, path)
+    return path
+
+
+# -- the process-wide hook ---------------------------------------------------
+
+# A module global rather than a ContextVar: FunctionCollector runs skills on
+# plain threads, which do not inherit the caller's context.
+_recorder: Recorder | None = None
+_NOT_RECORDING = nullcontext()
+
+
+def install(recorder: Recorder | None) -> Recorder | None:
+    """Make ``recorder`` receive every stage timing; returns the previous one."""
+    global _recorder
+    previous, _recorder = _recorder, recorder
+    return previous
+
+
+def active() -> Recorder | None:
+    return _recorder
+
+
+def enabled_by_env() -> bool:
+    return os.environ.get(METRICS_ENV, "") not in ("", "0")
+
+
+class _Timer:
+    __slots__ = ("recorder", "skill", "stage", "started")
+
+    def __init__(self, recorder: Recorder, skill: str, stage: str) -> None:
+        self.recorder = recorder
+        self.skill = skill
+        self.stage = stage
+
+    def __enter__(self) -> None:
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self.recorder.record(self.skill, self.stage, time.perf_counter() - self.started)
+
+
+def stage(skill: str, name: str) -> _Timer | nullcontext:
+    """Time the ``with`` body as stage ``name`` of ``skill``, if recording."""
+    recorder = _recorder
+    if recorder is None:
+        return _NOT_RECORDING
+    return _Timer(recorder, skill, name)
@@ -0,0 +1,282 @@
+"""Run the skills against a synthetic data set and compare with a baseline.
+
+Each workload is one ``main.py`` command, the one a skill or the local
+briefing runs. It is parsed once and its handler called repeatedly with
+stdout captured, while a fresh ``Recorder`` collects the handler's own
+stage timings. A result holds the throughput and end-to-end latency
+percentiles, plus the percentiles of each stage.
+"""
+
+import io
+import json
+import time
+from collections.abc import Iterable
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+
+from assistant.bench import metrics
+from assistant.bench.generators import Dataset
+from assistant.bench.metrics import Histogram, Recorder
+from assistant.paths import data_dir
+
+GROUPS = ("inbox", "calendar", "tasks", "finance")
+DEFAULT_THRESHOLD = 0.25
+# Fast workloads keep going past ``iterations`` until this much time has
+# passed (up to MAX_CALLS), so their p95 and p99 rest on hundreds of calls.
+MIN_SECONDS = 1.0
+MAX_CALLS = 2_000
+# Slowdowns smaller than this per call are scheduler noise, not regressions.
+NOISE_FLOOR_MS = 1.0
+# Compared with the baseline: metric name and whether a larger value is worse.
+# p99 is reported but not judged; with tens of calls it is the slowest call.
+WATCHED = (("opsPerSec", False), ("p50Ms", True), ("p95Ms", True))
+
+
+class BenchError(RuntimeError):
+    """A workload command that failed, or a baseline that cannot be used."""
+
+
+def default_baseline_path() -> Path:
+    return data_dir() / "bench-baseline.json"
+
+
+@dataclass(frozen=True, slots=True)
+class Workload:
+    name: str
+    group: str
+    skill: str  # the name its handler records stages under
+    argv: tuple[str, ...]
+
+
+def workloads(dataset: Dataset) -> list[Workload]:
+    day = dataset.day
+    week_end = (day + timedelta(days=6)).isoformat()
+    index = str(dataset.mail_index)
+    cache = str(dataset.root / "ics-cache")
+    return [
+        Workload("inbox.counts", "inbox", "mail.counts", ("mail", "--index", index, "counts")),
+        Workload("inbox.triage", "inbox", "mail.triage", ("mail", "--index", index, "triage")),
+        Workload(
+            "calendar.week",
+            "calendar",
+            "calendar.events",
+            (
+                "calendar",
+                "--ics",
+                str(dataset.calendar),
+                "--cache",
+                cache,
+                "events",
+                day.isoformat(),
+                week_end,
+            ),
+        ),
+        Workload(
+            "tasks.list",
+            "tasks",
+            "schedule.tasks",
+            (
+                "schedule",
+                "--reminders",
+                str(dataset.reminders),
+                "--cache",
+                cache,
+                "tasks",
+                "--date",
+                str(day),
+            ),
+        ),
+        Workload(
+            "tasks.plan",
+            "tasks",
+            "schedule.plan",
+            (
+                "schedule",
+                "--ics",
+                str(dataset.calendar),
+                "--reminders",
+                str(dataset.reminders),
+                "--cache",
+                cache,
+                "plan",
+                "--date",
+                str(day),
+                "--json",
+            ),
+        ),
+        Workload(
+            "finance.expenses",
+            "finance",
+            "finance.analyze",
+            (
+                "finance",
+                "--store",
+                str(dataset.finance_store),
+                "analyze",
+                "--type",
+                "expenses",
+                "--period",
+                "2024",
+            ),
+        ),
+    ]
+
+
+@dataclass(slots=True)
+class Result:
+    workload: Workload
+    seconds: float  # wall time of the measured calls
+    latency: Histogram
+    stages: dict[str, Histogram]
+    output_bytes: int
+
+    @property
+    def ops_per_s(self) -> float:
+        return self.latency.count / self.seconds if self.seconds else 0.0
+
+    def summary(self) -> dict:
+        return {
+            "group": self.workload.group,
+            "calls": self.latency.count,
+            "opsPerSec": round(self.ops_per_s, 2),
+            "outputBytes": self.output_bytes,
+            **{key: value for key, value in self.latency.summary().items() if key != "count"},
+            "stages": {
+                name: histogram.summary()
+                for name, histogram in sorted(
+                    self.stages.items(), key=lambda item: metrics.stage_key(item[0])
+                )
+            },
+        }
+
+
+def measure(
+    workload: Workload,
+    iterations: int = 20,
+    warmup: int = 1,
+    min_seconds: float = MIN_SECONDS,
+) -> Result:
+    """Call ``workload``'s handler ``warmup`` times untimed, then time it.
+
+    The timed calls stop after ``iterations`` once ``min_seconds`` have
+    passed, or at ``MAX_CALLS``.
+    """
+    from assistant.cli import build_parser  # assistant.cli registers ``bench`` from this package
+
+    args = build_parser().parse_args(list(workload.argv))
+    recorder = Recorder()
+    previous = metrics.install(recorder)
+    try:
+        for _ in range(warmup):
+            _call(workload, args)
+        recorder.clear()
+        latency = Histogram()
+        output = 0
+        started = call_started = time.perf_counter()
+        while latency.count < MAX_CALLS and (
+            latency.count < iterations or call_started - started < min_seconds
+        ):
+            output = _call(workload, args)
+            finished = time.perf_counter()
+            latency.add(finished - call_started)
+            call_started = finished
+        seconds = time.perf_counter() - started
+    finally:
+        metrics.install(previous)
+    stages = recorder.snapshot().get(workload.skill, {})
+    return Result(workload, seconds, latency, stages, output)
+
+
+def _call(workload: Workload, args) -> int:
+    with redirect_stdout(io.StringIO()) as out:
+        status = args.handler(args)
+    if status:
+        raise BenchError(f"{workload.name}: `{' '.join(workload.argv)}` exited with {status}")
+    return len(out.getvalue().encode())
+
+
+def run(
+    dataset: Dataset,
+    groups: Iterable[str] = GROUPS,
+    iterations: int = 20,
+    warmup: int = 1,
+    min_seconds: float = MIN_SECONDS,
+) -> list[Result]:
+    groups = set(groups)
+    return [
+        measure(workload, iterations, warmup, min_seconds)
+        for workload in workloads(dataset)
+        if workload.group in groups
+    ]
+
+
+# -- baseline ----------------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class Change:
+    workload: str
+    metric: str
+    baseline: float
+    current: float
+    regressed: bool
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def report(results: Iterable[Result], dataset: Dataset, iterations: int) -> dict:
+    return {
+        "createdAt": time.time(),
+        "scale": dataset.scale.as_dict(),
+        "iterations": iterations,
+        "setupSeconds": {name: round(seconds, 3) for name, seconds in dataset.setup.items()},
+        "workloads": {result.workload.name: result.summary() for result in results},
+    }
+
+
+def compare(
+    current: dict,
+    baseline: dict,
+    threshold: float = DEFAULT_THRESHOLD,
+    floor_ms: float = NOISE_FLOOR_MS,
+) -> list[Change]:
+    """Watched metrics of the workloads in both reports.
+
+    A metric regresses when it is more than ``threshold`` worse than the
+    baseline and that costs each call more than ``floor_ms``.
+    """
+    changes = []
+    for name, now in current["workloads"].items():
+        before = baseline["workloads"].get(name)
+        if before is None:
+            continue
+        for metric, larger_is_worse in WATCHED:
+            old, new = before[metric], now[metric]
+            if larger_is_worse:
+                worse, slower_ms = new > old * (1 + threshold), new - old
+            else:
+                worse = new * (1 + threshold) < old
+                slower_ms = 1000 / new - 1000 / old if new and old else float("inf")
+            changes.append(Change(name, metric, old, new, worse and slower_ms > floor_ms))
+    return changes
+
+
+def load_baseline(path: str | Path) -> dict | None:
+    path = Path(path)
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except ValueError as exc:
+        raise BenchError(f"cannot read baseline {path}: {exc}") from exc
+
+
+def save_baseline(current: dict, path: str | Path) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(current, indent=2), encoding="utf-8")
+    return path
@@ -0,0 +1,39 @@
+"""Morning briefing orchestrator.
+
+Collectors (calendar, inbox, tasks) run concurrently, each under its own
+deadline, and sections stream out as soon as they are ready. A source that
+times out or fails is replaced by its last cached result, marked stale.
+"""
+
+from assistant.briefing.cache import CachedResult, ResultCache
+from assistant.briefing.collectors import (
+    Collector,
+    CollectorError,
+    FunctionCollector,
+    SubprocessCollector,
+)
+from assistant.briefing.orchestrator import (
+    FAILED,
+    FRESH,
+    STALE,
+    BriefingStats,
+    Section,
+    collect_briefing,
+    stream_briefing,
+)
+
+__all__ = [
+    "FAILED",
+    "FRESH",
+    "STALE",
+    "BriefingStats",
+    "CachedResult",
+    "Collector",
+    "CollectorError",
+    "FunctionCollector",
+    "ResultCache",
+    "Section",
+    "SubprocessCollector",
+    "collect_briefing",
+    "stream_briefing",
+]
@@ -0,0 +1,91 @@
+"""Benchmark: time to first section and total wall time of a briefing.
+
+Stub collectors stand in for the real sources: a fast one, a slow one, one
+that hangs past its deadline and one that fails. The orchestrated run is
+compared with running the same collectors one after another without
+deadlines, which is what a briefing that waits for every source does.
+"""
+
+import asyncio
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from assistant.briefing.cache import ResultCache
+from assistant.briefing.orchestrator import BriefingStats, collect_briefing
+
+
+@dataclass(slots=True)
+class StubCollector:
+    """Answers after ``delay`` seconds, or raises if ``fail`` is set."""
+
+    name: str
+    delay: float
+    timeout: float = 1.0
+    fail: bool = False
+    title: str = ""
+
+    def __post_init__(self) -> None:
+        self.title = self.title or self.name.upper()
+
+    async def collect(self) -> str:
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(f"{self.name} unavailable")
+        return f"{self.name} content"
+
+
+def stubs(hang: float = 5.0) -> list[StubCollector]:
+    return [
+        StubCollector("calendar", 0.05),
+        StubCollector("inbox", 0.4),
+        StubCollector("tasks", hang, timeout=0.5),
+        StubCollector("news", 0.1, fail=True),
+    ]
+
+
+async def _sequential(collectors: list[StubCollector]) -> tuple[float, float]:
+    started = time.perf_counter()
+    first = None
+    for collector in collectors:
+        try:
+            await collector.collect()
+        except RuntimeError:
+            pass
+        first = first if first is not None else time.perf_counter() - started
+    return first or 0.0, time.perf_counter() - started
+
+
+def run(hang: float = 5.0) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResultCache(Path(tmp) / "cache.json")
+        for collector in stubs(hang):
+            cache.put(collector.name, f"cached {collector.name}", time.time() - 3600)
+        started = time.perf_counter()
+        sections = asyncio.run(collect_briefing(stubs(hang), cache))
+        wall = time.perf_counter() - started
+    stats = BriefingStats.from_sections(sections)
+    seq_first, seq_total = asyncio.run(_sequential(stubs(hang)))
+    return {
+        "first_section_s": stats.first_section_s,
+        "total_s": wall,
+        "stale": stats.stale,
+        "sequential_first_section_s": seq_first,
+        "sequential_total_s": seq_total,
+    }
+
+
+def main(hang: float = 5.0) -> None:
+    row = run(hang)
+    print(f"{'':24}{'first section':>15}{'total':>10}")
+    print(f"{'orchestrated':24}{row['first_section_s']:>14.3f}s{row['total_s']:>9.3f}s")
+    print(
+        f"{'sequential, no deadline':24}"
+        f"{row['sequential_first_section_s']:>14.3f}s{row['sequential_total_s']:>9.3f}s"
+    )
+    print(f"stale sections served from cache: {', '.join(row['stale'])}")
+
+
+if __name__ == "__main__":
+    main()
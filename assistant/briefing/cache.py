@@ -0,0 +1,52 @@
+"""Last good result per briefing source, used when a source misses its deadline."""
+
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from assistant.paths import data_dir
+
+
+def default_cache_path() -> Path:
+    return data_dir() / "briefing-cache.json"
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResult:
+    content: str
+    collected_at: float
+
+
+class ResultCache:
+    """JSON file mapping source name -> last successful content."""
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path) if path is not None else default_cache_path()
+        try:
+            raw = json.loads(self.path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            raw = {}
+        self._entries = {
+            name: CachedResult(entry["content"], entry["collected_at"]) for name, entry in raw.items()
+        }
+
+    def get(self, name: str) -> CachedResult | None:
+        return self._entries.get(name)
+
+    def put(self, name: str, content: str, collected_at: float | None = None) -> None:
+        self._entries[name] = CachedResult(content, time.time() if collected_at is None else collected_at)
+        self._write()
+
+    def _write(self) -> None:
+        payload = {
+            name: {"content": entry.content, "collected_at": entry.collected_at}
+            for name, entry in self._entries.items()
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".briefing-cache-")
+        with os.fdopen(fd, "w") as fh:
+            json.dump(payload, fh)
+        os.replace(tmp, self.path)
@@ -0,0 +1,62 @@
+"""``main.py briefing``: stream the morning briefing section by section."""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from assistant.briefing import benchmark
+from assistant.briefing.cache import ResultCache
+from assistant.briefing.orchestrator import BriefingStats, stream_briefing
+from assistant.briefing.sources import default_collectors
+
+
+def _timeout(value: str) -> tuple[str, float]:
+    name, sep, seconds = value.partition("=")
+    try:
+        if not sep:
+            raise ValueError
+        return name, float(seconds)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected NAME=SECONDS, got {value!r}") from None
+
+
+def register(subparsers) -> None:
+    parser = subparsers.add_parser("briefing", help="morning briefing with per-source deadlines")
+    parser.add_argument(
+        "--local", action="store_true", help="read calendar and inbox from the Python indexes"
+    )
+    parser.add_argument("--json", action="store_true", help="emit one JSON object per section")
+    parser.add_argument(
+        "--timeout", type=_timeout, action="append", default=[], metavar="NAME=SECONDS"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="do not fall back to cached results")
+    parser.add_argument("--bench", action="store_true", help="run the stub-collector benchmark")
+    parser.set_defaults(handler=_briefing)
+
+
+def _briefing(args: argparse.Namespace) -> int:
+    if args.bench:
+        benchmark.main()
+        return 0
+    collectors = default_collectors(local=args.local)
+    overrides = dict(args.timeout)
+    for collector in collectors:
+        collector.timeout = overrides.get(collector.name, collector.timeout)
+    cache = None if args.no_cache else ResultCache()
+    sections = asyncio.run(_stream(collectors, cache, args.json))
+    stats = BriefingStats.from_sections(sections)
+    print(
+        f"first section {stats.first_section_s:.2f}s, total {stats.total_s:.2f}s",
+        file=sys.stderr,
+    )
+    return 0 if len(stats.failed) < len(sections) else 1
+
+
+async def _stream(collectors, cache, as_json: bool):
+    sections = []
+    async for section in stream_briefing(collectors, cache):
+        sections.append(section)
+        print(json.dumps(section.as_dict(), ensure_ascii=False) if as_json else section.render() + "\n")
+        sys.stdout.flush()
+    return sections
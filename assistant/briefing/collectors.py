@@ -0,0 +1,96 @@
+"""Briefing collectors: one data source each, run as a subprocess or in-process."""
+
+import asyncio
+import inspect
+import threading
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Protocol
+
+
+class CollectorError(RuntimeError):
+    """A collector ran but did not produce usable output."""
+
+
+class Collector(Protocol):
+    name: str
+    title: str
+    timeout: float
+
+    async def collect(self) -> str: ...
+
+
+@dataclass(slots=True)
+class SubprocessCollector:
+    """Run a command and use its stdout as the section content.
+
+    The process is killed when the orchestrator's deadline cancels it.
+    """
+
+    name: str
+    title: str
+    argv: tuple[str, ...]
+    timeout: float = 30.0
+    cwd: str | None = None
+
+    async def collect(self) -> str:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *self.argv,
+                cwd=self.cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError as exc:
+            raise CollectorError(f"{self.argv[0]} not found") from exc
+        try:
+            stdout, stderr = await proc.communicate()
+        except asyncio.CancelledError:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            raise
+        if proc.returncode != 0:
+            detail = stderr.decode(errors="replace").strip() or f"exit status {proc.returncode}"
+            raise CollectorError(detail)
+        return stdout.decode(errors="replace").strip()
+
+
+@dataclass(slots=True)
+class FunctionCollector:
+    """Call a Python function (sync or async) in-process.
+
+    Sync functions run on a daemon thread so a hung call cannot keep the
+    process alive after its deadline has passed; the thread is abandoned,
+    not killed.
+    """
+
+    name: str
+    title: str
+    func: Callable[[], str] | Callable[[], Awaitable[str]]
+    timeout: float = 10.0
+
+    async def collect(self) -> str:
+        if inspect.iscoroutinefunction(self.func):
+            return await self.func()
+        return await _in_daemon_thread(self.func)
+
+
+def _in_daemon_thread(func: Callable[[], str]) -> "asyncio.Future[str]":
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[str] = loop.create_future()
+
+    def deliver(setter, value) -> None:
+        if not future.done():
+            setter(value)
+
+    def target() -> None:
+        try:
+            result = func()
+        except BaseException as exc:  # noqa: BLE001 - handed to the awaiting task
+            loop.call_soon_threadsafe(deliver, future.set_exception, exc)
+        else:
+            loop.call_soon_threadsafe(deliver, future.set_result, result)
+
+    threading.Thread(target=target, name="collector", daemon=True).start()
+    return future
@@ -0,0 +1,125 @@
+"""Fan out briefing collectors and stream sections as they finish."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+
+from assistant.bench.metrics import FETCH, stage
+from assistant.briefing.cache import ResultCache
+from assistant.briefing.collectors import Collector
+
+FRESH, STALE, FAILED = "fresh", "stale", "failed"
+
+
+@dataclass(frozen=True, slots=True)
+class Section:
+    """One finished briefing section.
+
+    ``status`` is ``fresh`` when the collector answered in time, ``stale``
+    when the last cached result stands in for it, and ``failed`` when there
+    was nothing to fall back to. ``elapsed`` is measured from the start of
+    the briefing.
+    """
+
+    name: str
+    title: str
+    content: str
+    status: str
+    elapsed: float
+    collected_at: float | None = None
+    error: str | None = None
+
+    def render(self) -> str:
+        heading = f"## {self.title}"
+        if self.status == FAILED:
+            return f"{heading} (unavailable: {self.error})"
+        if self.status == STALE:
+            when = datetime.fromtimestamp(self.collected_at).strftime("%Y-%m-%d %H:%M")
+            heading += f" (stale: cached {when}; {self.error})"
+        return f"{heading}\n\n{self.content}"
+
+    def as_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "title": self.title,
+            "status": self.status,
+            "elapsed": round(self.elapsed, 3),
+            "collectedAt": self.collected_at,
+            "error": self.error,
+            "content": self.content,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class BriefingStats:
+    first_section_s: float
+    total_s: float
+    stale: tuple[str, ...]
+    failed: tuple[str, ...]
+
+    @classmethod
+    def from_sections(cls, sections: Sequence[Section]) -> "BriefingStats":
+        return cls(
+            first_section_s=min((s.elapsed for s in sections), default=0.0),
+            total_s=max((s.elapsed for s in sections), default=0.0),
+            stale=tuple(s.name for s in sections if s.status == STALE),
+            failed=tuple(s.name for s in sections if s.status == FAILED),
+        )
+
+
+async def _run(collector: Collector, cache: ResultCache | None, started: float) -> Section:
+    try:
+        with stage(f"briefing.{collector.name}", FETCH):
+            content = await asyncio.wait_for(collector.collect(), collector.timeout)
+    except TimeoutError:
+        error = f"timed out after {collector.timeout:g}s"
+    except Exception as exc:  # noqa: BLE001 - any collector failure falls back to cache
+        error = str(exc) or type(exc).__name__
+    else:
+        collected_at = time.time()
+        if cache is not None:
+            cache.put(collector.name, content, collected_at)
+        return Section(
+            collector.name,
+            collector.title,
+            content,
+            FRESH,
+            time.perf_counter() - started,
+            collected_at,
+        )
+
+    cached = cache.get(collector.name) if cache is not None else None
+    elapsed = time.perf_counter() - started
+    if cached is None:
+        return Section(collector.name, collector.title, "", FAILED, elapsed, error=error)
+    return Section(
+        collector.name, collector.title, cached.content, STALE, elapsed, cached.collected_at, error
+    )
+
+
+async def stream_briefing(
+    collectors: Sequence[Collector], cache: ResultCache | None = None
+) -> AsyncIterator[Section]:
+    """Start every collector at once and yield sections in completion order.
+
+    Each collector is bounded by its own ``timeout``, so the briefing never
+    waits longer than the slowest deadline. If the consumer stops early the
+    remaining collectors are cancelled.
+    """
+    started = time.perf_counter()
+    tasks = [asyncio.create_task(_run(c, cache, started), name=c.name) for c in collectors]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            yield await finished
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def collect_briefing(
+    collectors: Sequence[Collector], cache: ResultCache | None = None
+) -> list[Section]:
+    return [section async for section in stream_briefing(collectors, cache)]
@@ -0,0 +1,106 @@
+"""The collectors behind the morning briefing."""
+
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from assistant.briefing.collectors import Collector, FunctionCollector, SubprocessCollector
+from assistant.calendar.cache import ParsedCache
+from assistant.calendar.store import CalendarStore, default_calendar_dir
+from assistant.mail.index import MailIndex
+from assistant.schedule.planner import WorkDay, day_events, plan_day
+from assistant.schedule.tasks import TaskStore, default_reminders_dir
+from assistant.triage.scorer import TriageScorer
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCRIPTS = REPO_ROOT / ".gemini" / "scripts"
+
+
+def _today() -> tuple[datetime, datetime]:
+    start = datetime.now().astimezone().replace(hour=0, minute=0, second=0, microsecond=0)
+    return start, start + timedelta(days=1)
+
+
+def local_calendar() -> str:
+    """Today's events from the indexed .ics store."""
+    events = CalendarStore([default_calendar_dir()], ParsedCache()).between(*_today())
+    if not events:
+        return "No events today."
+    lines = []
+    for occ in events:
+        when = "all day" if occ.all_day else f"{occ.start:%H:%M}-{occ.end:%H:%M}"
+        where = f" ({occ.location})" if occ.location else ""
+        lines.append(f"- {when} {occ.summary}{where} [{occ.calendar}]")
+    return "\n".join(lines)
+
+
+def local_inbox(hours: int = 24, top: int = 10) -> str:
+    """Counts and the top-ranked unread mail from the mail index."""
+    since = time.time() - hours * 3600
+    with MailIndex() as index:
+        counts = index.counts(since)
+        unread = index.unread(since)
+    lines = [
+        f"{counts.unread} unread, {counts.actionable} actionable, {counts.flagged} flagged ({hours}h)"
+    ]
+    for msg, result in TriageScorer().rank(unread, top=top):
+        lines.append(f"- [{result.score}] {result.label}: {msg.subject} - {msg.sender}")
+    return "\n".join(lines)
+
+
+def local_tasks(top: int = 5) -> str:
+    """Bucket counts and the most important overdue and today's reminders."""
+    store = TaskStore(paths=[default_reminders_dir()], cache=ParsedCache())
+    counts = store.counts()
+    lines = [
+        f"{len(store)} incomplete: {counts['overdue']} overdue, {counts['today']} today, "
+        f"{counts['upcoming']} upcoming"
+    ]
+    for label, tasks in (("overdue", store.overdue(top)), ("today", store.today(top))):
+        lines += [f"- [{label}] {task.title} ({task.list_name})" for task in tasks]
+    return "\n".join(lines)
+
+
+def local_schedule() -> str:
+    """RECOMMENDED SCHEDULE and FOCUS FOR TODAY, packed from tasks and events."""
+    workday = WorkDay(datetime.now().date())
+    cache = ParsedCache()
+    events = day_events(CalendarStore([default_calendar_dir()], cache), workday.day)
+    plan = plan_day(TaskStore(paths=[default_reminders_dir()], cache=cache), events, workday)
+    return plan.render(heading=False)
+
+
+def default_collectors(local: bool = False) -> list[Collector]:
+    """Calendar, inbox and tasks, in the order morning.toml presents them.
+
+    With ``local`` the calendar, inbox and reminders come from the Python
+    indexes instead of icalBuddy, Mail.app and Reminders, and a computed
+    schedule section is added.
+    """
+    today = datetime.now().strftime("%Y-%m-%d")
+    if local:
+        calendar: Collector = FunctionCollector("calendar", "📅 CALENDAR", local_calendar, 10)
+        inbox: Collector = FunctionCollector("inbox", "📬 INBOX", local_inbox, 10)
+        tasks: Collector = FunctionCollector("tasks", "✅ TASKS", local_tasks, 10)
+    else:
+        calendar = SubprocessCollector(
+            "calendar",
+            "📅 CALENDAR",
+            (
+                "icalBuddy", "-n", "-iep", "title,datetime,location", "-df", "%Y-%m-%d",
+                "-tf", "%H:%M", f"eventsFrom:{today}", f"to:{today}",
+            ),
+            timeout=15,
+        )
+        inbox = SubprocessCollector(
+            "inbox", "📬 INBOX", ("osascript", str(SCRIPTS / "scan_inbox.scpt"), "24", "false"), 60
+        )
+        tasks = SubprocessCollector(
+            "tasks", "✅ TASKS", ("osascript", str(SCRIPTS / "list_tasks.scpt")), timeout=30
+        )
+    collectors = [calendar, inbox, tasks]
+    if local:
+        collectors.append(
+            FunctionCollector("schedule", "⏰ RECOMMENDED SCHEDULE", local_schedule, 10)
+        )
+    return collectors
@@ -0,0 +1,23 @@
+"""Calendar engine: .ics exports behind an interval-tree index.
+
+``CalendarStore`` loads calendar exports, indexes every event and recurring
+series by the time span it covers, and expands RRULEs lazily for just the
+queried window, replacing the linear scans in ``read_events.scpt``.
+"""
+
+from assistant.calendar.cache import ParsedCache
+from assistant.calendar.ics import ICSError
+from assistant.calendar.rrule import RRule, RRuleError
+from assistant.calendar.store import CalendarStore, Event, Occurrence
+from assistant.calendar.tree import IntervalTree
+
+__all__ = [
+    "CalendarStore",
+    "Event",
+    "ICSError",
+    "IntervalTree",
+    "Occurrence",
+    "ParsedCache",
+    "RRule",
+    "RRuleError",
+]
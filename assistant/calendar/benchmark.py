@@ -0,0 +1,122 @@
+"""Benchmark: range queries over a large calendar export.
+
+Generates an .ics file with thousands of single events and recurring series
+(weekly BYDAY, daily INTERVAL, monthly ordinal weekdays, yearly, with COUNT,
+UNTIL and EXDATE), then times loading, a year-long query (cold and cached),
+a one-week query, and the same year query done as a linear scan that
+expands every series from its first instance.
+"""
+
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from assistant.calendar.store import CalendarStore
+
+RULES = (
+    "FREQ=WEEKLY;BYDAY=MO,WE,FR",
+    "FREQ=WEEKLY;INTERVAL=2;BYDAY=TU",
+    "FREQ=DAILY;INTERVAL=3",
+    "FREQ=MONTHLY;BYDAY=-1FR",
+    "FREQ=MONTHLY;BYMONTHDAY=15;COUNT=24",
+    "FREQ=YEARLY;BYMONTH=3;BYDAY=2SU",
+    "FREQ=WEEKLY;BYDAY=TH;UNTIL=20271231T000000Z",
+)
+
+
+def _stamp(moment: datetime) -> str:
+    return moment.strftime("%Y%m%dT%H%M%S")
+
+
+def write_ics(path: Path, events: int, series: int, origin: datetime, seed: int = 11) -> Path:
+    """Write a VCALENDAR with ``events`` single events and ``series`` recurring ones."""
+    rng = random.Random(seed)
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "X-WR-CALNAME:Bench"]
+    for i in range(events + series):
+        # Series typically started long ago; single events cluster near now.
+        days = rng.randrange(-5 * 365, 0) if i >= events else rng.randrange(-365, 730)
+        start = origin + timedelta(days=days, hours=rng.randrange(7, 19))
+        end = start + timedelta(minutes=rng.choice((30, 45, 60, 90)))
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:bench-{i}",
+            f"SUMMARY:Event {i}",
+            f"DTSTART;TZID=America/New_York:{_stamp(start)}",
+            f"DTEND;TZID=America/New_York:{_stamp(end)}",
+        ]
+        if i >= events:
+            lines.append(f"RRULE:{RULES[i % len(RULES)]}")
+            lines.append(f"EXDATE;TZID=America/New_York:{_stamp(start + timedelta(weeks=4))}")
+        lines.append("END:VEVENT")
+    lines.append("END:VCALENDAR")
+    path.write_text("\r\n".join(lines) + "\r\n")
+    return path
+
+
+def linear_scan(store: CalendarStore, start: datetime, end: datetime) -> int:
+    """Baseline: visit every event and expand every series from DTSTART."""
+    lo, hi = start.timestamp(), end.timestamp()
+    found = []
+    for loaded in store._files.values():
+        for event in loaded.events:
+            walls = event.rrule.iter(event.start.wall) if event.rrule else [event.start.wall]
+            for wall in walls:
+                begin, finish = event._instant(wall)
+                if begin >= hi:
+                    break
+                if finish > lo and wall not in event.exdates:
+                    found.append(event._occurrence(begin, finish))
+    return len(found)
+
+
+def run(events: int = 9_500, series: int = 500) -> dict:
+    origin = datetime(2026, 1, 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_ics(Path(tmp) / "bench.ics", events, series, origin)
+        started = time.perf_counter()
+        store = CalendarStore([path])
+        load = time.perf_counter() - started
+
+        year_start = datetime(2026, 1, 1).astimezone()
+        year_end = datetime(2027, 1, 1).astimezone()
+        started = time.perf_counter()
+        year = store.between(year_start, year_end)
+        cold = time.perf_counter() - started
+        started = time.perf_counter()
+        store.between(year_start, year_end)
+        warm = time.perf_counter() - started
+
+        week_start = datetime(2026, 6, 1).astimezone()
+        started = time.perf_counter()
+        week = store.between(week_start, week_start + timedelta(days=7))
+        week_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        linear_scan(store, year_start, year_end)
+        linear = time.perf_counter() - started
+    return {
+        "events": events + series,
+        "load_s": load,
+        "year_occurrences": len(year),
+        "year_cold_s": cold,
+        "year_warm_s": warm,
+        "week_occurrences": len(week),
+        "week_s": week_time,
+        "year_linear_scan_s": linear,
+    }
+
+
+def main(events: int = 9_500, series: int = 500) -> None:
+    row = run(events, series)
+    print(f"events indexed:        {row['events']} (load {row['load_s']:.2f}s)")
+    print(f"year window:           {row['year_occurrences']} occurrences")
+    print(f"  cold:                {row['year_cold_s'] * 1000:8.1f} ms")
+    print(f"  cached:              {row['year_warm_s'] * 1000:8.1f} ms")
+    print(f"  linear scan:         {row['year_linear_scan_s'] * 1000:8.1f} ms")
+    print(f"week window:           {row['week_occurrences']} occurrences, {row['week_s'] * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Parsed .ics files kept on disk between runs.
+
+A command builds its ``CalendarStore`` or ``TaskStore`` afresh on every run,
+so without this each run would re-parse every export. Entries are pickled
+per source file and per kind (``"events"``, ``"tasks"``) and are only used
+while the file's (inode, size, mtime) signature and the local UTC offset,
+which floating times were resolved against, are the ones they were built
+with. An entry that cannot be read is treated as missing.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Any
+
+from assistant.calendar import ics
+from assistant.paths import data_dir
+
+_log = logging.getLogger(__name__)
+
+# Bump when the pickled classes change shape or the parsers change their output.
+FORMAT_VERSION = 2
+
+Signature = tuple[int, int, int]
+
+
+def default_cache_dir() -> Path:
+    return data_dir() / "ics-cache"
+
+
+def file_signature(path: Path) -> Signature:
+    st = os.stat(path)
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+class ParsedCache:
+    """Pickled parse results keyed on a source file's path and signature."""
+
+    def __init__(self, directory: str | Path | None = None) -> None:
+        self.directory = Path(directory) if directory is not None else default_cache_dir()
+
+    def _entry(self, kind: str, path: Path) -> Path:
+        digest = hashlib.sha1(f"{kind}\0{path.resolve()}".encode()).hexdigest()
+        return self.directory / f"{kind}-{digest[:20]}.pickle"
+
+    @staticmethod
+    def _stamp(signature: Signature) -> tuple:
+        return (FORMAT_VERSION, signature, ics.local_tz().utcoffset(None))
+
+    def get(self, kind: str, path: Path, signature: Signature) -> Any | None:
+        """What ``put`` stored for ``path`` at ``signature``, or None."""
+        try:
+            with open(self._entry(kind, path), "rb") as fh:
+                stamp, value = pickle.load(fh)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, pickle.PickleError, AttributeError, TypeError, ValueError):
+            _log.warning("ignoring unreadable cache entry for %s", path)
+            return None
+        return value if stamp == self._stamp(signature) else None
+
+    def put(self, kind: str, path: Path, signature: Signature, value: Any) -> None:
+        entry = self._entry(kind, path)
+        scratch = entry.with_name(f".{entry.name}.{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(scratch, "wb") as fh:
+                pickle.dump((self._stamp(signature), value), fh, pickle.HIGHEST_PROTOCOL)
+            os.replace(scratch, entry)
+        except OSError as exc:
+            _log.warning("cannot cache %s: %s", path, exc)
@@ -0,0 +1,54 @@
+"""``main.py calendar`` subcommands."""
+
+import argparse
+import json
+from datetime import date, datetime, time, timedelta
+
+from assistant.bench.metrics import EXTRACT, FETCH, FILTER, SERIALIZE, stage
+from assistant.calendar import benchmark
+from assistant.calendar.cache import ParsedCache
+from assistant.calendar.store import CalendarStore, default_calendar_dir
+
+
+def register(subparsers) -> None:
+    parser = subparsers.add_parser("calendar", help="indexed .ics calendar store")
+    parser.add_argument(
+        "--ics",
+        action="append",
+        help=".ics file or directory, repeatable (default: calendars/ in the assistant data dir)",
+    )
+    parser.add_argument(
+        "--cache",
+        help="directory for parsed .ics files (default: ics-cache/ in the assistant data dir)",
+    )
+    commands = parser.add_subparsers(dest="calendar_command", required=True)
+
+    events_parser = commands.add_parser("events", help="events between two dates (inclusive)")
+    events_parser.add_argument("start", type=date.fromisoformat, help="YYYY-MM-DD")
+    events_parser.add_argument("end", type=date.fromisoformat, help="YYYY-MM-DD")
+    events_parser.set_defaults(handler=_events)
+
+    bench_parser = commands.add_parser("bench", help="range query benchmark")
+    bench_parser.add_argument("--events", type=int, default=9_500)
+    bench_parser.add_argument("--series", type=int, default=500)
+    bench_parser.set_defaults(handler=_bench)
+
+
+def _events(args: argparse.Namespace) -> int:
+    with stage("calendar.events", FETCH):
+        store = CalendarStore(args.ics or [default_calendar_dir()], ParsedCache(args.cache))
+    start = datetime.combine(args.start, time()).astimezone()
+    end = datetime.combine(args.end + timedelta(days=1), time()).astimezone()
+    with stage("calendar.events", FILTER):
+        occurrences = store.between(start, end)
+    with stage("calendar.events", EXTRACT):
+        events = [occ.as_skill_record() for occ in occurrences]
+    with stage("calendar.events", SERIALIZE):
+        text = json.dumps({"success": True, "events": events, "eventCount": len(events)}, indent=2)
+    print(text)
+    return 0
+
+
+def _bench(args: argparse.Namespace) -> int:
+    benchmark.main(args.events, args.series)
+    return 0
@@ -0,0 +1,212 @@
+"""Minimal iCalendar (.ics) reader for VEVENT data.
+
+Handles line unfolding, parameters, TEXT escapes, DATE/DATE-TIME values in
+UTC, floating or TZID form, and the recurrence properties (RRULE, EXDATE,
+RDATE, RECURRENCE-ID). VTIMEZONE blocks are skipped: TZIDs are resolved
+with ``zoneinfo``, which covers the Olson names Calendar.app exports.
+A content line that cannot be split into name and value is dropped with a
+warning; only unbalanced BEGIN/END blocks fail the whole file.
+"""
+
+import logging
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from pathlib import Path
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+_log = logging.getLogger(__name__)
+
+
+class ICSError(ValueError):
+    """A value in an .ics file that cannot be interpreted."""
+
+
+@dataclass(slots=True)
+class Property:
+    name: str
+    value: str
+    params: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class Component:
+    name: str
+    properties: list[Property] = field(default_factory=list)
+    children: list["Component"] = field(default_factory=list)
+
+    def get(self, name: str) -> Property | None:
+        for prop in self.properties:
+            if prop.name == name:
+                return prop
+        return None
+
+    def get_all(self, name: str) -> list[Property]:
+        return [prop for prop in self.properties if prop.name == name]
+
+
+def unfold(text: str) -> Iterator[str]:
+    """Yield logical content lines, joining folded continuations."""
+    current: str | None = None
+    for raw in text.splitlines():
+        if raw[:1] in (" ", "\t") and current is not None:
+            current += raw[1:]
+            continue
+        if current:
+            yield current
+        current = raw
+    if current:
+        yield current
+
+
+def parse_line(line: str) -> Property:
+    in_quotes = False
+    for i, ch in enumerate(line):
+        if ch == '"':
+            in_quotes = not in_quotes
+        elif ch == ":" and not in_quotes:
+            head, value = line[:i], line[i + 1 :]
+            break
+    else:
+        raise ICSError(f"content line without a value: {line!r}")
+    name, *raw_params = head.split(";")
+    params = {}
+    for raw in raw_params:
+        key, _, val = raw.partition("=")
+        params[key.upper()] = val.strip('"')
+    return Property(name.upper(), value, params)
+
+
+def parse(text: str) -> list[Component]:
+    """Parse iCalendar text into its top-level components."""
+    roots: list[Component] = []
+    stack: list[Component] = []
+    for line in unfold(text):
+        try:
+            prop = parse_line(line)
+        except ICSError as exc:
+            _log.warning("dropping %s", exc)
+            continue
+        if prop.name == "BEGIN":
+            component = Component(prop.value.upper())
+            (stack[-1].children if stack else roots).append(component)
+            stack.append(component)
+        elif prop.name == "END":
+            if not stack or stack[-1].name != prop.value.upper():
+                raise ICSError(f"unbalanced END:{prop.value}")
+            stack.pop()
+        elif stack:
+            stack[-1].properties.append(prop)
+    if stack:
+        raise ICSError(f"unterminated {stack[-1].name}")
+    return roots
+
+
+def read(path: str | Path) -> list[Component]:
+    return parse(Path(path).read_text(encoding="utf-8", errors="replace"))
+
+
+def unescape(value: str) -> str:
+    out = []
+    chars = iter(value)
+    for ch in chars:
+        if ch == "\\":
+            nxt = next(chars, "")
+            out.append("\n" if nxt in ("n", "N") else nxt)
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+# -- dates ------------------------------------------------------------------
+
+_zones: dict[str, tzinfo | None] = {}
+
+
+def resolve_tz(tzid: str | None) -> tzinfo | None:
+    """Return the zone for a TZID, or None (floating/local) if unknown."""
+    if not tzid:
+        return None
+    if tzid not in _zones:
+        try:
+            _zones[tzid] = ZoneInfo(tzid.strip("/"))
+        except (ZoneInfoNotFoundError, ValueError):
+            _zones[tzid] = None
+    return _zones[tzid]
+
+
+def local_tz() -> tzinfo:
+    return datetime.now().astimezone().tzinfo
+
+
+@dataclass(frozen=True, slots=True)
+class DateValue:
+    """A DATE or DATE-TIME as a wall-clock time plus the zone it is in.
+
+    ``tz`` is None for floating times and all-day dates, which follow the
+    viewer's local zone.
+    """
+
+    wall: datetime
+    tz: tzinfo | None
+    is_date: bool
+
+    def __reduce__(self):
+        # Frozen slots dataclasses unpickle field by field through
+        # object.__setattr__; the constructor is several times faster.
+        return DateValue, (self.wall, self.tz, self.is_date)
+
+    def aware(self) -> datetime:
+        return self.wall.replace(tzinfo=self.tz or local_tz())
+
+    def wall_in(self, tz: tzinfo | None) -> datetime:
+        """This moment as naive wall-clock time in ``tz``."""
+        if self.tz is None or self.is_date:
+            return self.wall
+        return self.aware().astimezone(tz or local_tz()).replace(tzinfo=None)
+
+
+def parse_date_value(value: str, params: dict[str, str]) -> DateValue:
+    value = value.strip()
+    try:
+        if params.get("VALUE") == "DATE" or len(value) == 8:
+            day = date(int(value[:4]), int(value[4:6]), int(value[6:8]))
+            return DateValue(datetime.combine(day, datetime.min.time()), None, True)
+        wall = datetime.strptime(value[:15], "%Y%m%dT%H%M%S")
+    except ValueError as exc:
+        raise ICSError(f"bad date value {value!r}") from exc
+    if value.endswith("Z"):
+        return DateValue(wall, timezone.utc, False)
+    return DateValue(wall, resolve_tz(params.get("TZID")), False)
+
+
+def parse_date_list(prop: Property) -> list[DateValue]:
+    if prop.params.get("VALUE") == "PERIOD":
+        return [parse_date_value(v.split("/")[0], {}) for v in prop.value.split(",") if v]
+    return [parse_date_value(v, prop.params) for v in prop.value.split(",") if v]
+
+
+def parse_duration(value: str) -> timedelta:
+    """Parse an RFC 5545 DURATION such as ``PT1H30M`` or ``-P1D``."""
+    value = value.strip().upper()
+    sign = -1 if value.startswith("-") else 1
+    value = value.lstrip("+-")
+    if not value.startswith("P"):
+        raise ICSError(f"bad duration {value!r}")
+    total = timedelta()
+    number = ""
+    in_time = False
+    units = {"W": "weeks", "D": "days", "H": "hours", "M": "minutes", "S": "seconds"}
+    for ch in value[1:]:
+        if ch == "T":
+            in_time = True
+        elif ch.isdigit():
+            number += ch
+        elif ch in units and number:
+            if ch == "M" and not in_time:
+                raise ICSError(f"months are not valid in a duration: {value!r}")
+            total += timedelta(**{units[ch]: int(number)})
+            number = ""
+        else:
+            raise ICSError(f"bad duration {value!r}")
+    return sign * total
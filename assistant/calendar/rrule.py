@@ -0,0 +1,278 @@
+"""RFC 5545 recurrence rules, expanded lazily over a window.
+
+Expansion works on naive wall-clock datetimes in the event's own time zone,
+so a 09:00 weekly meeting stays at 09:00 across DST changes; callers attach
+the zone afterwards. Supported parts: FREQ (DAILY, WEEKLY, MONTHLY, YEARLY),
+INTERVAL, COUNT, UNTIL, BYDAY (with ordinals), BYMONTHDAY, BYMONTH,
+BYSETPOS and WKST. Sub-daily frequencies and BYHOUR/BYMINUTE/BYWEEKNO/
+BYYEARDAY are rejected rather than silently mis-expanded.
+"""
+
+import calendar
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+WEEKDAYS = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY", "YEARLY")
+_BYDAY = re.compile(r"^([+-]?\d{1,2})?(MO|TU|WE|TH|FR|SA|SU)$")
+_UNSUPPORTED = ("BYSECOND", "BYMINUTE", "BYHOUR", "BYWEEKNO", "BYYEARDAY")
+
+# Rules that can never match (BYMONTHDAY=31;BYMONTH=2) would otherwise loop
+# forever; give up after this many empty periods in a row.
+_MAX_EMPTY_PERIODS = 2000
+
+
+class RRuleError(ValueError):
+    """An RRULE that is malformed or uses a part this engine does not expand."""
+
+
+@dataclass(frozen=True, slots=True)
+class RRule:
+    freq: str
+    interval: int = 1
+    count: int | None = None
+    until: datetime | None = None
+    byday: tuple[tuple[int | None, int], ...] = ()
+    bymonthday: tuple[int, ...] = ()
+    bymonth: tuple[int, ...] = ()
+    bysetpos: tuple[int, ...] = ()
+    wkst: int = 0
+
+    def __reduce__(self):
+        # See ics.DateValue.__reduce__.
+        return RRule, tuple(getattr(self, name) for name in self.__slots__)
+
+    @classmethod
+    def parse(cls, text: str, until: datetime | None = None) -> "RRule":
+        """Parse an RRULE value.
+
+        ``until`` is the UNTIL part already converted to the event's wall
+        clock by the caller, who knows the event's time zone.
+        """
+        parts = {}
+        for item in text.strip().split(";"):
+            if not item:
+                continue
+            name, sep, value = item.partition("=")
+            if not sep:
+                raise RRuleError(f"malformed RRULE part {item!r}")
+            parts[name.upper()] = value.upper()
+
+        freq = parts.get("FREQ")
+        if freq not in FREQUENCIES:
+            raise RRuleError(f"unsupported FREQ {freq!r}")
+        for name in _UNSUPPORTED:
+            if name in parts:
+                raise RRuleError(f"unsupported RRULE part {name}")
+        if "COUNT" in parts and "UNTIL" in parts:
+            raise RRuleError("COUNT and UNTIL are mutually exclusive")
+
+        byday = []
+        for token in filter(None, parts.get("BYDAY", "").split(",")):
+            match = _BYDAY.match(token)
+            if not match:
+                raise RRuleError(f"bad BYDAY value {token!r}")
+            ordinal = int(match.group(1)) if match.group(1) else None
+            byday.append((ordinal, WEEKDAYS[match.group(2)]))
+
+        def ints(name: str) -> tuple[int, ...]:
+            try:
+                return tuple(int(v) for v in parts.get(name, "").split(",") if v)
+            except ValueError as exc:
+                raise RRuleError(f"bad {name} value") from exc
+
+        interval = ints("INTERVAL") or (1,)
+        count = ints("COUNT")
+        if interval[0] < 1 or (count and count[0] < 1):
+            raise RRuleError("INTERVAL and COUNT must be positive")
+        return cls(
+            freq=freq,
+            interval=interval[0],
+            count=count[0] if count else None,
+            until=until,
+            byday=tuple(byday),
+            bymonthday=ints("BYMONTHDAY"),
+            bymonth=ints("BYMONTH"),
+            bysetpos=ints("BYSETPOS"),
+            wkst=WEEKDAYS.get(parts.get("WKST", "MO"), 0),
+        )
+
+    # -- expansion --------------------------------------------------------
+
+    def iter(self, dtstart: datetime, after: datetime | None = None) -> Iterator[datetime]:
+        """Yield instance start times in order.
+
+        Without COUNT the expansion jumps straight to the period containing
+        ``after``, so only the periods a window touches are generated. With
+        COUNT every period from DTSTART must be walked to keep the tally,
+        but COUNT also bounds that walk.
+        """
+        period = 0
+        if after is not None and self.count is None and after > dtstart:
+            period = self._periods_between(dtstart, after)
+        emitted = 0
+        empty = 0
+        while True:
+            try:
+                anchor = self._period_anchor(dtstart, period)
+            except (OverflowError, ValueError):
+                return  # ran past datetime.max
+            if self.until is not None and anchor > self.until:
+                return
+            candidates = self._candidates(dtstart, anchor)
+            if self.bysetpos:
+                candidates = _apply_setpos(candidates, self.bysetpos)
+            produced = False
+            for day in candidates:
+                instance = datetime.combine(day, dtstart.time())
+                if instance < dtstart:
+                    continue
+                if self.until is not None and instance > self.until:
+                    return
+                produced = True
+                yield instance
+                emitted += 1
+                if self.count is not None and emitted >= self.count:
+                    return
+            empty = 0 if produced else empty + 1
+            if empty > _MAX_EMPTY_PERIODS:
+                return
+            period += 1
+
+    def _periods_between(self, dtstart: datetime, after: datetime) -> int:
+        """Index of the last whole period starting at or before ``after``."""
+        if self.freq == "DAILY":
+            units = (after.date() - dtstart.date()).days
+        elif self.freq == "WEEKLY":
+            first = _week_start(dtstart.date(), self.wkst)
+            units = (_week_start(after.date(), self.wkst) - first).days // 7
+        elif self.freq == "MONTHLY":
+            units = (after.year - dtstart.year) * 12 + after.month - dtstart.month
+        else:
+            units = after.year - dtstart.year
+        return max(units // self.interval, 0)
+
+    def _period_anchor(self, dtstart: datetime, period: int) -> datetime:
+        """First moment of the ``period``-th period, for the UNTIL cut-off."""
+        steps = period * self.interval
+        if self.freq == "DAILY":
+            return datetime.combine(dtstart.date() + timedelta(days=steps), datetime.min.time())
+        if self.freq == "WEEKLY":
+            start = _week_start(dtstart.date(), self.wkst) + timedelta(weeks=steps)
+            return datetime.combine(start, datetime.min.time())
+        if self.freq == "MONTHLY":
+            year, month = divmod(dtstart.month - 1 + steps, 12)
+            return datetime(dtstart.year + year, month + 1, 1)
+        return datetime(dtstart.year + steps, 1, 1)
+
+    def _candidates(self, dtstart: datetime, anchor: datetime) -> list[date]:
+        start = anchor.date()
+        if self.freq == "DAILY":
+            days = [start]
+        elif self.freq == "WEEKLY":
+            weekdays = {wd for _, wd in self.byday} or {dtstart.weekday()}
+            offsets = sorted((wd - self.wkst) % 7 for wd in weekdays)
+            days = [start + timedelta(days=offset) for offset in offsets]
+        elif self.freq == "MONTHLY":
+            days = self._month_days(start.year, start.month, dtstart)
+        else:
+            days = self._year_days(start.year, dtstart)
+
+        if self.freq in ("DAILY", "WEEKLY"):
+            # BYxxx parts narrower than the frequency filter instead of expand.
+            if self.bymonth:
+                days = [d for d in days if d.month in self.bymonth]
+            if self.freq == "DAILY":
+                if self.bymonthday:
+                    days = [d for d in days if _matches_monthday(d, self.bymonthday)]
+                if self.byday:
+                    days = [d for d in days if d.weekday() in {wd for _, wd in self.byday}]
+        return days
+
+    def _month_days(self, year: int, month: int, dtstart: datetime) -> list[date]:
+        if self.bymonth and month not in self.bymonth:
+            return []
+        length = calendar.monthrange(year, month)[1]
+        if self.bymonthday:
+            days = {_resolve_monthday(year, month, length, md) for md in self.bymonthday} - {None}
+            if self.byday:
+                weekdays = {wd for _, wd in self.byday}
+                days = {d for d in days if d.weekday() in weekdays}
+            return sorted(days)
+        if self.byday:
+            return sorted(_nth_weekdays(year, month, 1, length, self.byday))
+        if dtstart.day > length:
+            return []
+        return [date(year, month, dtstart.day)]
+
+    def _year_days(self, year: int, dtstart: datetime) -> list[date]:
+        if self.bymonth:
+            if self.bymonthday or self.byday:
+                days = []
+                for month in sorted(self.bymonth):
+                    days.extend(self._month_days(year, month, dtstart))
+                return days
+            return [
+                date(year, m, dtstart.day)
+                for m in sorted(self.bymonth)
+                if dtstart.day <= calendar.monthrange(year, m)[1]
+            ]
+        if self.bymonthday:
+            days = []
+            for month in range(1, 13):
+                days.extend(self._month_days(year, month, dtstart))
+            return days
+        if self.byday:
+            # Ordinals count within the whole year (e.g. 20MO).
+            first = date(year, 1, 1)
+            length = 366 if calendar.isleap(year) else 365
+            return sorted(_nth_weekdays_from(first, length, self.byday))
+        if dtstart.month == 2 and dtstart.day == 29 and not calendar.isleap(year):
+            return []
+        return [date(year, dtstart.month, dtstart.day)]
+
+
+def _week_start(day: date, wkst: int) -> date:
+    return day - timedelta(days=(day.weekday() - wkst) % 7)
+
+
+def _resolve_monthday(year: int, month: int, length: int, monthday: int) -> date | None:
+    day = monthday if monthday > 0 else length + monthday + 1
+    if 1 <= day <= length:
+        return date(year, month, day)
+    return None
+
+
+def _matches_monthday(day: date, monthdays: tuple[int, ...]) -> bool:
+    length = calendar.monthrange(day.year, day.month)[1]
+    return any(_resolve_monthday(day.year, day.month, length, md) == day for md in monthdays)
+
+
+def _nth_weekdays(year: int, month: int, first_day: int, length: int, byday) -> set[date]:
+    return _nth_weekdays_from(date(year, month, first_day), length, byday)
+
+
+def _nth_weekdays_from(first: date, length: int, byday) -> set[date]:
+    days = set()
+    for ordinal, weekday in byday:
+        offset = (weekday - first.weekday()) % 7
+        matches = [first + timedelta(days=i) for i in range(offset, length, 7)]
+        if ordinal is None:
+            days.update(matches)
+        elif ordinal > 0 and ordinal <= len(matches):
+            days.add(matches[ordinal - 1])
+        elif ordinal < 0 and -ordinal <= len(matches):
+            days.add(matches[ordinal])
+    return days
+
+
+def _apply_setpos(days: list[date], positions: tuple[int, ...]) -> list[date]:
+    selected = set()
+    for pos in positions:
+        if 0 < pos <= len(days):
+            selected.add(days[pos - 1])
+        elif pos < 0 and -pos <= len(days):
+            selected.add(days[pos])
+    return sorted(selected)
@@ -0,0 +1,384 @@
+"""Indexed calendar store over .ics exports."""
+
+import logging
+import math
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, tzinfo
+from pathlib import Path
+
+from assistant.calendar import ics
+from assistant.calendar.cache import ParsedCache, Signature, file_signature
+from assistant.calendar.rrule import RRule, RRuleError
+from assistant.calendar.tree import IntervalTree
+from assistant.paths import data_dir
+
+_log = logging.getLogger(__name__)
+
+# Query windows remembered per series, and per store, for repeat queries.
+EXPANSION_CACHE_SIZE = 16
+
+
+def default_calendar_dir() -> Path:
+    return data_dir() / "calendars"
+
+
+@dataclass(frozen=True, slots=True)
+class Occurrence:
+    """One concrete instance of an event.
+
+    Times are kept as timestamps so windows can be filtered and sorted
+    without zone arithmetic; ``start``/``end`` build datetimes on demand.
+    """
+
+    uid: str
+    summary: str
+    start_ts: float
+    end_ts: float
+    tz: tzinfo
+    location: str
+    calendar: str
+    is_recurring: bool
+    all_day: bool
+
+    @property
+    def start(self) -> datetime:
+        return datetime.fromtimestamp(self.start_ts, self.tz)
+
+    @property
+    def end(self) -> datetime:
+        return datetime.fromtimestamp(self.end_ts, self.tz)
+
+    def as_skill_record(self) -> dict:
+        """Shape the occurrence like an event record from read_events.scpt."""
+        return {
+            "summary": self.summary,
+            "startDate": self.start.isoformat(),
+            "endDate": self.end.isoformat(),
+            "location": self.location,
+            "calendarName": self.calendar,
+            "isRecurring": self.is_recurring,
+            "allDay": self.all_day,
+        }
+
+
+@dataclass(slots=True, eq=False)
+class Event:
+    """A VEVENT: either a single event or the master of a recurring series.
+
+    Recurring instances are expanded on demand for the queried window only,
+    and the last few windows are cached on the event. Events are rebuilt
+    when their file changes, which drops the cache with them.
+    """
+
+    uid: str
+    summary: str
+    location: str
+    calendar: str
+    start: ics.DateValue
+    duration: timedelta
+    rrule: RRule | None = None
+    exdates: frozenset[datetime] = frozenset()
+    rdates: tuple[datetime, ...] = ()
+    overridden: set[datetime] = field(default_factory=set)
+    is_override: bool = False
+    _cache: OrderedDict = field(default_factory=OrderedDict, repr=False)
+    _single: Occurrence | None = field(default=None, repr=False)
+
+    @property
+    def tz(self) -> tzinfo | None:
+        return self.start.tz
+
+    @property
+    def is_recurring(self) -> bool:
+        return self.rrule is not None or bool(self.rdates)
+
+    def _instant(self, wall: datetime) -> tuple[float, float]:
+        """Start and end timestamps of the instance starting at ``wall``."""
+        zone = self.tz or ics.local_tz()
+        start = wall.replace(tzinfo=zone).timestamp()
+        if self.start.is_date:
+            # All-day spans are nominal days, not elapsed hours.
+            return start, (wall + self.duration).replace(tzinfo=zone).timestamp()
+        return start, start + self.duration.total_seconds()
+
+    def _occurrence(self, start: float, end: float) -> Occurrence:
+        return Occurrence(
+            self.uid,
+            self.summary,
+            start,
+            end,
+            self.tz or ics.local_tz(),
+            self.location,
+            self.calendar,
+            self.is_recurring or self.is_override,
+            self.start.is_date,
+        )
+
+    def span(self) -> tuple[float, float]:
+        """Earliest start and latest end over all instances, as timestamps."""
+        first, end = self._instant(self.start.wall)
+        if not self.is_recurring:
+            return first, end
+        last = self.start.wall
+        if self.rrule is not None:
+            if self.rrule.count is not None:
+                for last in self.rrule.iter(self.start.wall):
+                    pass
+            elif self.rrule.until is not None:
+                last = max(last, self.rrule.until)
+            else:
+                return first, math.inf
+        last = max([last, *self.rdates])
+        return first, self._instant(last)[1]
+
+    def occurrences(self, lo: float, hi: float) -> tuple[Occurrence, ...]:
+        """Instances overlapping ``[lo, hi)`` (timestamps)."""
+        if not self.is_recurring:
+            if self._single is None:
+                self._single = self._occurrence(*self._instant(self.start.wall))
+            single = self._single
+            return (single,) if _overlaps(single.start_ts, single.end_ts, lo, hi) else ()
+
+        key = (lo, hi)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        zone = self.tz or ics.local_tz()
+        # Wall-clock bounds with a day of slack either side for zone offsets.
+        slack = timedelta(days=1)
+        after = datetime.fromtimestamp(lo, zone).replace(tzinfo=None) - self.duration - slack
+        before = datetime.fromtimestamp(hi, zone).replace(tzinfo=None) + slack
+
+        walls: list[datetime] = []
+        if self.rrule is not None:
+            for wall in self.rrule.iter(self.start.wall, after):
+                if wall > before:
+                    break
+                walls.append(wall)
+        else:
+            walls.append(self.start.wall)
+        if self.rdates:
+            walls = sorted({*walls, *(wall for wall in self.rdates if after <= wall <= before)})
+
+        skip = self.exdates | self.overridden if self.overridden else self.exdates
+        found = []
+        for wall in walls:
+            if wall in skip:
+                continue
+            start, end = self._instant(wall)
+            if _overlaps(start, end, lo, hi):
+                found.append(self._occurrence(start, end))
+        result = tuple(found)
+        self._cache[key] = result
+        if len(self._cache) > EXPANSION_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return result
+
+
+def _overlaps(start: float, end: float, lo: float, hi: float) -> bool:
+    # Zero-length events count when they start inside the window.
+    return start < hi and (end > lo or (start == end and start >= lo))
+
+
+def _text(component: ics.Component, name: str) -> str:
+    prop = component.get(name)
+    return ics.unescape(prop.value) if prop else ""
+
+
+def events_from_components(components: list[ics.Component], default_calendar: str) -> list[Event]:
+    """Build events from parsed VCALENDARs, attaching RECURRENCE-ID overrides.
+
+    An event with a malformed property is skipped, and a series whose RRULE
+    is not supported keeps only its DTSTART instance (and any RDATEs); both
+    log a warning instead of failing the whole file.
+    """
+    events: list[Event] = []
+    masters: dict[str, Event] = {}
+    overrides: list[tuple[str, ics.DateValue, ics.Component]] = []
+
+    for cal in components:
+        if cal.name != "VCALENDAR":
+            continue
+        name = _text(cal, "X-WR-CALNAME") or default_calendar
+        for comp in cal.children:
+            if comp.name != "VEVENT" or comp.get("DTSTART") is None:
+                continue
+            try:
+                event = _event(comp, name, overrides)
+            except ics.ICSError as exc:
+                _log.warning("skipping event %r in %s: %s", _text(comp, "UID"), name, exc)
+                continue
+            if event is None:
+                continue
+            if event.is_recurring and event.uid and not event.is_override:
+                masters[event.uid] = event
+            events.append(event)
+
+    for uid, rid, _ in overrides:
+        master = masters.get(uid)
+        if master is not None:
+            master.overridden.add(rid.wall_in(master.tz))
+    return events
+
+
+def _event(
+    comp: ics.Component,
+    calendar: str,
+    overrides: list[tuple[str, ics.DateValue, ics.Component]],
+) -> Event | None:
+    """One VEVENT, or None if it is cancelled; overrides are noted in ``overrides``."""
+    dtstart = comp.get("DTSTART")
+    start = ics.parse_date_value(dtstart.value, dtstart.params)
+    recurrence_id = comp.get("RECURRENCE-ID")
+    if recurrence_id is not None:
+        rid = ics.parse_date_value(recurrence_id.value, recurrence_id.params)
+        overrides.append((_text(comp, "UID"), rid, comp))
+    if _text(comp, "STATUS").upper() == "CANCELLED":
+        return None
+
+    if comp.get("DTEND") is not None:
+        dtend = comp.get("DTEND")
+        end = ics.parse_date_value(dtend.value, dtend.params)
+        duration = end.aware() - start.aware() if not start.is_date else end.wall - start.wall
+    elif comp.get("DURATION") is not None:
+        duration = ics.parse_duration(comp.get("DURATION").value)
+    else:
+        duration = timedelta(days=1) if start.is_date else timedelta()
+
+    event = Event(
+        uid=_text(comp, "UID"),
+        summary=_text(comp, "SUMMARY"),
+        location=_text(comp, "LOCATION"),
+        calendar=calendar,
+        start=start,
+        duration=max(duration, timedelta()),
+        is_override=recurrence_id is not None,
+    )
+    if recurrence_id is None:
+        rule = comp.get("RRULE")
+        if rule is not None:
+            try:
+                event.rrule = _parse_rrule(rule.value, start)
+            except RRuleError as exc:
+                _log.warning(
+                    "event %r in %s: %s; keeping only its first instance", event.uid, calendar, exc
+                )
+        event.exdates = frozenset(
+            value.wall_in(start.tz)
+            for prop in comp.get_all("EXDATE")
+            for value in ics.parse_date_list(prop)
+        )
+        event.rdates = tuple(
+            value.wall_in(start.tz)
+            for prop in comp.get_all("RDATE")
+            for value in ics.parse_date_list(prop)
+        )
+    return event
+
+
+def _parse_rrule(value: str, start: ics.DateValue) -> RRule:
+    until = None
+    for part in value.split(";"):
+        key, _, raw = part.partition("=")
+        if key.upper() == "UNTIL":
+            parsed = ics.parse_date_value(raw, {"TZID": ""})
+            if parsed.is_date:
+                # A DATE UNTIL includes every instance on that day.
+                until = parsed.wall + timedelta(days=1, microseconds=-1)
+            elif start.is_date or start.tz is None:
+                until = parsed.wall
+            else:
+                until = parsed.wall_in(start.tz)
+    return RRule.parse(value, until=until)
+
+
+@dataclass(slots=True)
+class _LoadedFile:
+    signature: Signature
+    spans: list[tuple[float, float, Event]]
+
+
+class CalendarStore:
+    """Calendars loaded from .ics files into an interval-tree index.
+
+    Single events are indexed by their own span; recurring series by the
+    span from their first instance to their last (open-ended series run to
+    infinity) and are expanded only for the queried window. Every query
+    stats the source files first and reloads those that changed.
+
+    With a ``cache``, parsed events and their spans are also kept on disk,
+    so a new store over unchanged files skips parsing them.
+    """
+
+    def __init__(self, paths: Iterable[str | Path], cache: ParsedCache | None = None) -> None:
+        self.paths = [Path(p) for p in paths]
+        self.cache = cache
+        self._files: dict[Path, _LoadedFile] = {}
+        self._tree: IntervalTree[Event] = IntervalTree()
+        self._results: OrderedDict[tuple[float, float], list[Occurrence]] = OrderedDict()
+        self.refresh()
+
+    def _ics_files(self) -> list[Path]:
+        files = []
+        for path in self.paths:
+            if path.is_dir():
+                files.extend(sorted(path.glob("*.ics")))
+            elif path.exists():
+                files.append(path)
+        return files
+
+    def refresh(self) -> list[Path]:
+        """Reload files that changed since the last load; return them."""
+        changed = []
+        current = self._ics_files()
+        for path in current:
+            signature = file_signature(path)
+            loaded = self._files.get(path)
+            if loaded is not None and loaded.signature == signature:
+                continue
+            self._files[path] = _LoadedFile(signature, self._load(path, signature))
+            changed.append(path)
+        removed = set(self._files) - set(current)
+        for path in removed:
+            del self._files[path]
+        if changed or removed:
+            self._tree = IntervalTree(
+                span for loaded in self._files.values() for span in loaded.spans
+            )
+            self._results.clear()
+        return changed
+
+    def _load(self, path: Path, signature: Signature) -> list[tuple[float, float, Event]]:
+        if self.cache is not None:
+            spans = self.cache.get("events", path, signature)
+            if spans is not None:
+                return spans
+        events = events_from_components(ics.read(path), path.stem)
+        spans = [(*event.span(), event) for event in events]
+        if self.cache is not None:
+            self.cache.put("events", path, signature, spans)
+        return spans
+
+    def __len__(self) -> int:
+        return len(self._tree)
+
+    def between(self, start: datetime, end: datetime) -> list[Occurrence]:
+        """Occurrences overlapping ``[start, end)``, sorted by start time."""
+        self.refresh()
+        key = (start.timestamp(), end.timestamp())
+        found = self._results.get(key)
+        if found is None:
+            found = []
+            for event in self._tree.overlapping(*key):
+                found.extend(event.occurrences(*key))
+            found.sort(key=lambda occ: (occ.start_ts, occ.summary))
+            self._results[key] = found
+            if len(self._results) > EXPANSION_CACHE_SIZE:
+                self._results.popitem(last=False)
+        else:
+            self._results.move_to_end(key)
+        return list(found)
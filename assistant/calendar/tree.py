@@ -0,0 +1,85 @@
+"""Static centered interval tree."""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class _Node(Generic[T]):
+    center: float
+    by_start: list[tuple[float, float, T]]
+    by_end: list[tuple[float, float, T]]
+    left: "_Node[T] | None"
+    right: "_Node[T] | None"
+
+
+def _build(items: list[tuple[float, float, T]]) -> "_Node[T] | None":
+    if not items:
+        return None
+    endpoints = sorted(x for start, end, _ in items for x in (start, end))
+    center = endpoints[len(endpoints) // 2]
+    left, right, here = [], [], []
+    for item in items:
+        if item[1] < center:
+            left.append(item)
+        elif item[0] > center:
+            right.append(item)
+        else:
+            here.append(item)
+    return _Node(
+        center,
+        sorted(here, key=lambda item: item[0]),
+        sorted(here, key=lambda item: item[1], reverse=True),
+        _build(left),
+        _build(right),
+    )
+
+
+class IntervalTree(Generic[T]):
+    """Closed intervals ``[start, end]`` answering overlap queries in O(log n + k).
+
+    Every node holds the intervals containing its center point, sorted both
+    by start and by end, so a query only scans intervals it reports plus one
+    path down each side of the window. The tree is immutable; rebuild it when
+    the underlying data changes.
+    """
+
+    def __init__(self, items: Iterable[tuple[float, float, T]] = ()) -> None:
+        items = list(items)
+        for start, end, _ in items:
+            if end < start:
+                raise ValueError(f"interval ends before it starts: [{start}, {end}]")
+        self._root = _build(items)
+        self._size = len(items)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def overlapping(self, lo: float, hi: float) -> list[T]:
+        """Items whose interval shares at least one point with ``[lo, hi]``."""
+        found: list[T] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            if hi < node.center:
+                for start, _, item in node.by_start:
+                    if start > hi:
+                        break
+                    found.append(item)
+                stack.append(node.left)
+            elif lo > node.center:
+                for _, end, item in node.by_end:
+                    if end < lo:
+                        break
+                    found.append(item)
+                stack.append(node.right)
+            else:
+                found.extend(item for _, _, item in node.by_start)
+                stack.append(node.left)
+                stack.append(node.right)
+        return found
@@ -0,0 +1,42 @@
+"""Command-line entry point behind ``main.py``."""
+
+import argparse
+import sys
+
+from assistant.articles import cli as articles_cli
+from assistant.bench import cli as bench_cli
+from assistant.bench import metrics
+from assistant.briefing import cli as briefing_cli
+from assistant.calendar import cli as calendar_cli
+from assistant.finance import cli as finance_cli
+from assistant.mail import cli as mail_cli
+from assistant.schedule import cli as schedule_cli
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="main.py", description="Personal assistant engines")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    mail_cli.register(subparsers)
+    calendar_cli.register(subparsers)
+    briefing_cli.register(subparsers)
+    finance_cli.register(subparsers)
+    articles_cli.register(subparsers)
+    schedule_cli.register(subparsers)
+    bench_cli.register(subparsers)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if not metrics.enabled_by_env():
+        return args.handler(args)
+    recorder = metrics.Recorder()
+    previous = metrics.install(recorder)
+    try:
+        return args.handler(args)
+    finally:
+        metrics.install(previous)
+        try:
+            recorder.flush()
+        except (metrics.MetricsError, OSError) as exc:
+            print(f"metrics not saved: {exc}", file=sys.stderr)
@@ -0,0 +1,68 @@
+"""Engines behind ``/finance import``, ``analyze`` and ``project``.
+
+``import_csv`` streams a CSV export in chunks into a ``TransactionStore``:
+typed, memory-mappable column files that only ever grow. Rows are
+categorized in batches and deduplicated by transaction hash, and the
+analyses in ``assistant.finance.analysis`` aggregate the columns directly.
+``import_statements`` does the same for PDF statements, reading pages on a
+process pool and caching each PDF's lines by content hash.
+``project`` runs Monte Carlo projections of a savings, retirement or debt payoff plan
+and returns percentile bands per scenario.
+"""
+
+from assistant.finance.analysis import (
+    Period,
+    Rollup,
+    budget,
+    expenses,
+    monthly_by_category,
+    parse_period,
+)
+from assistant.finance.categories import CATEGORIES, Category, categorize
+from assistant.finance.ingest import ImportReport, import_csv
+from assistant.finance.projection import (
+    SCENARIOS,
+    DebtPayoffPlan,
+    Projection,
+    RetirementPlan,
+    SavingsPlan,
+    Scenario,
+    project,
+)
+from assistant.finance.reader import CSVFormatError, read_batches
+from assistant.finance.statements import (
+    Statement,
+    StatementCache,
+    StatementError,
+    import_statements,
+)
+from assistant.finance.store import StoreError, TransactionStore
+
+__all__ = [
+    "CATEGORIES",
+    "CSVFormatError",
+    "Category",
+    "DebtPayoffPlan",
+    "ImportReport",
+    "Period",
+    "Projection",
+    "RetirementPlan",
+    "Rollup",
+    "SCENARIOS",
+    "SavingsPlan",
+    "Scenario",
+    "Statement",
+    "StatementCache",
+    "StatementError",
+    "StoreError",
+    "TransactionStore",
+    "budget",
+    "categorize",
+    "expenses",
+    "import_csv",
+    "import_statements",
+    "monthly_by_category",
+    "parse_period",
+    "project",
+    "read_batches",
+]
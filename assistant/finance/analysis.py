@@ -0,0 +1,265 @@
+"""``/finance analyze`` aggregations computed on the store's columns.
+
+Rollups walk the memory-mapped columns in fixed-size blocks and accumulate
+with ``np.bincount``, so memory stays bounded however many rows the store
+holds. Amounts are summed in cents and reported in currency units.
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+
+from assistant.finance.categories import ALL_CATEGORIES, TRANSFER_CODE, category_code
+from assistant.finance.reader import from_days, to_days
+from assistant.finance.store import TransactionStore
+
+BLOCK_ROWS = 1_000_000
+TOP_EXPENSES = 10
+_NCAT = len(ALL_CATEGORIES)
+_ROLLING = {"last-month": 30, "last-3-months": 90, "last-6-months": 180, "last-12-months": 365}
+
+
+class PeriodError(ValueError):
+    """A ``--period`` value that is not one of the documented forms."""
+
+
+@dataclass(frozen=True, slots=True)
+class Period:
+    """A half-open range of days since the epoch."""
+
+    name: str
+    start: int
+    end: int
+
+    @property
+    def months(self) -> int:
+        """Calendar months the period touches, partial months included."""
+        first, last = from_days(self.start), from_days(self.end - 1)
+        return (last.year - first.year) * 12 + last.month - first.month + 1
+
+
+def parse_period(text: str, today: date | None = None) -> Period:
+    """Resolve a period from docs/finance/COMMAND_REFERENCE.md."""
+    today = today or date.today()
+    tomorrow = to_days(today) + 1
+    name = text.strip().lower()
+    if name in _ROLLING:
+        return Period(name, tomorrow - _ROLLING[name], tomorrow)
+    if name == "this-month":
+        return Period(name, to_days(today.replace(day=1)), tomorrow)
+    if name == "this-quarter":
+        first = date(today.year, (today.month - 1) // 3 * 3 + 1, 1)
+        return Period(name, to_days(first), tomorrow)
+    if name in ("this-year", "ytd"):
+        return Period(name, to_days(date(today.year, 1, 1)), tomorrow)
+    if name == "all":
+        return Period(name, np.iinfo(np.int32).min, np.iinfo(np.int32).max)
+    if match := re.fullmatch(r"(\d{4})", name):
+        year = int(match.group(1))
+        return Period(name, to_days(date(year, 1, 1)), to_days(date(year + 1, 1, 1)))
+    if match := re.fullmatch(r"(\d{4})-q([1-4])", name):
+        year, quarter = int(match.group(1)), int(match.group(2))
+        first = date(year, quarter * 3 - 2, 1)
+        return Period(name, to_days(first), to_days(_add_months(first, 3)))
+    if match := re.fullmatch(r"(\d{4})-(\d{2})", name):
+        first = date(int(match.group(1)), int(match.group(2)), 1)
+        return Period(name, to_days(first), to_days(_add_months(first, 1)))
+    raise PeriodError(f"unknown period {text!r}")
+
+
+def _add_months(day: date, months: int) -> date:
+    year, month = divmod(day.month - 1 + months, 12)
+    return date(day.year + year, month + 1, 1)
+
+
+# -- rollups ----------------------------------------------------------------
+
+
+@dataclass(slots=True)
+class Rollup:
+    """Per-month, per-category totals; arrays are indexed [month, category code]."""
+
+    first_month: int  # months since 1970-01
+    spent: np.ndarray  # cents going out, as positive numbers
+    received: np.ndarray  # cents coming in
+    count: np.ndarray  # all transactions
+    spent_count: np.ndarray  # outflows only
+
+    @property
+    def months(self) -> list[str]:
+        return [
+            str(np.datetime64(self.first_month + i, "M")) for i in range(self.spent.shape[0])
+        ]
+
+
+def _months(days: np.ndarray) -> np.ndarray:
+    return days.astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+
+
+def monthly_by_category(store: TransactionStore, period: Period) -> Rollup:
+    """Spending, income and transaction counts by month and category."""
+    dates = store.column("date")
+    amounts = store.column("amount")
+    codes = store.column("category")
+    lo = max(period.start, int(dates.min())) if len(dates) else period.start
+    hi = min(period.end, int(dates.max()) + 1) if len(dates) else period.start
+    if hi <= lo:
+        empty = np.zeros((0, _NCAT), dtype=np.int64)
+        return Rollup(0, empty, empty.copy(), empty.copy(), empty.copy())
+    first = int(_months(np.array([lo]))[0])
+    size = (int(_months(np.array([hi - 1]))[0]) - first + 1) * _NCAT
+
+    spent = np.zeros(size)
+    received = np.zeros(size)
+    count = np.zeros(size, dtype=np.int64)
+    spent_count = np.zeros(size, dtype=np.int64)
+    for start in range(0, len(dates), BLOCK_ROWS):
+        block = slice(start, start + BLOCK_ROWS)
+        day = dates[block]
+        keep = (day >= lo) & (day < hi)
+        if not keep.any():
+            continue
+        cents = amounts[block][keep]
+        cell = (_months(day[keep]) - first) * _NCAT + codes[block][keep]
+        outflow = cents < 0
+        spent += np.bincount(cell, weights=np.where(outflow, -cents, 0), minlength=size)
+        received += np.bincount(cell, weights=np.where(outflow, 0, cents), minlength=size)
+        count += np.bincount(cell, minlength=size)
+        spent_count += np.bincount(cell[outflow], minlength=size)
+    shape = (size // _NCAT, _NCAT)
+    return Rollup(
+        first,
+        np.rint(spent).astype(np.int64).reshape(shape),
+        np.rint(received).astype(np.int64).reshape(shape),
+        count.reshape(shape),
+        spent_count.reshape(shape),
+    )
+
+
+def _top_expenses(store: TransactionStore, period: Period, limit: int) -> list[dict]:
+    """The largest single outflows in the period, transfers excluded."""
+    dates = store.column("date")
+    amounts = store.column("amount")
+    codes = store.column("category")
+    best_rows = np.empty(0, dtype=np.int64)
+    best_cents = np.empty(0, dtype=np.int64)
+    for start in range(0, len(dates), BLOCK_ROWS):
+        block = slice(start, start + BLOCK_ROWS)
+        day, cents = dates[block], amounts[block]
+        spending = (cents < 0) & (codes[block] != TRANSFER_CODE)
+        rows = np.flatnonzero((day >= period.start) & (day < period.end) & spending)
+        best_rows = np.concatenate([best_rows, rows + start])
+        best_cents = np.concatenate([best_cents, cents[rows]])
+        if len(best_rows) > limit:
+            keep = np.argpartition(best_cents, limit)[:limit]
+            best_rows, best_cents = best_rows[keep], best_cents[keep]
+    order = np.argsort(best_cents, kind="stable")
+    rows = best_rows[order]
+    return [
+        {
+            "date": from_days(dates[row]).isoformat(),
+            "description": text,
+            "amount": _money(-amounts[row]),
+            "category": ALL_CATEGORIES[codes[row]].label,
+        }
+        for row, text in zip(rows.tolist(), store.descriptions(rows.tolist()))
+    ]
+
+
+def _money(cents: int | np.integer) -> float:
+    return round(int(cents) / 100, 2)
+
+
+def _period_record(period: Period, rollup: Rollup) -> dict:
+    months = rollup.months
+    return {
+        "period": period.name,
+        "start": months[0] if months else None,
+        "end": months[-1] if months else None,
+        "months": len(months),
+    }
+
+
+# -- analyses ---------------------------------------------------------------
+
+
+def expenses(store: TransactionStore, period: Period) -> dict:
+    """Expense analysis: totals, category breakdown, monthly trend, top expenses."""
+    rollup = monthly_by_category(store, period)
+    spent = rollup.spent.copy()
+    spent[:, TRANSFER_CODE] = 0
+    by_category = spent.sum(axis=0)
+    total = int(by_category.sum())
+    counts = rollup.spent_count.sum(axis=0)
+    months = max(len(rollup.months), 1)
+    return _period_record(period, rollup) | {
+        "totalExpenses": _money(total),
+        "monthlyAverage": _money(total // months),
+        "categories": [
+            {
+                "category": ALL_CATEGORIES[code].name,
+                "label": ALL_CATEGORIES[code].label,
+                "amount": _money(by_category[code]),
+                "count": int(counts[code]),
+                "share": round(by_category[code] / total * 100, 1) if total else 0.0,
+            }
+            for code in np.argsort(-by_category, kind="stable")
+            if by_category[code]
+        ],
+        "monthly": {month: _money(row.sum()) for month, row in zip(rollup.months, spent)},
+        "topExpenses": _top_expenses(store, period, TOP_EXPENSES),
+    }
+
+
+def load_budget(path: str | Path) -> dict[int, int]:
+    """Monthly budget in cents by category code, from ``{"food_dining": 600, ...}``."""
+    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    budget = {}
+    for name, amount in raw.items():
+        code = category_code(name)
+        if code is None:
+            raise ValueError(f"{path}: unknown category {name!r}")
+        budget[code] = round(float(amount) * 100)
+    return budget
+
+
+def budget(store: TransactionStore, period: Period, monthly_budget: dict[int, int]) -> dict:
+    """Budget vs. actual by category over the months the period touches."""
+    rollup = monthly_by_category(store, period)
+    actual = rollup.spent.sum(axis=0)
+    months = period.months if period.name != "all" else max(len(rollup.months), 1)
+    rows = []
+    for code, monthly in sorted(monthly_budget.items()):
+        planned = monthly * months
+        spent = int(actual[code])
+        variance = spent - planned
+        rows.append(
+            {
+                "category": ALL_CATEGORIES[code].name,
+                "label": ALL_CATEGORIES[code].label,
+                "budget": _money(planned),
+                "actual": _money(spent),
+                "variance": _money(variance),
+                "variancePct": round(variance / planned * 100, 1) if planned else None,
+                "status": "over" if variance > 0 else "under",
+            }
+        )
+    planned_total = sum(monthly_budget.values()) * months
+    spent_total = int(sum(actual[code] for code in monthly_budget))
+    unbudgeted = [
+        {"category": ALL_CATEGORIES[code].name, "actual": _money(actual[code])}
+        for code in np.flatnonzero(actual).tolist()
+        if code not in monthly_budget and code != TRANSFER_CODE
+    ]
+    return _period_record(period, rollup) | {
+        "budgetMonths": months,
+        "totalBudget": _money(planned_total),
+        "totalActual": _money(spent_total),
+        "totalVariance": _money(spent_total - planned_total),
+        "categories": rows,
+        "unbudgeted": unbudgeted,
+    }
@@ -0,0 +1,360 @@
+"""Benchmarks for the finance store and the projection engine.
+
+``main`` covers the store. It writes synthetic CSV exports of increasing
+size and imports each into a fresh store in a child process, recording
+that process's peak RSS. The peak should stay flat as the file grows, since
+only one chunk is in memory at a time. The monthly-by-category rollup and
+the expense analysis are then timed over the full store, and a second
+import of the same file shows the cost of skipping every row as a
+duplicate.
+
+``main_projection`` times a 40-year retirement projection, 10k paths for
+each of the three scenarios, inline and on a process pool. The baseline is
+a per-path Python loop, one scenario at a time, timed on a sample of paths
+and scaled up.
+
+``main_statements`` writes a folder of synthetic PDF statements and imports
+it three times: cold (empty cache), warm (every PDF cached) and after one
+more month's statement arrives. The cold run is timed inline and on a
+process pool; the warm runs only hash the PDFs and read the cache.
+"""
+
+import csv
+import os
+import random
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+
+from assistant.finance.analysis import expenses, monthly_by_category, parse_period
+from assistant.finance.ingest import import_csv
+from assistant.finance.projection import SCENARIOS, RetirementPlan, monthly_rate, project
+from assistant.finance.statements import StatementCache, import_statements
+from assistant.finance.store import TransactionStore
+
+MERCHANTS = (
+    ("Whole Foods Grocery", -8_000, -500),
+    ("Blue Bottle Cafe", -1_500, -300),
+    ("Uber Trip", -4_000, -800),
+    ("Shell Gas Station", -7_000, -2_000),
+    ("Amazon Marketplace", -15_000, -500),
+    ("Netflix Subscription", -1_599, -1_599),
+    ("CVS Pharmacy", -5_000, -500),
+    ("Delta Airline", -60_000, -15_000),
+    ("Monthly Rent", -250_000, -250_000),
+    ("Comcast Internet", -8_999, -8_999),
+    ("ATM Withdrawal", -20_000, -2_000),
+    ("Corner Store", -3_000, -200),
+    ("Payroll Direct Deposit", 350_000, 350_000),
+)
+TODAY = date(2025, 1, 31)
+
+
+def write_csv(path: Path, rows: int, seed: int = 7, years: int = 10) -> Path:
+    """Write a ``date,description,amount,account`` export of ``rows`` rows."""
+    rng = random.Random(seed)
+    first = TODAY - timedelta(days=365 * years)
+    span = (TODAY - first).days
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        out = csv.writer(handle)
+        out.writerow(("date", "description", "amount", "account"))
+        for i in range(rows):
+            name, low, high = MERCHANTS[rng.randrange(len(MERCHANTS))]
+            day = first + timedelta(days=i * span // rows)
+            out.writerow(
+                (
+                    day.isoformat(),
+                    f"{name} #{rng.randrange(1000)}",
+                    f"{rng.randint(low, high) / 100:.2f}",
+                    ("Checking", "Credit Card", "Savings")[i % 3],
+                )
+            )
+    return path
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _import_in_child(store_dir: str, source: str) -> tuple[int, float, float]:
+    report = import_csv(TransactionStore(store_dir), source, today=TODAY)
+    return report.imported, report.seconds, _peak_rss_mb()
+
+
+def run(sizes: tuple[int, ...] = (1_000_000, 5_000_000)) -> list[dict]:
+    rows = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            source = write_csv(Path(tmp) / "ledger.csv", size)
+            store_dir = Path(tmp) / "store"
+            # A fresh interpreter per size, so the peak belongs to this import.
+            with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as pool:
+                imported, seconds, peak = pool.submit(
+                    _import_in_child, str(store_dir), str(source)
+                ).result()
+
+            store = TransactionStore(store_dir)
+            period = parse_period("all", TODAY)
+            started = time.perf_counter()
+            rollup = monthly_by_category(store, period)
+            rollup_s = time.perf_counter() - started
+            started = time.perf_counter()
+            expenses(store, parse_period("last-12-months", TODAY))
+            expenses_s = time.perf_counter() - started
+
+            again = import_csv(store, source, today=TODAY)
+        rows.append(
+            {
+                "rows": size,
+                "imported": imported,
+                "import_s": seconds,
+                "rows_per_s": imported / seconds if seconds else 0.0,
+                "peak_rss_mb": peak,
+                "rollup_s": rollup_s,
+                "rollup_months": len(rollup.months),
+                "expenses_s": expenses_s,
+                "reimport_s": again.seconds,
+                "reimport_duplicates": again.duplicates,
+            }
+        )
+    return rows
+
+
+def main(sizes: tuple[int, ...] = (1_000_000, 5_000_000)) -> None:
+    print(
+        f"{'rows':>9} {'import':>9} {'rows/s':>9} {'peak RSS':>9} "
+        f"{'rollup':>9} {'expenses':>9} {'reimport':>9}"
+    )
+    for row in run(sizes):
+        print(
+            f"{row['rows']:>9} {row['import_s']:>8.1f}s {row['rows_per_s']:>9.0f} "
+            f"{row['peak_rss_mb']:>7.0f}MB {row['rollup_s']:>8.3f}s {row['expenses_s']:>8.3f}s "
+            f"{row['reimport_s']:>8.1f}s"
+        )
+
+
+# -- projections ------------------------------------------------------------
+
+RETIREMENT = RetirementPlan(
+    current_age=35,
+    retirement_age=65,
+    current_savings=50_000,
+    monthly_contribution=1_000,
+    monthly_withdrawal=4_000,
+)
+
+
+def _scalar_paths(plan: RetirementPlan, months: int, paths: int, seed: int) -> float:
+    """Per-path, per-month loop over every scenario; returns seconds."""
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    for scenario in SCENARIOS.values():
+        flows = plan.cashflows(scenario, months).tolist()
+        mean = monthly_rate(scenario.investment_return)
+        sigma = scenario.volatility / 12**0.5
+        for _ in range(paths):
+            balance = plan.start_balance
+            for flow in flows:
+                balance = max(balance * (1 + rng.gauss(mean, sigma)) + flow, 0.0)
+    return time.perf_counter() - started
+
+
+def run_projection(
+    years: int = 40, paths: int = 10_000, workers: int | None = None, sample: int = 500
+) -> dict:
+    workers = workers or max(os.cpu_count() or 1, 2)
+    months = years * 12
+    scalar = _scalar_paths(RETIREMENT, months, sample, seed=1) * paths / sample
+
+    started = time.perf_counter()
+    inline = project(RETIREMENT, SCENARIOS, months, paths, seed=1, workers=0)
+    inline_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    pooled = project(RETIREMENT, SCENARIOS, months, paths, seed=1, workers=workers)
+    pooled_s = time.perf_counter() - started
+
+    return {
+        "months": months,
+        "paths": paths,
+        "scenarios": len(SCENARIOS),
+        "scalar_s": scalar,
+        "inline_s": inline_s,
+        "pool_s": pooled_s,
+        "workers": workers,
+        "same_bands": all((a.bands[50] == b.bands[50]).all() for a, b in zip(inline, pooled)),
+        "success": {p.scenario.name: p.success_rate for p in inline},
+    }
+
+
+def main_projection(years: int = 40, paths: int = 10_000, workers: int | None = None) -> None:
+    row = run_projection(years, paths, workers)
+    print(f"{row['scenarios']} scenarios x {row['paths']} paths x {row['months']} months")
+    print(f"  per-path loop (scaled): {row['scalar_s']:>8.2f}s")
+    print(f"  vectorized, inline:     {row['inline_s']:>8.2f}s")
+    print(f"  vectorized, {row['workers']} workers:  {row['pool_s']:>8.2f}s")
+    print(f"  identical bands: {row['same_bands']}")
+    for name, rate in row["success"].items():
+        print(f"  {name:>12}: {rate:.1%} of paths never run out")
+
+
+# -- PDF statements ---------------------------------------------------------
+
+_LINES_PER_PAGE = 55
+
+
+def _pdf_text(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_pdf(path: Path, pages: list[list[str]]) -> Path:
+    """A minimal PDF with one line of Courier text per string."""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", b"", b""]
+    objects[2] = b"<< /Type /Font /Subtype /Type1 /BaseFont /Courier >>"
+    kids = []
+    for lines in pages:
+        shown = " T* ".join(f"({_pdf_text(line)}) Tj" for line in lines)
+        stream = f"BT /F1 9 Tf 11 TL 36 756 Td {shown} ET".encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        kids.append(len(objects) + 1)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (len(objects))
+        )
+    refs = " ".join(f"{kid} 0 R" for kid in kids)
+    objects[1] = f"<< /Type /Pages /Kids [{refs}] /Count {len(kids)} >>".encode()
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    path.write_bytes(bytes(out))
+    return path
+
+
+def write_statement(path: Path, month: date, rows: int, seed: int = 7) -> Path:
+    """A checking statement for ``month`` with ``rows`` transactions.
+
+    Rows are dated MM/DD, as most banks print them, so the year comes from
+    the statement period in the header.
+    """
+    rng = random.Random(seed)
+    closing = (month.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+    opening = balance = 800_000
+    body = []
+    for i in range(rows):
+        name, low, high = MERCHANTS[rng.randrange(len(MERCHANTS))]
+        day = month + timedelta(days=i * (closing.day - 1) // max(rows - 1, 1))
+        cents = rng.randint(low, high)
+        balance += cents
+        body.append(
+            f"{day:%m/%d}  {f'{name} #{rng.randrange(1000)}':<34}"
+            f"{cents / 100:>12,.2f}{balance / 100:>12,.2f}"
+        )
+    header = [
+        "Sample Community Bank",
+        f"Statement Period: {month:%m/%d/%Y} through {closing:%m/%d/%Y}",
+        "Account: Everyday Checking ...4821",
+        "",
+        f"{'Date':<7}{'Description':<34}{'Amount':>12}{'Balance':>12}",
+        f"{month:%m/%d}  {'Beginning Balance':<34}{'':>12}{opening / 100:>12,.2f}",
+    ]
+    footer = f"{closing:%m/%d}  {'Ending Balance':<34}{'':>12}{balance / 100:>12,.2f}"
+    lines = [*header, *body, footer]
+    pages = [lines[i : i + _LINES_PER_PAGE] for i in range(0, len(lines), _LINES_PER_PAGE)]
+    return write_pdf(path, pages)
+
+
+def write_statements(
+    folder: Path, count: int, rows: int = 40, first: date = date(2000, 1, 1)
+) -> list[Path]:
+    """``count`` monthly statements, one per month from ``first``."""
+    folder.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(count):
+        month = date(first.year + (first.month - 1 + i) // 12, (first.month - 1 + i) % 12 + 1, 1)
+        paths.append(write_statement(folder / f"statement-{month:%Y-%m}.pdf", month, rows, seed=i))
+    return paths
+
+
+def _import_statements(store_dir: Path, cache_dir: Path, paths, workers: int | None) -> dict:
+    started = time.perf_counter()
+    store = TransactionStore(store_dir)
+    cache = StatementCache(cache_dir)
+    report, summary = import_statements(store, paths, cache=cache, workers=workers, today=TODAY)
+    return {
+        "seconds": time.perf_counter() - started,
+        "imported": report.imported,
+        "duplicates": report.duplicates,
+        "pages": summary.pages,
+        "cached": summary.cached,
+    }
+
+
+def run_statements(count: int = 300, rows: int = 40, workers: int | None = None) -> dict:
+    workers = workers or max(os.cpu_count() or 1, 2)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        paths = write_statements(tmp / "pdf", count + 1, rows)
+        older, newest = paths[:-1], paths[-1]
+        runs = {"cold_inline": _import_statements(tmp / "a", tmp / "cache-a", older, 0)}
+        runs["cold_pool"] = _import_statements(tmp / "b", tmp / "cache-b", older, workers)
+        runs["warm"] = _import_statements(tmp / "b", tmp / "cache-b", older, workers)
+        runs["one_new"] = _import_statements(tmp / "b", tmp / "cache-b", paths, workers)
+        shutil.rmtree(tmp / "cache-a")
+        inline = TransactionStore(tmp / "a").column("hash")
+        pooled = TransactionStore(tmp / "b").column("hash")[: len(inline)]
+        same = bool((inline == pooled).all())
+    return {
+        "statements": count,
+        "rows": rows,
+        "workers": workers,
+        "runs": runs,
+        "same_rows": same,
+        "newest": newest.name,
+    }
+
+
+def main_statements(count: int = 300, rows: int = 40, workers: int | None = None) -> None:
+    result = run_statements(count, rows, workers)
+    print(f"{result['statements']} statements x {result['rows']} rows")
+    print(f"{'run':>22} {'time':>8} {'pages':>6} {'cached':>7} {'imported':>9} {'dupes':>7}")
+    labels = {
+        "cold_inline": "cold, inline",
+        "cold_pool": f"cold, {result['workers']} workers",
+        "warm": "warm",
+        "one_new": "warm + 1 new statement",
+    }
+    for key, label in labels.items():
+        run = result["runs"][key]
+        print(
+            f"{label:>22} {run['seconds']:>7.2f}s {run['pages']:>6} {run['cached']:>7} "
+            f"{run['imported']:>9} {run['duplicates']:>7}"
+        )
+    print(f"  same rows inline and pooled: {result['same_rows']}")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["projection"]:
+        main_projection()
+    elif sys.argv[1:] == ["statements"]:
+        main_statements()
+    else:
+        main()
@@ -0,0 +1,88 @@
+"""Transaction categories from docs/finance/COMMAND_REFERENCE.md as data.
+
+Categories are listed in match order: a description takes the first
+category with a matching keyword. Keep the lists in sync with the
+"Transaction Categories" section of the command reference.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True, slots=True)
+class Category:
+    name: str
+    label: str
+    keywords: tuple[str, ...]
+
+
+CATEGORIES = (
+    Category("income", "Income", ("salary", "paycheck", "deposit", "bonus", "refund")),
+    Category("housing", "Housing", ("rent", "mortgage", "utilities", "insurance")),
+    Category("food_dining", "Food & Dining", ("restaurant", "grocery", "cafe", "delivery")),
+    Category("transportation", "Transportation", ("uber", "gas", "parking", "transit")),
+    Category("shopping", "Shopping", ("amazon", "target", "walmart", "online")),
+    Category("healthcare", "Healthcare", ("pharmacy", "doctor", "medical", "dental")),
+    Category("entertainment", "Entertainment", ("netflix", "spotify", "movie", "subscription")),
+    Category("travel", "Travel", ("hotel", "flight", "airline", "vacation")),
+    Category("education", "Education", ("tuition", "school", "course", "books")),
+    Category("personal", "Personal", ("haircut", "gym", "salon", "fitness")),
+    Category("bills", "Bills", ("phone", "internet", "cable", "utilities")),
+    Category("transfer", "Transfer", ("transfer", "withdrawal", "atm")),
+    Category("fees", "Fees", ("fee", "charge", "penalty")),
+)
+
+UNCATEGORIZED = Category("uncategorized", "Uncategorized", ())
+
+# Codes are positions in this tuple; the store records it and refuses to
+# mix codes from a different list.
+ALL_CATEGORIES = (*CATEGORIES, UNCATEGORIZED)
+CATEGORY_NAMES = tuple(category.name for category in ALL_CATEGORIES)
+UNCATEGORIZED_CODE = len(CATEGORIES)
+
+# Moving money between your own accounts is neither income nor spending.
+TRANSFER_CODE = CATEGORY_NAMES.index("transfer")
+
+_BY_NAME = {
+    key: code
+    for code, category in enumerate(ALL_CATEGORIES)
+    for key in (category.name, category.label.lower())
+}
+
+
+# Punctuation that separates words in card-processor descriptions.
+_SEPARATORS = ("*", "#", "/", "-", ".")
+
+
+def category_code(name: str) -> int | None:
+    """Code of a category given by name or label, e.g. from a CSV column."""
+    key = name.strip().lower()
+    code = _BY_NAME.get(key)
+    return code if code is not None else _BY_NAME.get(key.replace(" ", "_"))
+
+
+def categorize(descriptions: Sequence[str]) -> np.ndarray:
+    """Category codes (uint8) for distinct descriptions.
+
+    Every keyword is tested against the whole batch at once. Keywords match
+    at the start of a word, so "fee" does not fire on "coffee" but "fees"
+    and "books" still match their singular keywords.
+    """
+    codes = np.full(len(descriptions), UNCATEGORIZED_CODE, dtype=np.uint8)
+    if not descriptions:
+        return codes
+    text = np.array(descriptions, dtype=np.dtypes.StringDType())
+    text = np.strings.add(" ", np.strings.lower(text))
+    for separator in _SEPARATORS:
+        text = np.strings.replace(text, separator, " ")
+    unset = np.ones(len(descriptions), dtype=bool)
+    for code, category in enumerate(CATEGORIES):
+        hit = np.zeros(len(descriptions), dtype=bool)
+        for keyword in category.keywords:
+            hit |= np.strings.find(text, " " + keyword) >= 0
+        hit &= unset
+        codes[hit] = code
+        unset &= ~hit
+    return codes
@@ -0,0 +1,280 @@
+"""``main.py finance`` subcommands."""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from assistant.bench.metrics import EXTRACT, FETCH, FILTER, SERIALIZE, stage
+from assistant.finance import benchmark
+from assistant.finance.analysis import (
+    PeriodError,
+    budget,
+    expenses,
+    load_budget,
+    parse_period,
+)
+from assistant.finance.categories import ALL_CATEGORIES
+from assistant.finance.ingest import ACCOUNT_TYPES, ImportReport, import_csv
+from assistant.finance.projection import (
+    MAX_MONTHS,
+    SCENARIOS,
+    DebtPayoffPlan,
+    RetirementPlan,
+    SavingsPlan,
+    project,
+    with_return,
+)
+from assistant.finance.reader import CHUNK_ROWS, CSVFormatError
+from assistant.finance.statements import StatementCache, StatementError, import_statements
+from assistant.finance.store import TransactionStore
+
+
+def _count(low: int, high: int | None = None):
+    """argparse type for an integer in ``[low, high]``."""
+
+    def parse(value: str) -> int:
+        try:
+            number = int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"expected an integer, got {value!r}") from None
+        if number < low or (high is not None and number > high):
+            bound = f"between {low} and {high}" if high is not None else f"at least {low}"
+            raise argparse.ArgumentTypeError(f"must be {bound}, got {number}")
+        return number
+
+    return parse
+
+
+def register(subparsers) -> None:
+    parser = subparsers.add_parser("finance", help="columnar transaction store")
+    parser.add_argument("--store", help="store directory (default: in the assistant data dir)")
+    commands = parser.add_subparsers(dest="finance_command", required=True)
+
+    import_parser = commands.add_parser("import", help="stream CSV exports or PDF statements")
+    import_parser.add_argument(
+        "--source",
+        nargs="+",
+        required=True,
+        help="CSVs with date,description,amount, PDF statements or folders of PDFs",
+    )
+    import_parser.add_argument("--type", dest="account_type", choices=ACCOUNT_TYPES, required=True)
+    import_parser.add_argument("--account", help="account name (default: the account type)")
+    import_parser.add_argument("--dayfirst", action="store_true", help="read 01/02/2025 as 1 Feb")
+    import_parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    import_parser.add_argument("--workers", type=int, help="PDF pool size, 0 to read inline")
+    import_parser.add_argument(
+        "--no-cache", action="store_true", help="read every PDF again, ignoring cached lines"
+    )
+    import_parser.set_defaults(handler=_import)
+
+    analyze_parser = commands.add_parser("analyze", help="aggregate the stored transactions")
+    analyze_parser.add_argument(
+        "--type", dest="analysis", choices=("expenses", "budget"), required=True
+    )
+    analyze_parser.add_argument("--period", default="last-12-months")
+    analyze_parser.add_argument(
+        "--budget",
+        help='monthly budget JSON such as {"food_dining": 600} (default: budget.json in the store)',
+    )
+    analyze_parser.set_defaults(handler=_analyze)
+
+    project_parser = commands.add_parser("project", help="Monte Carlo projection bands")
+    project_parser.add_argument(
+        "--type", dest="projection", choices=("retirement", "savings", "debt"), default="retirement"
+    )
+    project_parser.add_argument(
+        "--months",
+        type=_count(1, MAX_MONTHS),
+        help=f"default: 12, retirement: to age 95 (at most {MAX_MONTHS})",
+    )
+    project_parser.add_argument(
+        "--scenario", choices=(*SCENARIOS, "all"), default="moderate", help="default: moderate"
+    )
+    project_parser.add_argument("--paths", type=_count(1), default=10_000)
+    project_parser.add_argument("--seed", type=int, help="fix the random draws")
+    project_parser.add_argument(
+        "--workers", type=_count(0), help="process pool size, 0 to run inline"
+    )
+    project_parser.add_argument("--current-savings", type=float, default=0.0)
+    project_parser.add_argument("--monthly-contribution", type=float, default=0.0)
+    project_parser.add_argument(
+        "--expected-return", type=float, help="replaces the scenario return"
+    )
+    project_parser.add_argument("--current-age", type=_count(0, 120), default=35)
+    project_parser.add_argument("--retirement-age", type=_count(0, 120), default=65)
+    project_parser.add_argument(
+        "--monthly-withdrawal", type=float, default=0.0, help="in retirement, in today's money"
+    )
+    project_parser.add_argument("--goal-amount", type=float, default=0.0)
+    project_parser.add_argument("--balance", type=float, default=0.0, help="debt owed today")
+    project_parser.add_argument(
+        "--apr", type=float, default=0.0, help="debt's annual rate, e.g. 0.199"
+    )
+    project_parser.add_argument("--monthly-payment", type=float, default=0.0)
+    project_parser.add_argument("--bench", action="store_true", help="run the projection benchmark")
+    project_parser.set_defaults(handler=_project)
+
+    bench_parser = commands.add_parser("bench", help="import memory and rollup benchmark")
+    bench_parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 5_000_000])
+    bench_parser.add_argument(
+        "--statements", type=int, help="benchmark PDF extraction over this many statements instead"
+    )
+    bench_parser.set_defaults(handler=_bench)
+
+
+def _sources(values: list[str]) -> tuple[list[Path], list[Path]]:
+    """CSV files, then PDFs; folders contribute the PDFs directly inside them."""
+    csvs, pdfs = [], []
+    for value in values:
+        path = Path(value).expanduser()
+        if path.is_dir():
+            pdfs += sorted(p for p in path.iterdir() if p.suffix.lower() == ".pdf")
+        elif path.suffix.lower() == ".pdf":
+            pdfs.append(path)
+        else:
+            csvs.append(path)
+    return csvs, pdfs
+
+
+def _import(args: argparse.Namespace) -> int:
+    store = TransactionStore(args.store)
+    csvs, pdfs = _sources(args.source)
+    reports = []
+    summary = None
+    with stage("finance.import", FETCH):
+        for source in csvs:
+            try:
+                report = import_csv(
+                    store,
+                    source,
+                    account_type=args.account_type,
+                    account=args.account,
+                    chunk_rows=args.chunk_rows,
+                    dayfirst=args.dayfirst,
+                )
+            except CSVFormatError as exc:
+                print(exc, file=sys.stderr)
+                return 1
+            reports.append((report, source.name))
+        if pdfs:
+            try:
+                report, summary = import_statements(
+                    store,
+                    pdfs,
+                    account_type=args.account_type,
+                    account=args.account,
+                    cache=None if args.no_cache else StatementCache(),
+                    workers=args.workers,
+                    dayfirst=args.dayfirst,
+                )
+            except StatementError as exc:
+                print(exc, file=sys.stderr)
+                return 1
+            name = pdfs[0].name if len(pdfs) == 1 else f"{summary.statements} PDF statements"
+            reports.append((report, name))
+    with stage("finance.import", SERIALIZE):
+        if summary is not None:
+            print(
+                f"✓ Statements: {summary.statements} ({summary.cached} cached, "
+                f"{summary.statements - summary.cached} read, {summary.pages} pages, "
+                f"{summary.seconds:.1f}s)"
+            )
+            if summary.repeated:
+                print(f"✓ Repeated files skipped: {summary.repeated}")
+        for report, name in reports:
+            _print_report(report, name)
+        print(f"\nStored in: {store.path} ({len(store)} transactions)")
+    return 0
+
+
+def _print_report(report: ImportReport, name: str) -> None:
+    print(f"✓ Imported {report.imported} transactions from {name} ({report.seconds:.1f}s)")
+    if report.date_range:
+        first, last = report.date_range
+        print(f"✓ Date range: {first} to {last}")
+    print(f"✓ Duplicates skipped: {report.duplicates}")
+    print(f"✓ Invalid rows skipped: {report.rejected}")
+    if report.imported:
+        share = report.categorized * 100 // report.imported
+        print(f"✓ Auto-categorized: {report.categorized}/{report.imported} ({share}%)")
+        print(f"✓ Uncategorized: {report.imported - report.categorized} transactions")
+        print("\nCategory Summary:")
+        for code, (count, cents) in sorted(report.by_category.items()):
+            print(f"- {ALL_CATEGORIES[code].label}: {count} transactions, ${abs(cents) / 100:,.2f}")
+
+
+def _analyze(args: argparse.Namespace) -> int:
+    with stage("finance.analyze", FETCH):
+        store = TransactionStore(args.store)
+    try:
+        period = parse_period(args.period)
+    except PeriodError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    if args.analysis == "expenses":
+        with stage("finance.analyze", FILTER):
+            result = expenses(store, period)
+    else:
+        budget_path = Path(args.budget) if args.budget else store.path / "budget.json"
+        if not budget_path.exists():
+            print(f"no budget file at {budget_path}", file=sys.stderr)
+            return 1
+        try:
+            monthly_budget = load_budget(budget_path)
+        except ValueError as exc:
+            print(f"bad budget file {budget_path}: {exc}", file=sys.stderr)
+            return 1
+        with stage("finance.analyze", FILTER):
+            result = budget(store, period, monthly_budget)
+    with stage("finance.analyze", SERIALIZE):
+        result = {"success": True, "type": args.analysis} | result
+        text = json.dumps(result, indent=2, ensure_ascii=False)
+    print(text)
+    return 0
+
+
+def _project(args: argparse.Namespace) -> int:
+    if args.bench:
+        benchmark.main_projection(paths=args.paths, workers=args.workers)
+        return 0
+    if args.projection == "retirement":
+        plan = RetirementPlan(
+            current_age=args.current_age,
+            retirement_age=args.retirement_age,
+            current_savings=args.current_savings,
+            monthly_contribution=args.monthly_contribution,
+            monthly_withdrawal=args.monthly_withdrawal,
+        )
+        months = args.months or min(max(95 - args.current_age, 1) * 12, MAX_MONTHS)
+    elif args.projection == "debt":
+        plan = DebtPayoffPlan(args.balance, args.apr, args.monthly_payment)
+        months = args.months or 12
+    else:
+        plan = SavingsPlan(args.current_savings, args.monthly_contribution, args.goal_amount)
+        months = args.months or 12
+    names = list(SCENARIOS) if args.scenario == "all" else [args.scenario]
+    scenarios = [with_return(SCENARIOS[name], args.expected_return) for name in names]
+    try:
+        with stage("finance.project", EXTRACT):
+            projections = project(plan, scenarios, months, args.paths, args.seed, args.workers)
+    except ValueError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    with stage("finance.project", SERIALIZE):
+        result = {
+            "success": True,
+            "type": args.projection,
+            "months": months,
+            "projections": [projection.as_dict() for projection in projections],
+        }
+        print(json.dumps(result, indent=2))
+    return 0
+
+
+def _bench(args: argparse.Namespace) -> int:
+    if args.statements:
+        benchmark.main_statements(args.statements)
+        return 0
+    benchmark.main(tuple(args.rows))
+    return 0
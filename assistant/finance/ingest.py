@@ -0,0 +1,236 @@
+"""Streaming ``/finance import`` into a ``TransactionStore``.
+
+A CSV is read in chunks (PDF statements arrive as one batch each, see
+``assistant.finance.statements``). Each chunk is categorized, hashed,
+checked against the hashes already stored and appended, so repeated or
+overlapping exports add only the transactions the store has not seen.
+"""
+
+import hashlib
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+
+from assistant.finance.categories import UNCATEGORIZED_CODE, categorize, category_code
+from assistant.finance.reader import CHUNK_ROWS, Batch, from_days, read_batches
+from assistant.finance.store import TransactionStore
+
+ACCOUNT_TYPES = ("checking", "savings", "credit", "cash", "investment")
+# Distinct descriptions remembered between chunks.
+_DESCRIPTION_CACHE_SIZE = 200_000
+
+_M1 = np.uint64(0xBF58476D1CE4E5B9)
+_M2 = np.uint64(0x94D049BB133111EB)
+
+
+@dataclass(slots=True)
+class ImportReport:
+    source: str
+    imported: int = 0
+    duplicates: int = 0
+    rejected: int = 0
+    categorized: int = 0
+    first_day: int | None = None
+    last_day: int | None = None
+    by_category: dict[int, tuple[int, int]] = field(default_factory=dict)  # code: (count, cents)
+    seconds: float = 0.0
+
+    @property
+    def date_range(self) -> tuple[date, date] | None:
+        if self.first_day is None:
+            return None
+        return from_days(self.first_day), from_days(self.last_day)
+
+
+def _mix(values: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer, applied element-wise."""
+    values = (values ^ (values >> np.uint64(30))) * _M1
+    values = (values ^ (values >> np.uint64(27))) * _M2
+    return values ^ (values >> np.uint64(31))
+
+
+def _description_key(text: str) -> int:
+    normalized = " ".join(text.lower().split()).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(normalized, digest_size=8).digest(), "little")
+
+
+class IdentityCounts:
+    """How many rows of each identity an import has hashed so far.
+
+    Sorted parallel arrays of base hash and count, so the ordinals of
+    identical rows keep counting across chunk boundaries.
+    """
+
+    def __init__(self) -> None:
+        self._keys = np.empty(0, dtype=np.uint64)
+        self._counts = np.empty(0, dtype=np.uint64)
+
+    def take(self, keys: np.ndarray, counts: np.ndarray) -> np.ndarray:
+        """Earlier counts of the sorted, distinct ``keys``; then add ``counts``."""
+        at = np.searchsorted(self._keys, keys)
+        known = at < len(self._keys)
+        known[known] = self._keys[at[known]] == keys[known]
+        before = np.zeros(len(keys), dtype=np.uint64)
+        before[known] = self._counts[at[known]]
+        self._counts[at[known]] += counts[known].astype(np.uint64)
+        fresh = ~known
+        self._keys = np.insert(self._keys, at[fresh], keys[fresh])
+        self._counts = np.insert(self._counts, at[fresh], counts[fresh].astype(np.uint64))
+        return before
+
+
+def transaction_hashes(
+    dates: np.ndarray,
+    amounts: np.ndarray,
+    accounts: np.ndarray,
+    description_keys: np.ndarray,
+    occurrences: IdentityCounts | None = None,
+) -> np.ndarray:
+    """uint64 identity of each row: account, date, amount and description.
+
+    Identical rows (two coffees on the same day) are told apart by their
+    position among the identical rows. Pass the same ``occurrences`` for
+    every chunk of an import so that position counts from the start of the
+    source, and re-importing it in chunks of any size reproduces the same
+    hashes.
+    """
+    hashed = _mix(description_keys ^ dates.astype(np.uint64))
+    hashed = _mix(hashed ^ amounts.view(np.uint64))
+    hashed = _mix(hashed ^ accounts.astype(np.uint64))
+    order = np.argsort(hashed, kind="stable")
+    ordered = hashed[order]
+    starts = np.r_[0, np.flatnonzero(ordered[1:] != ordered[:-1]) + 1]
+    counts = np.diff(np.r_[starts, len(ordered)])
+    first_of_group = np.repeat(starts, counts).astype(np.uint64)
+    if occurrences is not None:
+        first_of_group -= np.repeat(occurrences.take(ordered[starts], counts), counts)
+    ordinal = np.empty(len(hashed), dtype=np.uint64)
+    ordinal[order] = np.arange(len(hashed), dtype=np.uint64) - first_of_group
+    return _mix(hashed ^ _mix(ordinal + np.uint64(1)))
+
+
+class _Encoder:
+    """Category codes and hash keys, computed once per distinct description."""
+
+    def __init__(self) -> None:
+        self._seen: dict[str, tuple[int, int]] = {}
+
+    def encode(self, descriptions: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        if len(self._seen) > _DESCRIPTION_CACHE_SIZE:
+            self._seen.clear()
+        fresh = list(dict.fromkeys(d for d in descriptions if d not in self._seen))
+        if fresh:
+            for text, code in zip(fresh, categorize(fresh).tolist()):
+                self._seen[text] = (code, _description_key(text))
+        seen = self._seen
+        codes = np.fromiter((seen[d][0] for d in descriptions), np.uint8, len(descriptions))
+        keys = np.fromiter((seen[d][1] for d in descriptions), np.uint64, len(descriptions))
+        return codes, keys
+
+
+def _account_ids(
+    store: TransactionStore, batch: Batch, account: str, account_type: str
+) -> np.ndarray:
+    if batch.accounts is None:
+        return np.full(len(batch), store.account_id(account, account_type), dtype=np.uint16)
+    ids = {
+        name: store.account_id(name or account, account_type)
+        for name in dict.fromkeys(batch.accounts)
+    }
+    return np.fromiter((ids[name] for name in batch.accounts), np.uint16, len(batch))
+
+
+def _given_categories(batch: Batch, codes: np.ndarray) -> np.ndarray:
+    """Prefer a recognised ``category`` column value over keyword matching."""
+    if batch.categories is None:
+        return codes
+    given = {name: category_code(name) for name in set(batch.categories)}
+    if all(code is None for code in given.values()):
+        return codes
+    override = np.fromiter(
+        (-1 if given[name] is None else given[name] for name in batch.categories),
+        np.int16,
+        len(batch),
+    )
+    return np.where(override >= 0, override, codes).astype(np.uint8)
+
+
+def import_csv(
+    store: TransactionStore,
+    source: str | Path,
+    account_type: str = "checking",
+    account: str | None = None,
+    chunk_rows: int = CHUNK_ROWS,
+    dayfirst: bool = False,
+    today: date | None = None,
+) -> ImportReport:
+    """Stream ``source`` into ``store``, skipping rows it already holds.
+
+    Rows without an ``account`` column go to ``account`` (default: the
+    account type), so monthly exports of one account dedupe against each
+    other.
+    """
+    batches = read_batches(source, chunk_rows, dayfirst, today)
+    return import_batches(store, batches, str(source), account_type, account)
+
+
+def import_batches(
+    store: TransactionStore,
+    batches: Iterable[Batch],
+    source: str,
+    account_type: str = "checking",
+    account: str | None = None,
+) -> ImportReport:
+    """Append each batch's new rows to ``store`` in one write.
+
+    ``batches`` is consumed lazily inside the writer, so a producer such as
+    the PDF statement pipeline streams straight into the store. Identical
+    rows are numbered across the whole import, so how a source is split
+    into batches does not change which rows count as new.
+    """
+    started = time.perf_counter()
+    report = ImportReport(source)
+    encoder = _Encoder()
+    occurrences = IdentityCounts()
+    account = account or account_type
+    with store.writer() as writer:
+        for batch in batches:
+            report.rejected += batch.rejected
+            if not len(batch):
+                continue
+            codes, keys = encoder.encode(batch.descriptions)
+            codes = _given_categories(batch, codes)
+            accounts = _account_ids(store, batch, account, account_type)
+            hashes = transaction_hashes(batch.dates, batch.amounts, accounts, keys, occurrences)
+
+            fresh = ~store.contains(hashes)
+            report.duplicates += int(len(batch) - fresh.sum())
+            if not fresh.any():
+                continue
+            dates, amounts, codes = batch.dates[fresh], batch.amounts[fresh], codes[fresh]
+            descriptions = (
+                batch.descriptions
+                if fresh.all()
+                else [batch.descriptions[i] for i in np.flatnonzero(fresh)]
+            )
+            writer.append(dates, amounts, codes, accounts[fresh], hashes[fresh], descriptions)
+
+            report.imported += len(dates)
+            report.categorized += int((codes != UNCATEGORIZED_CODE).sum())
+            low, high = int(dates.min()), int(dates.max())
+            report.first_day = low if report.first_day is None else min(report.first_day, low)
+            report.last_day = high if report.last_day is None else max(report.last_day, high)
+            counts = np.bincount(codes, minlength=UNCATEGORIZED_CODE + 1)
+            totals = np.bincount(codes, weights=amounts, minlength=UNCATEGORIZED_CODE + 1)
+            for code in np.flatnonzero(counts):
+                count, cents = report.by_category.get(int(code), (0, 0))
+                report.by_category[int(code)] = (
+                    count + int(counts[code]),
+                    cents + int(totals[code]),
+                )
+    report.seconds = time.perf_counter() - started
+    return report
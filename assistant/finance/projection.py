@@ -0,0 +1,322 @@
+"""Monte Carlo engine behind ``/finance project``.
+
+A plan turns a scenario into a schedule of monthly cash flows
+(contributions in, withdrawals out). The engine grows a balance along
+thousands of paths at once. Each path draws lognormal monthly returns whose
+mean matches the scenario's annual return, and cash flows are added at the
+end of each month. Results are percentile bands of the balance over time,
+the share of paths that meet the plan's goal, and the zero-volatility
+expected path.
+
+Paths are simulated in fixed-size chunks, each with its own child of one
+``SeedSequence``. The chunks of large runs are spread over a process pool.
+Because chunking does not depend on the pool, a given ``seed`` reproduces
+the same bands whether a run is inline or parallel.
+"""
+
+import math
+import os
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from typing import Protocol
+
+import numpy as np
+
+from assistant.finance.workers import process_pool
+
+PERCENTILES = (5, 25, 50, 75, 95)
+CHUNK_PATHS = 2_000
+# Path-months simulated inline at ~30M/s. Below this, spawning workers costs
+# more than it saves.
+POOL_THRESHOLD = 50_000_000
+MAX_MONTHS = 12 * 80
+
+
+@dataclass(frozen=True, slots=True)
+class Scenario:
+    """Annual rates from the "Scenario Parameters" table in the finance docs.
+
+    ``volatility`` is the annual standard deviation of investment returns,
+    following the table's risk level.
+    """
+
+    name: str
+    income_growth: float
+    expense_growth: float
+    investment_return: float
+    volatility: float
+
+
+SCENARIOS = {
+    "conservative": Scenario("conservative", 0.02, 0.03, 0.05, 0.08),
+    "moderate": Scenario("moderate", 0.04, 0.03, 0.07, 0.12),
+    "aggressive": Scenario("aggressive", 0.06, 0.02, 0.10, 0.18),
+}
+
+
+def monthly_rate(annual: float) -> float:
+    return (1 + annual) ** (1 / 12) - 1
+
+
+class Plan(Protocol):
+    start_balance: float
+
+    def returns(self, scenario: Scenario) -> Scenario: ...
+
+    def cashflows(self, scenario: Scenario, months: int) -> np.ndarray: ...
+
+    def succeeded(self, balances: np.ndarray, depleted: np.ndarray) -> np.ndarray: ...
+
+
+@dataclass(frozen=True, slots=True)
+class RetirementPlan:
+    """Contribute until retirement age, then withdraw.
+
+    Contributions rise with the scenario's income growth. Withdrawals are
+    given in today's money and rise with its expense growth. A path
+    succeeds if the balance never runs out.
+    """
+
+    current_age: int
+    retirement_age: int
+    current_savings: float
+    monthly_contribution: float
+    monthly_withdrawal: float = 0.0
+
+    @property
+    def start_balance(self) -> float:
+        return self.current_savings
+
+    def returns(self, scenario: Scenario) -> Scenario:
+        return scenario
+
+    def cashflows(self, scenario: Scenario, months: int) -> np.ndarray:
+        month = np.arange(months)
+        working = max(0, min(months, (self.retirement_age - self.current_age) * 12))
+        income = (1 + monthly_rate(scenario.income_growth)) ** month
+        prices = (1 + monthly_rate(scenario.expense_growth)) ** month
+        return np.where(
+            month < working,
+            self.monthly_contribution * income,
+            -self.monthly_withdrawal * prices,
+        )
+
+    def succeeded(self, balances: np.ndarray, depleted: np.ndarray) -> np.ndarray:
+        return ~depleted
+
+
+@dataclass(frozen=True, slots=True)
+class SavingsPlan:
+    """Save a fixed amount each month towards a goal."""
+
+    current_savings: float
+    monthly_contribution: float
+    goal_amount: float
+
+    @property
+    def start_balance(self) -> float:
+        return self.current_savings
+
+    def returns(self, scenario: Scenario) -> Scenario:
+        return scenario
+
+    def cashflows(self, scenario: Scenario, months: int) -> np.ndarray:
+        return np.full(months, self.monthly_contribution, dtype=np.float64)
+
+    def succeeded(self, balances: np.ndarray, depleted: np.ndarray) -> np.ndarray:
+        return balances[:, -1] >= self.goal_amount
+
+
+@dataclass(frozen=True, slots=True)
+class DebtPayoffPlan:
+    """Pay a fixed amount each month against a balance accruing interest.
+
+    ``apr`` is the nominal annual rate, compounded monthly. The balance
+    grows at that rate whatever the scenario, so every path is the
+    expected path. A path succeeds if the debt is paid off within the
+    horizon.
+    """
+
+    balance: float
+    apr: float
+    monthly_payment: float
+
+    @property
+    def start_balance(self) -> float:
+        return self.balance
+
+    def returns(self, scenario: Scenario) -> Scenario:
+        annual = (1 + self.apr / 12) ** 12 - 1
+        return replace(scenario, investment_return=annual, volatility=0.0)
+
+    def cashflows(self, scenario: Scenario, months: int) -> np.ndarray:
+        return np.full(months, -self.monthly_payment, dtype=np.float64)
+
+    def succeeded(self, balances: np.ndarray, depleted: np.ndarray) -> np.ndarray:
+        return depleted | (balances[:, -1] <= 0)
+
+
+@dataclass(slots=True)
+class Projection:
+    """Balance percentiles for one scenario at the reported months."""
+
+    scenario: Scenario
+    months: np.ndarray  # month offsets, 0 is today
+    bands: dict[int, np.ndarray]  # percentile: balance at each reported month
+    expected: np.ndarray  # zero-volatility path at the reported months
+    success_rate: float
+    paths: int
+
+    def as_dict(self) -> dict:
+        return {
+            "scenario": self.scenario.name,
+            "paths": self.paths,
+            "successRate": round(self.success_rate, 4),
+            "points": [
+                {
+                    "month": int(month),
+                    "expected": round(float(self.expected[i]), 2),
+                    **{f"p{q}": round(float(band[i]), 2) for q, band in self.bands.items()},
+                }
+                for i, month in enumerate(self.months)
+            ],
+        }
+
+
+# -- simulation -------------------------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class _Chunk:
+    start: float
+    flows: np.ndarray
+    mu: float  # mean monthly log-return
+    sigma: float  # monthly log-return standard deviation
+    paths: int
+    seed: np.random.SeedSequence
+    points: np.ndarray
+
+
+def _simulate(chunk: _Chunk) -> tuple[np.ndarray, np.ndarray]:
+    """Balances at ``chunk.points`` for each path, and which paths ran dry."""
+    rng = np.random.default_rng(chunk.seed)
+    months = len(chunk.flows)
+    growth = rng.standard_normal((months, chunk.paths))
+    growth *= chunk.sigma
+    growth += chunk.mu
+    np.exp(growth, out=growth)
+
+    balance = np.full(chunk.paths, chunk.start, dtype=np.float64)
+    depleted = np.zeros(chunk.paths, dtype=bool)
+    out = np.empty((chunk.paths, len(chunk.points)))
+    slots = np.full(months + 1, -1)
+    slots[chunk.points] = np.arange(len(chunk.points))
+    if slots[0] >= 0:
+        out[:, slots[0]] = balance
+    for month, flow in enumerate(chunk.flows.tolist()):
+        balance *= growth[month]
+        balance += flow
+        if flow < 0:
+            depleted |= balance <= 0
+            np.maximum(balance, 0, out=balance)
+        if slots[month + 1] >= 0:
+            out[:, slots[month + 1]] = balance
+    return out, depleted
+
+
+def _log_params(scenario: Scenario) -> tuple[float, float]:
+    """Monthly lognormal parameters whose mean growth is the scenario return."""
+    sigma = scenario.volatility / math.sqrt(12)
+    return math.log1p(scenario.investment_return) / 12 - sigma**2 / 2, sigma
+
+
+def report_points(months: int, step: int | None = None) -> np.ndarray:
+    """Month offsets to report: monthly up to five years, yearly beyond."""
+    step = step or (1 if months <= 60 else 12)
+    points = list(range(0, months + 1, step))
+    if points[-1] != months:
+        points.append(months)
+    return np.array(points)
+
+
+def expected_path(plan: Plan, scenario: Scenario, months: int) -> np.ndarray:
+    """Balance month by month with every return at its mean, floored at zero."""
+    rate = monthly_rate(plan.returns(scenario).investment_return)
+    balance = np.empty(months + 1)
+    balance[0] = plan.start_balance
+    for month, flow in enumerate(plan.cashflows(scenario, months)):
+        balance[month + 1] = max(balance[month] * (1 + rate) + flow, 0.0)
+    return balance
+
+
+def project(
+    plan: Plan,
+    scenarios: Iterable[Scenario | str] = ("moderate",),
+    months: int = 12,
+    paths: int = 10_000,
+    seed: int | None = None,
+    workers: int | None = None,
+    step: int | None = None,
+) -> list[Projection]:
+    """Run ``paths`` Monte Carlo paths per scenario.
+
+    ``workers=0`` runs inline; ``None`` uses a process pool sized to the
+    machine once the run is large enough to pay for it. Pass ``seed`` for
+    reproducible results.
+    """
+    if not 1 <= months <= MAX_MONTHS:
+        raise ValueError(f"months must be between 1 and {MAX_MONTHS}")
+    if paths < 1:
+        raise ValueError("paths must be positive")
+    resolved = [SCENARIOS[s] if isinstance(s, str) else s for s in scenarios]
+    points = report_points(months, step)
+    root = np.random.SeedSequence(seed)
+
+    jobs: list[list[_Chunk]] = []
+    for scenario, scenario_seed in zip(resolved, root.spawn(len(resolved))):
+        flows = plan.cashflows(scenario, months)
+        mu, sigma = _log_params(plan.returns(scenario))
+        sizes = [CHUNK_PATHS] * (paths // CHUNK_PATHS)
+        if paths % CHUNK_PATHS:
+            sizes.append(paths % CHUNK_PATHS)
+        seeds = scenario_seed.spawn(len(sizes))
+        jobs.append(
+            [
+                _Chunk(plan.start_balance, flows, mu, sigma, size, chunk_seed, points)
+                for size, chunk_seed in zip(sizes, seeds)
+            ]
+        )
+
+    chunks = [chunk for scenario_jobs in jobs for chunk in scenario_jobs]
+    if workers is None:
+        workers = 0 if paths * months * len(resolved) < POOL_THRESHOLD else os.cpu_count() or 1
+    if workers > 1 and len(chunks) > 1:
+        with process_pool(min(workers, len(chunks))) as pool:
+            results = list(pool.map(_simulate, chunks))
+    else:
+        results = [_simulate(chunk) for chunk in chunks]
+
+    projections = []
+    done = 0
+    for scenario, scenario_jobs in zip(resolved, jobs):
+        part = results[done : done + len(scenario_jobs)]
+        done += len(scenario_jobs)
+        balances = np.concatenate([balances for balances, _ in part])
+        depleted = np.concatenate([flags for _, flags in part])
+        bands = np.percentile(balances, PERCENTILES, axis=0)
+        projections.append(
+            Projection(
+                scenario=scenario,
+                months=points,
+                bands=dict(zip(PERCENTILES, bands)),
+                expected=expected_path(plan, scenario, months)[points],
+                success_rate=float(plan.succeeded(balances, depleted).mean()),
+                paths=paths,
+            )
+        )
+    return projections
+
+
+def with_return(scenario: Scenario, annual_return: float | None) -> Scenario:
+    """The scenario with its investment return overridden, if one is given."""
+    return scenario if annual_return is None else replace(scenario, investment_return=annual_return)
@@ -0,0 +1,162 @@
+"""Chunked CSV reader for bank and card exports.
+
+Reads ``date,description,amount`` files (plus the optional ``category`` and
+``account`` columns from the command reference) a fixed number of rows at a
+time, so memory depends on the chunk size and not on the file. Values are
+converted to the store's column types: dates become days since 1970-01-01
+and amounts become integer cents.
+"""
+
+import csv
+import itertools
+import math
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+
+REQUIRED_COLUMNS = ("date", "description", "amount")
+OPTIONAL_COLUMNS = ("category", "account")
+CHUNK_ROWS = 100_000
+
+_EPOCH = date(1970, 1, 1).toordinal()
+_STRINGS = np.dtypes.StringDType()
+# Distinct date strings remembered between chunks.
+_DATE_CACHE_SIZE = 100_000
+
+
+class CSVFormatError(ValueError):
+    """A CSV file that lacks the columns an import needs."""
+
+
+@dataclass(slots=True)
+class Batch:
+    """One chunk of valid rows as columns, plus how many rows were dropped."""
+
+    dates: np.ndarray  # int32 days since the epoch
+    amounts: np.ndarray  # int64 cents, negative for money out
+    descriptions: list[str]
+    categories: list[str] | None
+    accounts: list[str] | None
+    rejected: int
+
+    def __len__(self) -> int:
+        return len(self.descriptions)
+
+
+def to_days(day: date) -> int:
+    return day.toordinal() - _EPOCH
+
+
+def from_days(days: int) -> date:
+    return date.fromordinal(int(days) + _EPOCH)
+
+
+def parse_date(text: str, dayfirst: bool = False) -> int | None:
+    """Days since the epoch for YYYY-MM-DD, MM/DD/YYYY or DD/MM/YYYY.
+
+    Slashed dates are month-first unless ``dayfirst`` is set or the first
+    field cannot be a month.
+    """
+    text = text.strip()
+    try:
+        if "/" in text:
+            first, second, year = (int(part) for part in text.split("/"))
+            if year < 100:
+                year += 2000
+            if dayfirst or first > 12:
+                first, second = second, first
+            return to_days(date(year, first, second))
+        year, month, day = (int(part) for part in text[:10].replace("/", "-").split("-"))
+        return to_days(date(year, month, day))
+    except ValueError:
+        return None
+
+
+def parse_amount(text: str) -> float:
+    """Amount as a float; ``$1,234.50`` and ``(12.00)`` are understood."""
+    text = text.strip().replace("$", "").replace(",", "").replace(" ", "")
+    negative = text.startswith("(") and text.endswith(")")
+    try:
+        value = float(text.strip("()"))
+    except ValueError:
+        return math.nan
+    return -value if negative else value
+
+
+def _amounts(values: tuple[str, ...]) -> np.ndarray:
+    try:
+        return np.array(values, dtype=_STRINGS).astype(np.float64)
+    except ValueError:
+        return np.fromiter((parse_amount(v) for v in values), np.float64, len(values))
+
+
+def read_batches(
+    path: str | Path,
+    chunk_rows: int = CHUNK_ROWS,
+    dayfirst: bool = False,
+    today: date | None = None,
+) -> Iterator[Batch]:
+    """Yield the file's valid rows ``chunk_rows`` at a time.
+
+    Rows with an unreadable date or amount, a zero amount or a date after
+    ``today`` are dropped and counted in ``Batch.rejected``.
+    """
+    latest = to_days(today or date.today())
+    date_cache: dict[str, int] = {}
+    with open(path, encoding="utf-8-sig", newline="", errors="replace") as handle:
+        reader = csv.reader(handle)
+        header = [name.strip().lower() for name in next(reader, [])]
+        missing = [name for name in REQUIRED_COLUMNS if name not in header]
+        if missing:
+            raise CSVFormatError(f"{path}: missing column(s) {', '.join(missing)}")
+        index = {
+            name: header.index(name)
+            for name in (*REQUIRED_COLUMNS, *OPTIONAL_COLUMNS)
+            if name in header
+        }
+        width = max(index.values()) + 1
+
+        while True:
+            rows = list(itertools.islice(reader, chunk_rows))
+            if not rows:
+                return
+            short = len(rows)
+            rows = [row for row in rows if len(row) >= width]
+            short -= len(rows)
+            if not rows:
+                yield Batch(np.empty(0, np.int32), np.empty(0, np.int64), [], None, None, short)
+                continue
+            columns = list(zip(*rows))
+
+            if len(date_cache) > _DATE_CACHE_SIZE:
+                date_cache.clear()
+            raw_dates = columns[index["date"]]
+            for text in set(raw_dates).difference(date_cache):
+                parsed = parse_date(text, dayfirst)
+                date_cache[text] = -1 if parsed is None else parsed
+            dates = np.fromiter((date_cache[text] for text in raw_dates), np.int64, len(rows))
+            amounts = _amounts(columns[index["amount"]])
+
+            cents = np.rint(np.nan_to_num(amounts, nan=0.0) * 100).astype(np.int64)
+            keep = (dates >= 0) & (dates <= latest) & np.isfinite(amounts) & (cents != 0)
+            selected = np.flatnonzero(keep)
+            everything = len(selected) == len(rows)
+
+            def column(name: str) -> list[str] | None:
+                if name not in index:
+                    return None
+                values = columns[index[name]]
+                return list(values) if everything else [values[i] for i in selected]
+
+            descriptions = column("description")
+            yield Batch(
+                dates=dates[keep].astype(np.int32),
+                amounts=cents[keep],
+                descriptions=[text.strip() for text in descriptions],
+                categories=column("category"),
+                accounts=column("account"),
+                rejected=short + len(rows) - len(selected),
+            )
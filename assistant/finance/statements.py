@@ -0,0 +1,404 @@
+"""PDF bank and card statements as a source for ``main.py finance import``.
+
+This replaces running ``extract_pdf_statements.py`` over every PDF and then
+importing the CSV it writes. Each PDF is identified by the SHA-256 of its
+bytes. The lines read from a statement are cached under that digest, so a
+folder of statements that gains one PDF a month only extracts the new one.
+
+Uncached PDFs are split into page ranges and read on a process pool with
+``pdfplumber`` (an optional dependency, ``pip install pdfplumber``). A line
+counts as a transaction if it starts with a date and ends with an amount,
+optionally followed by a running balance. Once all of a statement's pages
+are read, its rows become one ``Batch`` that goes straight to
+``import_batches``; there is no intermediate CSV.
+
+Dates without a year (``01/15``, ``Jan 15``) take it from the statement
+period in the header. A December row on a statement that closes in
+January belongs to the year before.
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, wait
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+
+from assistant.finance.ingest import ImportReport, import_batches
+from assistant.finance.reader import Batch, from_days, parse_amount, parse_date, to_days
+from assistant.finance.store import TransactionStore
+from assistant.finance.workers import process_pool
+from assistant.paths import data_dir
+
+# Bump when the line parser changes, so cached statements are read again.
+PARSER_VERSION = 1
+PAGES_PER_TASK = 4
+# Pages read inline at ~7/s. Below this, spawning workers costs more than
+# it saves.
+POOL_THRESHOLD = 16
+# For guessing page counts from file sizes before deciding on a pool;
+# scanned and font-heavy statements run larger, text-only ones smaller.
+BYTES_PER_PAGE = 50_000
+
+_MONTHS = ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec")
+_NAMED = rf"(?:{'|'.join(m.title() for m in _MONTHS)})[a-z]*\.?\s+\d{{1,2}}"
+_YEAR = r"(?:19|20)\d\d"
+_DATE = rf"\d{{4}}-\d{{2}}-\d{{2}}|\d{{1,2}}/\d{{1,2}}(?:/\d{{2,4}})?|{_NAMED}(?:,?\s+{_YEAR})?"
+_FULL_DATE = re.compile(
+    rf"\d{{4}}-\d{{2}}-\d{{2}}|\d{{1,2}}/\d{{1,2}}/\d{{2,4}}|{_NAMED},?\s+{_YEAR}"
+)
+_AMOUNT = r"[-+]?\(?-?\$?\d[\d,]*\.\d\d\)?"
+_ROW = re.compile(
+    rf"^(?P<date>{_DATE})\s+(?:(?:{_DATE})\s+)?(?P<description>.+?)\s+"
+    rf"(?P<amount>{_AMOUNT})(?:\s?(?P<mark>CR|DR))?(?:\s+{_AMOUNT})?$"
+)
+_SUMMARY = re.compile(
+    r"\b(?:beginning|opening|ending|closing|previous|new|daily)\s+balance\b|^(?:sub)?total\b",
+    re.IGNORECASE,
+)
+_HEADER = re.compile(r"statement|period|closing|through|ending|opening", re.IGNORECASE)
+_NAMED_PARTS = re.compile(r"([A-Za-z]{3})[a-z]*\.?\s+(\d{1,2})(?:,?\s+(\d{4}))?$")
+
+Line = tuple[str, str, str]  # date, description, amount as printed
+
+
+class StatementError(ValueError):
+    """A PDF that cannot be read as a statement."""
+
+
+def default_cache_dir() -> Path:
+    return data_dir() / "statements"
+
+
+@dataclass(frozen=True, slots=True)
+class Statement:
+    """The transaction lines read from one PDF."""
+
+    source: str
+    digest: str
+    pages: int
+    lines: list[Line]
+    period: list[str]  # full dates found on header lines
+    cached: bool
+
+
+@dataclass(slots=True)
+class ExtractSummary:
+    statements: int = 0
+    cached: int = 0
+    pages: int = 0  # pages read this run
+    repeated: int = 0  # PDFs whose bytes match an earlier one in the run
+    seconds: float = 0.0
+
+
+# -- reading pages ----------------------------------------------------------
+
+
+def _pdfplumber():
+    try:
+        import pdfplumber
+    except ImportError:
+        raise StatementError("reading PDF statements needs pdfplumber: pip install pdfplumber")
+    return pdfplumber
+
+
+def parse_lines(text: str) -> tuple[list[Line], list[str]]:
+    """Transaction lines and header dates in one page's text."""
+    lines: list[Line] = []
+    period: list[str] = []
+    for raw in text.splitlines():
+        raw = " ".join(raw.split())
+        match = _ROW.match(raw)
+        if match and not _SUMMARY.search(match["description"]):
+            amount = match["amount"] + (f" {match['mark']}" if match["mark"] else "")
+            lines.append((match["date"], match["description"], amount))
+        elif not match and _HEADER.search(raw):
+            period.extend(found.group() for found in _FULL_DATE.finditer(raw))
+    return lines, period
+
+
+def _read_pages(path: str, first: int, stop: int | None) -> tuple[int, list[Line], list[str]]:
+    """Page count, then lines and header dates from pages ``first:stop``."""
+    try:
+        with _pdfplumber().open(path) as pdf:
+            lines: list[Line] = []
+            period: list[str] = []
+            for page in pdf.pages[first:stop]:
+                page_lines, page_period = parse_lines(page.extract_text() or "")
+                lines += page_lines
+                period += page_period
+                page.close()
+            return len(pdf.pages), lines, period
+    except StatementError:
+        raise
+    except Exception as exc:
+        raise StatementError(f"{path}: cannot read PDF ({exc})") from exc
+
+
+def _estimated_pages(path: str) -> int:
+    return max(1, os.path.getsize(path) // BYTES_PER_PAGE)
+
+
+# -- cache ------------------------------------------------------------------
+
+
+class StatementCache:
+    """Lines read from each PDF, one JSON file per content digest."""
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path) if path else default_cache_dir()
+
+    def _file(self, digest: str) -> Path:
+        return self.path / digest[:2] / f"{digest}.json"
+
+    def get(self, digest: str, source: str) -> Statement | None:
+        try:
+            entry = json.loads(self._file(digest).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if entry.get("version") != PARSER_VERSION:
+            return None
+        lines = [tuple(line) for line in entry["lines"]]
+        return Statement(source, digest, entry["pages"], lines, entry["period"], cached=True)
+
+    def put(self, statement: Statement) -> None:
+        target = self._file(statement.digest)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "version": PARSER_VERSION,
+            "source": Path(statement.source).name,
+            "pages": statement.pages,
+            "lines": statement.lines,
+            "period": statement.period,
+        }
+        partial = target.with_suffix(".tmp")
+        partial.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+        os.replace(partial, target)
+
+
+def file_digest(path: str | Path) -> str:
+    with open(path, "rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+# -- extraction -------------------------------------------------------------
+
+
+def extract(
+    paths: Iterable[str | Path],
+    cache: StatementCache | None = None,
+    workers: int | None = None,
+    summary: ExtractSummary | None = None,
+) -> Iterator[Statement]:
+    """Yield each distinct PDF's statement, in input order.
+
+    The order does not depend on which PDFs were cached or on how their
+    pages finish, so identical rows in different statements are numbered
+    the same way by every import. ``workers=0`` reads inline; ``None`` uses
+    a process pool sized to the machine once there are enough pages to pay
+    for it.
+    """
+    summary = summary if summary is not None else ExtractSummary()
+    started = time.perf_counter()
+    seen: set[str] = set()
+    pending: list[tuple[str, str]] = []
+    found: list[Statement | None] = []  # None where the PDF still has to be read
+    for path in paths:
+        path = str(path)
+        try:
+            digest = file_digest(path)
+        except OSError as exc:
+            raise StatementError(f"{path}: {exc.strerror or exc}") from exc
+        if digest in seen:
+            summary.repeated += 1
+            continue
+        seen.add(digest)
+        statement = cache.get(digest, path) if cache else None
+        if statement is None:
+            pending.append((path, digest))
+        found.append(statement)
+
+    with closing(_read_statements(pending, workers)) as read:
+        for statement in found:
+            if statement is None:
+                statement = next(read)
+                if cache:
+                    cache.put(statement)
+                summary.pages += statement.pages
+            else:
+                summary.cached += 1
+            summary.statements += 1
+            yield statement
+    summary.seconds = time.perf_counter() - started
+
+
+def _read_statements(pending: list[tuple[str, str]], workers: int | None) -> Iterator[Statement]:
+    """The statements of ``pending``, in that order."""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    estimate = sum(_estimated_pages(path) for path, _ in pending)
+    if workers <= 1 or not pending or estimate < POOL_THRESHOLD:
+        for path, digest in pending:
+            pages, lines, period = _read_pages(path, 0, None)
+            yield Statement(path, digest, pages, lines, period, cached=False)
+        return
+
+    # Each PDF's first range also brings back its page count, and the rest
+    # of its ranges are queued then. Ranges of every statement are in
+    # flight at once, so a statement with many pages does not hold up the
+    # short ones; finished statements wait until those before them are done.
+    with process_pool(workers) as pool:
+        futures = {
+            pool.submit(_read_pages, path, 0, PAGES_PER_TASK): (index, 0)
+            for index, (path, _) in enumerate(pending)
+        }
+        parts: dict[int, dict[int, tuple[list[Line], list[str]]]] = {}
+        counts: dict[int, int] = {}
+        ready: dict[int, Statement] = {}
+        upcoming = 0
+        while futures:
+            finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index, first = futures.pop(future)
+                pages, lines, period = future.result()
+                path, digest = pending[index]
+                if not first:
+                    counts[index] = pages
+                    for start in range(PAGES_PER_TASK, pages, PAGES_PER_TASK):
+                        queued = pool.submit(_read_pages, path, start, start + PAGES_PER_TASK)
+                        futures[queued] = (index, start)
+                done = parts.setdefault(index, {})
+                done[first] = (lines, period)
+                if len(done) < -(-max(counts[index], 1) // PAGES_PER_TASK):
+                    continue
+                ranges = [done[start] for start in sorted(parts.pop(index))]
+                ready[index] = Statement(
+                    path,
+                    digest,
+                    counts[index],
+                    [line for lines, _ in ranges for line in lines],
+                    [day for _, days in ranges for day in days],
+                    cached=False,
+                )
+            while upcoming in ready:
+                yield ready.pop(upcoming)
+                upcoming += 1
+
+
+# -- rows -------------------------------------------------------------------
+
+
+def _named_date(text: str, year: int | None) -> date | None:
+    match = _NAMED_PARTS.match(text)
+    if not match or match[1].lower() not in _MONTHS:
+        return None
+    month = _MONTHS.index(match[1].lower()) + 1
+    try:
+        return date(int(match[3] or year), month, int(match[2]))
+    except (TypeError, ValueError):
+        return None
+
+
+def _day(text: str, closing: date | None, dayfirst: bool) -> int | None:
+    """Days since the epoch, borrowing the year from ``closing`` if missing."""
+    if text[0].isalpha():
+        parsed = _named_date(text, None)
+        if parsed is None and closing is not None:
+            parsed = _named_date(text, closing.year)
+            if parsed is not None and parsed > closing:
+                parsed = _named_date(text, closing.year - 1)
+        return None if parsed is None else to_days(parsed)
+    if text.count("/") == 1:
+        if closing is None:
+            return None
+        first, second = text.split("/")
+        month, day = (second, first) if dayfirst else (first, second)
+        days = parse_date(f"{month}/{day}/{closing.year}")
+        if days is not None and days > to_days(closing):
+            days = parse_date(f"{month}/{day}/{closing.year - 1}")
+        return days
+    return parse_date(text, dayfirst)
+
+
+def _closing(statement: Statement, dayfirst: bool) -> date | None:
+    """The last date named on a header line, else on a transaction line."""
+    for candidates in (statement.period, [line[0] for line in statement.lines]):
+        days = [_day(text, None, dayfirst) for text in candidates]
+        days = [day for day in days if day is not None]
+        if days:
+            return from_days(max(days))
+    return None
+
+
+def to_batch(
+    statement: Statement,
+    dayfirst: bool = False,
+    today: date | None = None,
+    charges_positive: bool = False,
+) -> Batch:
+    """The statement's valid rows, dropping the same rows a CSV import would.
+
+    Card statements print charges as positive amounts; with
+    ``charges_positive`` they are stored as money out. A trailing ``CR``
+    always marks money in and ``DR`` money out.
+    """
+    latest = to_days(today or date.today())
+    closing = _closing(statement, dayfirst)
+    dates, amounts, descriptions = [], [], []
+    for text, description, amount in statement.lines:
+        day = _day(text, closing, dayfirst)
+        mark = amount[-2:]
+        value = parse_amount(amount[:-3] if mark in ("CR", "DR") else amount)
+        cents = round(value * 100) if value == value else 0
+        if charges_positive:
+            cents = -cents
+        if mark == "CR":
+            cents = abs(cents)
+        elif mark == "DR":
+            cents = -abs(cents)
+        if day is None or day > latest or not cents:
+            continue
+        dates.append(day)
+        amounts.append(cents)
+        descriptions.append(description)
+    return Batch(
+        dates=np.array(dates, dtype=np.int32),
+        amounts=np.array(amounts, dtype=np.int64),
+        descriptions=descriptions,
+        categories=None,
+        accounts=None,
+        rejected=len(statement.lines) - len(dates),
+    )
+
+
+def import_statements(
+    store: TransactionStore,
+    paths: Iterable[str | Path],
+    account_type: str = "checking",
+    account: str | None = None,
+    cache: StatementCache | None = None,
+    workers: int | None = None,
+    dayfirst: bool = False,
+    today: date | None = None,
+) -> tuple[ImportReport, ExtractSummary]:
+    """Extract ``paths`` and stream their rows into ``store``.
+
+    Pass ``cache`` to skip PDFs read before. Statements already in the
+    store are found again by the import's deduplication, so importing the
+    whole folder every month adds only the new statement's rows.
+    """
+    paths = list(paths)
+    summary = ExtractSummary()
+    batches = (
+        to_batch(statement, dayfirst, today, charges_positive=account_type == "credit")
+        for statement in extract(paths, cache, workers, summary)
+    )
+    source = str(paths[0]) if len(paths) == 1 else f"{len(paths)} PDF statements"
+    return import_batches(store, batches, source, account_type, account), summary
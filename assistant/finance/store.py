@@ -0,0 +1,284 @@
+"""Append-only columnar transaction store.
+
+Each column is a flat file of one fixed-width type. Readers memory-map the
+files, and imports append to their ends:
+
+- ``date.col`` holds int32 days since 1970-01-01;
+- ``amount.col`` holds int64 cents;
+- ``category.col`` holds uint8 codes from ``categories.ALL_CATEGORIES``;
+- ``account.col`` holds uint16 ids into ``meta.json``'s account list;
+- ``hash.col`` holds the uint64 transaction hash used for deduplication;
+- ``text_end.col`` holds uint64 end offsets into ``description.txt``.
+
+``meta.json`` records how many rows are committed, and anything past that
+count is an interrupted import that is cut off on open. Transaction hashes
+are also kept sorted in 256 bucket files under ``hashes/``, split by their
+top byte, so membership checks are binary searches over small files.
+"""
+
+import json
+import mmap
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+
+from assistant.finance.categories import CATEGORY_NAMES
+from assistant.paths import data_dir
+
+FORMAT_VERSION = 1
+COLUMNS = {
+    "date": np.dtype(np.int32),
+    "amount": np.dtype(np.int64),
+    "category": np.dtype(np.uint8),
+    "account": np.dtype(np.uint16),
+    "hash": np.dtype(np.uint64),
+    "text_end": np.dtype(np.uint64),
+}
+TEXT_FILE = "description.txt"
+# Rows handled at a time when rebuilding the hash buckets.
+INDEX_BLOCK_ROWS = 1_000_000
+
+
+class StoreError(RuntimeError):
+    """A store directory that this version cannot read or extend."""
+
+
+def default_store_dir() -> Path:
+    return data_dir() / "finance"
+
+
+class TransactionStore:
+    """Transactions as memory-mapped typed columns.
+
+    ``column(name)`` returns a read-only view over the committed rows; add
+    rows inside ``with store.writer() as writer:``, which commits when the
+    block exits cleanly and rolls back otherwise.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path) if path else default_store_dir()
+        self.path.mkdir(parents=True, exist_ok=True)
+        (self.path / "hashes").mkdir(exist_ok=True)
+        self._maps: dict[str, np.ndarray] = {}
+        # Open bucket maps, kept between lookups until the buckets change.
+        self._buckets: dict[int, np.ndarray] = {}
+        self._meta = self._load_meta()
+        self._recover()
+
+    # -- metadata ---------------------------------------------------------
+
+    def _load_meta(self) -> dict:
+        meta_path = self.path / "meta.json"
+        if not meta_path.exists():
+            return {
+                "version": FORMAT_VERSION,
+                "rows": 0,
+                "indexed": 0,
+                "text_bytes": 0,
+                "categories": list(CATEGORY_NAMES),
+                "accounts": [],
+            }
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if meta.get("version") != FORMAT_VERSION:
+            raise StoreError(f"{self.path}: unsupported store version {meta.get('version')}")
+        if tuple(meta["categories"]) != CATEGORY_NAMES:
+            raise StoreError(f"{self.path}: built with a different category list; re-import")
+        return meta
+
+    def _save_meta(self) -> None:
+        tmp = self.path / "meta.json.tmp"
+        tmp.write_text(json.dumps(self._meta, indent=1), encoding="utf-8")
+        os.replace(tmp, self.path / "meta.json")
+
+    def _recover(self) -> None:
+        """Cut off rows past the committed count and finish any indexing."""
+        rows = self._meta["rows"]
+        for name, dtype in COLUMNS.items():
+            _truncate(self._column_path(name), rows * dtype.itemsize)
+        _truncate(self.path / TEXT_FILE, self._meta["text_bytes"])
+        if self._meta["indexed"] != rows:
+            self._index(0)
+
+    def __len__(self) -> int:
+        return self._meta["rows"]
+
+    @property
+    def accounts(self) -> list[dict[str, str]]:
+        return list(self._meta["accounts"])
+
+    def account_id(self, name: str, account_type: str) -> int:
+        """Id of the named account, registering it if new."""
+        for i, account in enumerate(self._meta["accounts"]):
+            if account["name"] == name:
+                return i
+        if len(self._meta["accounts"]) > np.iinfo(COLUMNS["account"]).max:
+            raise StoreError("too many accounts")
+        self._meta["accounts"].append({"name": name, "type": account_type})
+        return len(self._meta["accounts"]) - 1
+
+    # -- reading ----------------------------------------------------------
+
+    def _column_path(self, name: str) -> Path:
+        return self.path / f"{name}.col"
+
+    def column(self, name: str) -> np.ndarray:
+        """Read-only memory map of a column over the committed rows."""
+        rows = self._meta["rows"]
+        cached = self._maps.get(name)
+        if cached is not None and len(cached) == rows:
+            return cached
+        if rows == 0:
+            return np.empty(0, COLUMNS[name])
+        view = np.memmap(self._column_path(name), COLUMNS[name], mode="r", shape=(rows,))
+        self._maps[name] = view
+        return view
+
+    def descriptions(self, rows: Iterator[int] | np.ndarray) -> list[str]:
+        ends = self.column("text_end")
+        out = []
+        with open(self.path / TEXT_FILE, "rb") as handle:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as text:
+                for row in rows:
+                    start = int(ends[row - 1]) if row else 0
+                    out.append(text[start : int(ends[row])].decode("utf-8"))
+        return out
+
+    # -- deduplication ----------------------------------------------------
+
+    def _bucket_path(self, bucket: int) -> Path:
+        return self.path / "hashes" / f"{bucket:02x}.u8"
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        """Which of ``hashes`` belong to committed rows."""
+        found = np.zeros(len(hashes), dtype=bool)
+        if not len(hashes) or not self._meta["indexed"]:
+            return found
+        buckets = (hashes >> np.uint64(56)).astype(np.intp)
+        order = np.argsort(buckets, kind="stable")
+        bounds = np.searchsorted(buckets[order], np.arange(257))
+        for bucket in np.flatnonzero(np.diff(bounds)).tolist():
+            stored = self._bucket(bucket)
+            if not len(stored):
+                continue
+            members = order[bounds[bucket] : bounds[bucket + 1]]
+            probe = hashes[members]
+            at = np.minimum(np.searchsorted(stored, probe), len(stored) - 1)
+            found[members] = stored[at] == probe
+        return found
+
+    def _bucket(self, bucket: int) -> np.ndarray:
+        stored = self._buckets.get(bucket)
+        if stored is None:
+            path = self._bucket_path(bucket)
+            if path.exists() and path.stat().st_size:
+                stored = np.memmap(path, np.uint64, mode="r")
+            else:
+                stored = np.empty(0, np.uint64)
+            self._buckets[bucket] = stored
+        return stored
+
+    def _index(self, start: int) -> None:
+        """Add hashes of rows ``start`` onwards to the sorted buckets."""
+        if start == 0:
+            for path in (self.path / "hashes").glob("*.u8"):
+                path.unlink()
+        rows = self._meta["rows"]
+        touched: set[int] = set()
+        itemsize = COLUMNS["hash"].itemsize
+        for lo in range(start, rows, INDEX_BLOCK_ROWS):
+            # Read rather than map, so indexing a large import stays out of RSS.
+            block = np.fromfile(
+                self._column_path("hash"),
+                np.uint64,
+                count=min(INDEX_BLOCK_ROWS, rows - lo),
+                offset=lo * itemsize,
+            )
+            block.sort()
+            buckets = (block >> np.uint64(56)).astype(np.intp)
+            bounds = np.searchsorted(buckets, np.arange(257))
+            for bucket in np.flatnonzero(np.diff(bounds)):
+                with open(self._bucket_path(bucket), "ab") as out:
+                    out.write(block[bounds[bucket] : bounds[bucket + 1]].tobytes())
+                touched.add(int(bucket))
+        for bucket in touched:
+            path = self._bucket_path(bucket)
+            merged = np.sort(np.fromfile(path, np.uint64))
+            tmp = path.with_suffix(".tmp")
+            merged.tofile(tmp)
+            os.replace(tmp, path)
+        self._buckets.clear()
+        self._meta["indexed"] = rows
+        self._save_meta()
+
+    # -- writing ----------------------------------------------------------
+
+    @contextmanager
+    def writer(self) -> Iterator["_Writer"]:
+        start = self._meta["rows"]
+        writer = _Writer(self)
+        try:
+            yield writer
+            writer.close()
+        except BaseException:
+            writer.close()
+            self._meta = self._load_meta()
+            self._recover()
+            raise
+        self._maps.clear()
+        self._meta["rows"] = start + writer.rows
+        self._meta["text_bytes"] = writer.text_bytes
+        self._save_meta()
+        self._index(start)
+
+
+class _Writer:
+    """Appends batches to the column files of an open store."""
+
+    def __init__(self, store: TransactionStore) -> None:
+        self.store = store
+        self.rows = 0
+        self.text_bytes = store._meta["text_bytes"]
+        self._files = {name: open(store._column_path(name), "ab") for name in COLUMNS}
+        self._text = open(store.path / TEXT_FILE, "ab")
+
+    def append(
+        self,
+        dates: np.ndarray,
+        amounts: np.ndarray,
+        categories: np.ndarray,
+        accounts: np.ndarray,
+        hashes: np.ndarray,
+        descriptions: list[str],
+    ) -> None:
+        encoded = [text.encode("utf-8") for text in descriptions]
+        lengths = np.fromiter(map(len, encoded), np.uint64, len(encoded))
+        ends = np.cumsum(lengths, dtype=np.uint64) + np.uint64(self.text_bytes)
+        values = {
+            "date": dates,
+            "amount": amounts,
+            "category": categories,
+            "account": accounts,
+            "hash": hashes,
+            "text_end": ends,
+        }
+        for name, dtype in COLUMNS.items():
+            self._files[name].write(np.ascontiguousarray(values[name], dtype=dtype).tobytes())
+        self._text.write(b"".join(encoded))
+        self.rows += len(encoded)
+        self.text_bytes = int(ends[-1]) if len(ends) else self.text_bytes
+
+    def close(self) -> None:
+        for handle in (*self._files.values(), self._text):
+            handle.flush()
+            os.fsync(handle.fileno())
+            handle.close()
+
+
+def _truncate(path: Path, size: int) -> None:
+    if not path.exists():
+        path.touch()
+    elif path.stat().st_size > size:
+        os.truncate(path, size)
@@ -0,0 +1,15 @@
+"""The process pool the finance engines spread CPU-bound work over."""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+
+def process_pool(workers: int) -> ProcessPoolExecutor:
+    """A pool of ``workers`` spawned, not forked, processes.
+
+    A forked child gets a copy of every lock but only the calling thread.
+    A lock held by another thread at the fork (a briefing collector, a
+    BLAS or pdfminer thread) therefore stays locked in the child forever.
+    Spawned workers start from a fresh interpreter instead.
+    """
+    return ProcessPoolExecutor(workers, mp_context=get_context("spawn"))
@@ -0,0 +1,27 @@
+"""Incremental mail ingestion.
+
+``sync`` pulls only new or changed messages from a source into a local
+SQLite ``MailIndex``; the unread/actionable/flagged counts that
+``scan_inbox.scpt`` computes by walking every message are then answered
+from the index.
+"""
+
+from assistant.mail.index import InboxCounts, MailIndex, Watermark
+from assistant.mail.ingest import SyncReport, sync
+from assistant.mail.models import ACTIONABLE_KEYWORDS, MailMessage, is_actionable
+from assistant.mail.sources import MailboxDelta, MailSource, MaildirSource, MboxSource
+
+__all__ = [
+    "ACTIONABLE_KEYWORDS",
+    "InboxCounts",
+    "MailIndex",
+    "MailMessage",
+    "MailSource",
+    "MailboxDelta",
+    "MaildirSource",
+    "MboxSource",
+    "SyncReport",
+    "Watermark",
+    "is_actionable",
+    "sync",
+]
@@ -0,0 +1,120 @@
+"""Benchmark: incremental sync time versus mailbox size.
+
+Builds Maildirs of increasing size, indexes each once, delivers a fixed
+batch of new messages and times the follow-up sync, then marks one message
+read and times that sync. The full-index time grows with the mailbox; the
+delivery and flag-change syncs only list the changed directory, which stays
+in the milliseconds.
+"""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from assistant.mail.index import MailIndex
+from assistant.mail.ingest import sync
+from assistant.mail.sources import MaildirSource
+
+SUBJECTS = (
+    "Weekly digest",
+    "Meeting notes for Thursday",
+    "Invoice #4411",
+    "URGENT: action required on your account",
+    "Re: lunch?",
+    "Please review the design doc",
+)
+
+
+def write_message(folder: Path, sub: str, seq: int, delivered: int, flags: str = "") -> Path:
+    """Deliver one small synthetic message into ``folder/sub``."""
+    name = f"{delivered}.M{seq}P{os.getpid()}.bench"
+    if sub == "cur":
+        name += f":2,{flags}"
+    path = folder / sub / name
+    path.write_bytes(
+        (
+            f"Message-ID: <{seq}.{delivered}@bench.local>\r\n"
+            f"From: Sender {seq % 97} <sender{seq % 97}@example.com>\r\n"
+            f"Subject: {SUBJECTS[seq % len(SUBJECTS)]}\r\n"
+            f"Date: {time.strftime('%a, %d %b %Y %H:%M:%S +0000', time.gmtime(delivered))}\r\n"
+            "\r\n"
+            "Body text.\r\n"
+        ).encode()
+    )
+    return path
+
+
+def build_maildir(root: Path, size: int, now: int) -> Path:
+    """Create a Maildir holding ``size`` messages, mostly read, spread over a year."""
+    for sub in ("cur", "new", "tmp"):
+        (root / sub).mkdir(parents=True, exist_ok=True)
+    for seq in range(size):
+        flags = "S" if seq % 10 else "F"
+        write_message(root, "cur", seq, now - 86400 * 365 + seq * (86400 * 365 // size), flags)
+    # An established mailbox's cur/ has not been touched recently.
+    stale = now - 3600
+    for sub in ("cur", "new", "tmp"):
+        os.utime(root / sub, (stale, stale))
+    return root
+
+
+def run(sizes: tuple[int, ...] = (1_000, 10_000, 50_000), new: int = 20) -> list[dict]:
+    rows = []
+    now = int(time.time())
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            maildir = build_maildir(Path(tmp) / "Maildir", size, now)
+            with MailIndex(Path(tmp) / "index.sqlite3") as index:
+                started = time.perf_counter()
+                sync(index, MaildirSource(maildir))
+                full = time.perf_counter() - started
+
+                started = time.perf_counter()
+                sync(index, MaildirSource(maildir))
+                idle = time.perf_counter() - started
+
+                for seq in range(size, size + new):
+                    write_message(maildir, "new", seq, now - 60)
+                started = time.perf_counter()
+                reports = sync(index, MaildirSource(maildir))
+                incremental = time.perf_counter() - started
+
+                # Mark one message read: a rename within cur/, as a mail client does it.
+                unread = min((maildir / "cur").glob("*:2,F"))
+                unread.rename(unread.with_name(unread.name + "S"))
+                started = time.perf_counter()
+                flag_reports = sync(index, MaildirSource(maildir))
+                flag_change = time.perf_counter() - started
+
+                started = time.perf_counter()
+                counts = index.counts(now - 86400)
+                query = time.perf_counter() - started
+        rows.append(
+            {
+                "messages": size,
+                "full_sync_s": full,
+                "idle_sync_s": idle,
+                "incremental_sync_s": incremental,
+                "added": sum(r.added for r in reports),
+                "flag_sync_s": flag_change,
+                "changed": sum(r.changed for r in flag_reports),
+                "counts_query_s": query,
+                "unread_24h": counts.unread,
+            }
+        )
+    return rows
+
+
+def main(sizes: tuple[int, ...] = (1_000, 10_000, 50_000)) -> None:
+    print(f"{'messages':>9} {'full':>9} {'idle':>9} {'+new':>9} {'flag':>9} {'counts':>9}")
+    for row in run(sizes):
+        print(
+            f"{row['messages']:>9} {row['full_sync_s']:>8.3f}s {row['idle_sync_s']:>8.4f}s "
+            f"{row['incremental_sync_s']:>8.4f}s {row['flag_sync_s']:>8.4f}s "
+            f"{row['counts_query_s']:>8.5f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
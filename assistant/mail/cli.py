@@ -0,0 +1,107 @@
+"""``main.py mail`` subcommands."""
+
+import argparse
+import json
+import time
+from datetime import datetime
+
+from assistant.bench.metrics import EXTRACT, FETCH, FILTER, SERIALIZE, stage
+from assistant.mail import benchmark
+from assistant.mail.index import MailIndex
+from assistant.mail.ingest import sync
+from assistant.mail.sources import MaildirSource, MboxSource
+from assistant.triage.scorer import TriageScorer
+
+
+def register(subparsers) -> None:
+    parser = subparsers.add_parser("mail", help="incremental mail index")
+    parser.add_argument("--index", help="index file (default: in the assistant data dir)")
+    commands = parser.add_subparsers(dest="mail_command", required=True)
+
+    sync_parser = commands.add_parser("sync", help="pull new and changed messages")
+    source = sync_parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--maildir", help="Maildir, Maildir++ or directory of account Maildirs")
+    source.add_argument("--mbox", help="mbox file or directory of mbox files")
+    sync_parser.set_defaults(handler=_sync)
+
+    counts_parser = commands.add_parser("counts", help="unread/actionable/flagged counts")
+    counts_parser.add_argument("hours", nargs="?", type=int, default=24)
+    counts_parser.add_argument(
+        "--mailbox",
+        dest="mailboxes",
+        action="append",
+        help="count this mailbox instead of the inboxes (repeatable)",
+    )
+    counts_parser.set_defaults(handler=_counts)
+
+    triage_parser = commands.add_parser("triage", help="unread mail ranked by the priority matrix")
+    triage_parser.add_argument("hours", nargs="?", type=int, default=48)
+    triage_parser.add_argument("--top", type=int, default=25, help="how many messages to emit")
+    triage_parser.add_argument(
+        "--mailbox",
+        dest="mailboxes",
+        action="append",
+        help="rank this mailbox instead of the inboxes (repeatable)",
+    )
+    triage_parser.set_defaults(handler=_triage)
+
+    bench_parser = commands.add_parser("bench", help="incremental sync benchmark")
+    bench_parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    bench_parser.set_defaults(handler=_bench)
+
+
+def _sync(args: argparse.Namespace) -> int:
+    source = MaildirSource(args.maildir) if args.maildir else MboxSource(args.mbox)
+    with stage("mail.sync", FETCH), MailIndex(args.index) as index:
+        reports = sync(index, source)
+    with stage("mail.sync", SERIALIZE):
+        for report in reports:
+            state = "unchanged" if report.skipped else (
+                f"+{report.added} ~{report.changed} -{report.removed}"
+            )
+            print(f"{report.mailbox}: {state} ({report.seconds * 1000:.1f} ms)")
+    return 0
+
+
+def _counts(args: argparse.Namespace) -> int:
+    with stage("mail.counts", FETCH), MailIndex(args.index) as index:
+        counts = index.counts(time.time() - args.hours * 3600, args.mailboxes)
+    with stage("mail.counts", SERIALIZE):
+        text = json.dumps(counts.as_skill_result(args.hours))
+    print(text)
+    return 0
+
+
+def _triage(args: argparse.Namespace) -> int:
+    with stage("mail.triage", FETCH), MailIndex(args.index) as index:
+        since = time.time() - args.hours * 3600
+        counts = index.counts(since, args.mailboxes)
+        messages = index.unread(since, mailboxes=args.mailboxes)
+    with stage("mail.triage", FILTER):
+        ranked = TriageScorer().rank(messages, top=args.top)
+    with stage("mail.triage", EXTRACT):
+        result = counts.as_skill_result(args.hours) | {
+            "priorityOnly": False,
+            "ranked": [
+                {
+                    "score": triage.score,
+                    "category": triage.label,
+                    "sender": msg.sender,
+                    "subject": msg.subject,
+                    "dateReceived": datetime.fromtimestamp(msg.received_at).isoformat(
+                        timespec="minutes"
+                    ),
+                    "isFlagged": msg.is_flagged,
+                }
+                for msg, triage in ranked
+            ],
+        }
+    with stage("mail.triage", SERIALIZE):
+        text = json.dumps(result, indent=2, ensure_ascii=False)
+    print(text)
+    return 0
+
+
+def _bench(args: argparse.Namespace) -> int:
+    benchmark.main(tuple(args.sizes))
+    return 0
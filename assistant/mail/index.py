@@ -0,0 +1,269 @@
+"""SQLite-backed mail index with per-mailbox high-watermarks."""
+
+import json
+import sqlite3
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from assistant.mail.models import MailMessage
+from assistant.paths import data_dir
+from assistant.sqlite import select_in
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    mailbox       TEXT    NOT NULL,
+    key           TEXT    NOT NULL,
+    location      TEXT    NOT NULL DEFAULT '',
+    message_id    TEXT    NOT NULL,
+    sender        TEXT    NOT NULL,
+    subject       TEXT    NOT NULL,
+    received_at   REAL    NOT NULL,
+    is_read       INTEGER NOT NULL,
+    is_flagged    INTEGER NOT NULL,
+    is_actionable INTEGER NOT NULL,
+    body          TEXT    NOT NULL DEFAULT '',
+    PRIMARY KEY (mailbox, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS messages_by_location ON messages (mailbox, location, is_read, is_flagged);
+CREATE INDEX IF NOT EXISTS messages_unread ON messages (is_read, received_at);
+CREATE TABLE IF NOT EXISTS watermarks (
+    mailbox     TEXT PRIMARY KEY,
+    message_id  TEXT,
+    received_at REAL,
+    cursor      TEXT NOT NULL DEFAULT '{}',
+    synced_at   REAL
+);
+CREATE TABLE IF NOT EXISTS listings (
+    mailbox  TEXT NOT NULL,
+    location TEXT NOT NULL,
+    names    BLOB NOT NULL,
+    PRIMARY KEY (mailbox, location)
+) WITHOUT ROWID;
+"""
+
+def default_index_path() -> Path:
+    return data_dir() / "mail-index.sqlite3"
+
+
+def _mailbox_filter(mailboxes: Iterable[str] | None) -> tuple[str, tuple[str, ...]]:
+    """SQL condition on ``mailbox``: the named ones, or else every inbox.
+
+    The inboxes are ``INBOX`` and each account's ``account/INBOX``, in any case
+    (an mbox directory names its mailboxes after files such as ``Inbox``).
+    Archive, Sent, Trash and other folders are left out, as Mail's inbox is.
+    """
+    if mailboxes is None:
+        return "(mailbox LIKE 'INBOX' OR mailbox LIKE '%/INBOX')", ()
+    mailboxes = tuple(mailboxes)
+    return f"mailbox IN ({','.join('?' * len(mailboxes))})", mailboxes
+
+
+@dataclass(frozen=True, slots=True)
+class Watermark:
+    """Newest message seen in a mailbox plus the source's resume cursor."""
+
+    mailbox: str
+    message_id: str | None
+    received_at: float | None
+    cursor: dict
+    synced_at: float | None
+
+
+@dataclass(frozen=True, slots=True)
+class InboxCounts:
+    """The counts ``scanInbox`` reports, answered from the index."""
+
+    unread: int
+    actionable: int
+    flagged: int
+
+    def as_skill_result(self, time_range: int) -> dict:
+        """Shape the counts like the scan_inbox.scpt result record."""
+        return {
+            "success": True,
+            "unreadCount": self.unread,
+            "actionableCount": self.actionable,
+            "priorityCount": self.flagged,
+            "timeRange": time_range,
+            "priorityOnly": True,
+        }
+
+
+class MailIndex:
+    """Local index of mail metadata.
+
+    Sources read through the ``keys_at``/``locations`` views to work out what
+    changed; everything else is answered straight from SQLite.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path) if path is not None else default_index_path()
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(messages)")}
+        if "body" not in columns:
+            # Indexes built before body snippets were kept; old rows stay empty.
+            self._conn.execute("ALTER TABLE messages ADD COLUMN body TEXT NOT NULL DEFAULT ''")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "MailIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # -- source views -----------------------------------------------------
+
+    def keys_at(self, mailbox: str, location: str) -> dict[str, tuple[bool, bool]]:
+        """Map key -> (is_read, is_flagged) for messages at ``location``."""
+        rows = self._conn.execute(
+            "SELECT key, is_read, is_flagged FROM messages WHERE mailbox = ? AND location = ?",
+            (mailbox, location),
+        )
+        return {key: (bool(read), bool(flagged)) for key, read, flagged in rows}
+
+    def locations(self, mailbox: str, keys: Iterable[str]) -> dict[str, str]:
+        """Map each already-indexed key in ``keys`` to its stored location."""
+        return dict(
+            select_in(
+                self._conn,
+                "SELECT key, location FROM messages WHERE mailbox = ? AND key IN",
+                keys,
+                mailbox,
+            )
+        )
+
+    def listing(self, mailbox: str, location: str) -> set[str] | None:
+        """Filenames the source read at ``location`` in the last sync, if it stored any."""
+        row = self._conn.execute(
+            "SELECT names FROM listings WHERE mailbox = ? AND location = ?", (mailbox, location)
+        ).fetchone()
+        if row is None:
+            return None
+        names = row[0].decode()
+        return set(names.split("\0")) if names else set()
+
+    def watermark(self, mailbox: str) -> Watermark:
+        row = self._conn.execute(
+            "SELECT message_id, received_at, cursor, synced_at FROM watermarks WHERE mailbox = ?",
+            (mailbox,),
+        ).fetchone()
+        if row is None:
+            return Watermark(mailbox, None, None, {}, None)
+        message_id, received_at, cursor, synced_at = row
+        return Watermark(mailbox, message_id, received_at, json.loads(cursor), synced_at)
+
+    # -- writes -----------------------------------------------------------
+
+    def apply(
+        self,
+        mailbox: str,
+        added: Iterable[MailMessage],
+        changed: dict[str, tuple[str, bool, bool]],
+        removed: Iterable[str],
+        cursor: dict,
+        listings: dict[str, set[str]] | None = None,
+    ) -> Watermark:
+        """Apply one mailbox delta and advance its watermark atomically.
+
+        ``listings`` replaces the stored filenames of each location it names.
+        """
+        previous = self.watermark(mailbox)
+        newest = (previous.received_at, previous.message_id)
+        with self._conn:
+            rows = []
+            for msg in added:
+                rows.append(
+                    (
+                        msg.mailbox,
+                        msg.key,
+                        msg.location,
+                        msg.message_id,
+                        msg.sender,
+                        msg.subject,
+                        msg.received_at,
+                        msg.is_read,
+                        msg.is_flagged,
+                        msg.is_actionable,
+                        msg.body,
+                    )
+                )
+                if newest[0] is None or msg.received_at > newest[0]:
+                    newest = (msg.received_at, msg.message_id)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO messages VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self._conn.executemany(
+                "UPDATE messages SET location = ?, is_read = ?, is_flagged = ? "
+                "WHERE mailbox = ? AND key = ?",
+                [(loc, read, flagged, mailbox, key) for key, (loc, read, flagged) in changed.items()],
+            )
+            self._conn.executemany(
+                "DELETE FROM messages WHERE mailbox = ? AND key = ?",
+                [(mailbox, key) for key in removed],
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO listings VALUES (?, ?, ?)",
+                [
+                    (mailbox, location, "\0".join(names).encode())
+                    for location, names in (listings or {}).items()
+                ],
+            )
+            synced_at = time.time()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?, ?, ?)",
+                (mailbox, newest[1], newest[0], json.dumps(cursor), synced_at),
+            )
+        return Watermark(mailbox, newest[1], newest[0], cursor, synced_at)
+
+    # -- queries ----------------------------------------------------------
+
+    def counts(self, since: float, mailboxes: Iterable[str] | None = None) -> InboxCounts:
+        """Unread, actionable and flagged counts for mail received since ``since``.
+
+        Like ``scanInbox``, actionable and flagged only count unread mail, and
+        only in the inboxes unless ``mailboxes`` names others.
+        """
+        where, params = _mailbox_filter(mailboxes)
+        unread, actionable, flagged = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(is_actionable), 0), COALESCE(SUM(is_flagged), 0) "
+            f"FROM messages WHERE is_read = 0 AND received_at >= ? AND {where}",
+            (since, *params),
+        ).fetchone()
+        return InboxCounts(unread, actionable, flagged)
+
+    def unread(
+        self, since: float, limit: int | None = None, mailboxes: Iterable[str] | None = None
+    ) -> list[MailMessage]:
+        """Unread inbox messages (or ``mailboxes``) received since ``since``, newest first."""
+        where, params = _mailbox_filter(mailboxes)
+        sql = (
+            "SELECT mailbox, key, message_id, sender, subject, received_at, is_read, "
+            "is_flagged, location, body FROM messages WHERE is_read = 0 AND received_at >= ? "
+            f"AND {where} ORDER BY received_at DESC"
+        )
+        params = (since, *params)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params += (limit,)
+        return [
+            MailMessage(
+                mb, key, mid, sender, subject, received, bool(read), bool(flagged), loc, body
+            )
+            for mb, key, mid, sender, subject, received, read, flagged, loc, body in (
+                self._conn.execute(sql, params)
+            )
+        ]
+
+    def message_count(self, mailbox: str | None = None) -> int:
+        if mailbox is None:
+            return self._conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM messages WHERE mailbox = ?", (mailbox,)
+        ).fetchone()[0]
@@ -0,0 +1,44 @@
+"""Incremental sync from a mail source into the index."""
+
+import time
+from dataclasses import dataclass
+
+from assistant.mail.index import MailIndex
+from assistant.mail.sources import MailSource
+
+
+@dataclass(frozen=True, slots=True)
+class SyncReport:
+    mailbox: str
+    added: int
+    changed: int
+    removed: int
+    skipped: bool
+    seconds: float
+
+
+def sync(index: MailIndex, source: MailSource, mailboxes: list[str] | None = None) -> list[SyncReport]:
+    """Pull new and changed messages for every mailbox of ``source``.
+
+    Each mailbox is applied in its own transaction, so an interrupted run
+    keeps the watermarks of the mailboxes it finished.
+    """
+    reports = []
+    for mailbox in mailboxes if mailboxes is not None else source.mailboxes():
+        started = time.perf_counter()
+        delta = source.delta(mailbox, index.watermark(mailbox).cursor, index)
+        if not delta.unchanged:
+            index.apply(
+                mailbox, delta.added, delta.changed, delta.removed, delta.cursor, delta.listings
+            )
+        reports.append(
+            SyncReport(
+                mailbox=mailbox,
+                added=len(delta.added),
+                changed=len(delta.changed),
+                removed=len(delta.removed),
+                skipped=delta.unchanged,
+                seconds=time.perf_counter() - started,
+            )
+        )
+    return reports
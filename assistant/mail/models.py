@@ -0,0 +1,84 @@
+"""Message records shared by mail sources and the index."""
+
+from dataclasses import dataclass, field
+from datetime import timezone
+from email.utils import parseaddr, parsedate_to_datetime
+from email.header import decode_header, make_header
+
+# Mirrors ``actionableKeywords`` in .gemini/scripts/scan_inbox.scpt so the
+# index answers the same question the AppleScript skill does.
+ACTIONABLE_KEYWORDS = (
+    "deadline",
+    "urgent",
+    "action required",
+    "meeting",
+    "request",
+    "please review",
+    "asap",
+    "todo",
+    "action item",
+)
+
+
+def is_actionable(subject: str) -> bool:
+    """Return True if the subject contains an actionable keyword.
+
+    AppleScript's ``contains`` is case-insensitive, so this is too.
+    """
+    lowered = subject.lower()
+    return any(keyword in lowered for keyword in ACTIONABLE_KEYWORDS)
+
+
+@dataclass(frozen=True, slots=True)
+class MailMessage:
+    """One message as stored in the index.
+
+    ``key`` identifies the message inside its source (a Maildir unique name
+    or an mbox byte offset); ``message_id`` is the RFC 5322 Message-ID, or
+    the key when the header is missing. ``body`` is a snippet of the text
+    body, enough for the triage body pass.
+    """
+
+    mailbox: str
+    key: str
+    message_id: str
+    sender: str
+    subject: str
+    received_at: float
+    is_read: bool = False
+    is_flagged: bool = False
+    location: str = ""
+    body: str = ""
+    is_actionable: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "is_actionable", is_actionable(self.subject))
+
+
+def decode_text(value: str | None) -> str:
+    """Decode an RFC 2047 encoded header into plain text."""
+    if not value:
+        return ""
+    try:
+        return str(make_header(decode_header(value)))
+    except (LookupError, ValueError):
+        return value
+
+
+def parse_received(date_header: str | None, fallback: float) -> float:
+    """Return the Date header as epoch seconds, or ``fallback`` if unusable."""
+    if not date_header:
+        return fallback
+    try:
+        parsed = parsedate_to_datetime(date_header)
+    except (TypeError, ValueError):
+        return fallback
+    if parsed.tzinfo is None:
+        # "-0000" means UTC with unknown local offset (RFC 5322 3.3).
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def sender_address(sender: str) -> str:
+    """Extract ``email@domain`` from a ``Name <email@domain>`` sender."""
+    return parseaddr(sender)[1] or sender
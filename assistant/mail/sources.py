@@ -0,0 +1,367 @@
+"""Mail source adapters.
+
+A source knows how to enumerate its mailboxes and, given the cursor stored
+with a mailbox's watermark, report only what changed since the last sync.
+Sources never walk messages they have already indexed: Maildir folders are
+skipped entirely while their ``new``/``cur`` directory mtimes are unchanged,
+and mbox files are read from the byte offset where the previous sync stopped.
+
+Any change to a Maildir directory (a delivery, or a flag change renaming one
+file in ``cur``) still lists the whole directory, since only the directory
+mtime says something changed. The listing is diffed against the one stored
+by the previous sync, so only the renamed, added or removed files are parsed
+or looked up in the index.
+"""
+
+import html
+import mmap
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from email.message import Message
+from email.parser import BytesParser
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Protocol
+
+from assistant.mail.models import MailMessage, decode_text, parse_received
+
+# Directory mtimes this close to the scan start may still change within the
+# same timestamp tick, so they are not trusted as a cursor (the "racy mtime"
+# problem). Two seconds covers filesystems with one-second resolution.
+RACY_WINDOW_NS = 2_000_000_000
+
+# Only the start of each message is read: its headers and enough of the
+# body for the snippet the triage body pass scores.
+_HEAD_BYTES = 64 * 1024
+# The snippet keeps the start of the text, where calls to action are, and
+# the end, where newsletter footers ("unsubscribe") are.
+BODY_HEAD_CHARS = 1000
+BODY_TAIL_CHARS = 500
+_MARKUP = re.compile(r"<(script|style)\b.*?</\1\s*>|<[^>]*>", re.IGNORECASE | re.DOTALL)
+_SPACE = re.compile(r"\s+")
+_MBOX_FROM = re.compile(rb"^From ", re.MULTILINE)
+_TAIL_BYTES = 64
+
+
+class IndexView(Protocol):
+    """The read-only slice of ``MailIndex`` that sources may consult."""
+
+    def keys_at(self, mailbox: str, location: str) -> dict[str, tuple[bool, bool]]: ...
+
+    def locations(self, mailbox: str, keys: list[str]) -> dict[str, str]: ...
+
+    def listing(self, mailbox: str, location: str) -> set[str] | None: ...
+
+
+@dataclass(slots=True)
+class MailboxDelta:
+    """Changes in one mailbox since the cursor the source was given.
+
+    ``changed`` maps key -> (location, is_read, is_flagged) for messages that
+    were already indexed but moved or had their flags updated. ``listings``
+    holds the filenames a Maildir source read, keyed by location, for the
+    index to keep until the next sync.
+    """
+
+    mailbox: str
+    cursor: dict
+    added: list[MailMessage] = field(default_factory=list)
+    changed: dict[str, tuple[str, bool, bool]] = field(default_factory=dict)
+    removed: set[str] = field(default_factory=set)
+    unchanged: bool = False
+    listings: dict[str, set[str]] = field(default_factory=dict)
+
+
+class MailSource(Protocol):
+    def mailboxes(self) -> list[str]: ...
+
+    def delta(self, mailbox: str, cursor: dict, index: IndexView) -> MailboxDelta: ...
+
+
+def _read_message(raw: bytes) -> Message:
+    return BytesParser().parsebytes(raw)
+
+
+def _body_snippet(message: Message) -> str:
+    """The start and end of the first text part, whitespace collapsed.
+
+    text/plain is preferred; an HTML-only message has its markup stripped.
+    """
+    text_part = html_part = None
+    for part in message.walk():
+        if part.is_multipart() or part.get_content_disposition() == "attachment":
+            continue
+        kind = part.get_content_type()
+        if kind == "text/plain":
+            text_part = part
+            break
+        if kind == "text/html" and html_part is None:
+            html_part = part
+    part = text_part or html_part
+    if part is None:
+        return ""
+    payload = part.get_payload(decode=True) or b""
+    try:
+        text = payload.decode(part.get_content_charset() or "utf-8", "replace")
+    except LookupError:
+        text = payload.decode("utf-8", "replace")
+    if part is html_part:
+        text = html.unescape(_MARKUP.sub(" ", text))
+    text = _SPACE.sub(" ", text).strip()
+    if len(text) <= BODY_HEAD_CHARS + BODY_TAIL_CHARS:
+        return text
+    return f"{text[:BODY_HEAD_CHARS]}\n{text[-BODY_TAIL_CHARS:]}"
+
+
+def _message_from(
+    message: Message,
+    mailbox: str,
+    key: str,
+    received_at: float,
+    is_read: bool,
+    is_flagged: bool,
+    location: str,
+) -> MailMessage:
+    return MailMessage(
+        mailbox=mailbox,
+        key=key,
+        message_id=(message.get("Message-ID") or "").strip() or key,
+        sender=decode_text(message.get("From")),
+        subject=decode_text(message.get("Subject")),
+        received_at=received_at,
+        is_read=is_read,
+        is_flagged=is_flagged,
+        location=location,
+        body=_body_snippet(message),
+    )
+
+
+# -- Maildir ----------------------------------------------------------------
+
+
+def _is_maildir(path: Path) -> bool:
+    return (path / "cur").is_dir() and (path / "new").is_dir()
+
+
+def _split_maildir_name(name: str) -> tuple[str, bool, bool]:
+    """Return (unique key, is_read, is_flagged) for a Maildir filename."""
+    key, _, info = name.partition(":")
+    flags = info[2:] if info.startswith("2,") else ""
+    return key, "S" in flags, "F" in flags
+
+
+def _delivery_time(key: str) -> float | None:
+    """Maildir unique names start with the delivery time in epoch seconds."""
+    head = key.split(".", 1)[0]
+    return float(head) if head.isdigit() else None
+
+
+class MaildirSource:
+    """Maildir or Maildir++ tree.
+
+    ``root`` may be a single Maildir (its subfolders ``.Name`` become
+    mailboxes next to ``INBOX``) or a directory of per-account Maildirs,
+    named ``account/INBOX``, ``account/Name`` and so on.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self._folders = self._discover()
+
+    def _discover(self) -> dict[str, Path]:
+        folders: dict[str, Path] = {}
+
+        def add_tree(path: Path, prefix: str) -> None:
+            folders[f"{prefix}INBOX"] = path
+            for child in sorted(path.iterdir()):
+                if child.name.startswith(".") and _is_maildir(child):
+                    folders[f"{prefix}{child.name[1:]}"] = child
+
+        if _is_maildir(self.root):
+            add_tree(self.root, "")
+        else:
+            for child in sorted(self.root.iterdir()):
+                if _is_maildir(child):
+                    add_tree(child, f"{child.name}/")
+        return folders
+
+    def mailboxes(self) -> list[str]:
+        return list(self._folders)
+
+    def path_for(self, mailbox: str) -> Path:
+        return self._folders[mailbox]
+
+    def delta(self, mailbox: str, cursor: dict, index: IndexView) -> MailboxDelta:
+        folder = self._folders[mailbox]
+        scan_start = time.time_ns()
+        new_cursor: dict[str, int | None] = {}
+        listings: dict[str, set[str]] = {}
+
+        for sub in ("new", "cur"):
+            mtime = (folder / sub).stat().st_mtime_ns
+            trusted = mtime if scan_start - mtime > RACY_WINDOW_NS else None
+            new_cursor[sub] = trusted
+            if trusted is not None and cursor.get(sub) == trusted:
+                continue
+            listings[sub] = {name for name in os.listdir(folder / sub) if name[0] != "."}
+
+        delta = MailboxDelta(mailbox, new_cursor, unchanged=not listings, listings=listings)
+        previous = {sub: index.listing(mailbox, sub) for sub in listings}
+        if None in previous.values():
+            self._diff_against_index(delta, folder, index)
+        else:
+            self._diff_against_listings(delta, folder, previous, index)
+        return delta
+
+    def _diff_against_listings(
+        self,
+        delta: MailboxDelta,
+        folder: Path,
+        previous: dict[str, set[str]],
+        index: IndexView,
+    ) -> None:
+        """Diff the filenames against the listing stored by the last sync.
+
+        A flag change renames one file, so only the names that differ are
+        parsed and looked up; the rest of the folder costs one set difference.
+        """
+        came: dict[str, tuple[str, str]] = {}  # key -> (sub, name)
+        gone: set[str] = set()
+        for sub, names in delta.listings.items():
+            for name in names - previous[sub]:
+                came[name.partition(":")[0]] = (sub, name)
+            gone.update(name.partition(":")[0] for name in previous[sub] - names)
+        unseen = [key for key in came if key not in gone]
+        moved = index.locations(delta.mailbox, unseen) if unseen else {}
+        for key, (sub, name) in came.items():
+            _, read, flagged = _split_maildir_name(name)
+            if key in gone or key in moved:
+                delta.changed[key] = (sub, read, flagged)
+            else:
+                delta.added.append(
+                    self._load(folder / sub / name, delta.mailbox, key, read, flagged, sub)
+                )
+        delta.removed = gone.difference(came)
+
+    def _diff_against_index(self, delta: MailboxDelta, folder: Path, index: IndexView) -> None:
+        """Diff every filename against the indexed keys; used until a listing is stored."""
+        mailbox = delta.mailbox
+        parsed: dict[str, dict[str, tuple[bool, bool, str]]] = {}
+        for sub, names in delta.listings.items():
+            entries = parsed[sub] = {}
+            for name in names:
+                key, read, flagged = _split_maildir_name(name)
+                entries[key] = (read, flagged, name)
+        for sub, entries in parsed.items():
+            stored = index.keys_at(mailbox, sub)
+            unseen = [key for key in entries if key not in stored]
+            moved = index.locations(mailbox, unseen) if unseen else {}
+            for key, (read, flagged, name) in entries.items():
+                if key in stored:
+                    if stored[key] != (read, flagged):
+                        delta.changed[key] = (sub, read, flagged)
+                elif key in moved:
+                    delta.changed[key] = (sub, read, flagged)
+                else:
+                    delta.added.append(
+                        self._load(folder / sub / name, mailbox, key, read, flagged, sub)
+                    )
+            others = set().union(*(e for s, e in parsed.items() if s != sub))
+            delta.removed.update(key for key in stored if key not in entries and key not in others)
+
+    def _load(
+        self, path: Path, mailbox: str, key: str, read: bool, flagged: bool, location: str
+    ) -> MailMessage:
+        with open(path, "rb") as fh:
+            message = _read_message(fh.read(_HEAD_BYTES))
+        received = _delivery_time(key)
+        if received is None:
+            received = parse_received(message.get("Date"), path.stat().st_mtime)
+        return _message_from(message, mailbox, key, received, read, flagged, location)
+
+
+# -- mbox -------------------------------------------------------------------
+
+
+def _from_line_time(line: bytes) -> float | None:
+    """Parse the asctime delivery date on an mbox ``From `` separator line."""
+    parts = line.decode("ascii", "replace").split()
+    if len(parts) < 7:
+        return None
+    try:
+        return parsedate_to_datetime(" ".join(parts[2:7]) + " +0000").timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class MboxSource:
+    """One mbox file, or a directory of them (one mailbox per file).
+
+    Appending to an mbox leaves existing bytes untouched, so the cursor is
+    the offset parsed so far plus a fingerprint of the bytes just before it.
+    Any other rewrite (flag updates, expunges) triggers a full rescan.
+    """
+
+    def __init__(self, path: str | Path, mailbox: str = "INBOX") -> None:
+        path = Path(path)
+        if path.is_dir():
+            self._files = {
+                child.stem: child
+                for child in sorted(path.iterdir())
+                if child.is_file() and not child.name.startswith(".")
+            }
+        else:
+            self._files = {mailbox: path}
+
+    def mailboxes(self) -> list[str]:
+        return list(self._files)
+
+    def delta(self, mailbox: str, cursor: dict, index: IndexView) -> MailboxDelta:
+        path = self._files[mailbox]
+        st = path.stat()
+        state = {"ino": st.st_ino, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        if cursor and all(cursor.get(k) == v for k, v in state.items()):
+            return MailboxDelta(mailbox, cursor, unchanged=True)
+
+        with open(path, "rb") as fh:
+            start = 0
+            if cursor.get("ino") == st.st_ino and st.st_size > cursor.get("size", 0):
+                offset = cursor.get("offset", 0)
+                fh.seek(max(offset - _TAIL_BYTES, 0))
+                if fh.read(min(offset, _TAIL_BYTES)).hex() == cursor.get("tail"):
+                    start = offset
+            messages, end = self._parse(fh, st.st_size, start, mailbox)
+            fh.seek(max(end - _TAIL_BYTES, 0))
+            tail = fh.read(min(end, _TAIL_BYTES)).hex()
+
+        delta = MailboxDelta(mailbox, {**state, "offset": end, "tail": tail}, added=messages)
+        if start == 0:
+            keep = {msg.key for msg in messages}
+            delta.removed = {key for key in index.keys_at(mailbox, "") if key not in keep}
+        return delta
+
+    def _parse(self, fh, size: int, start: int, mailbox: str) -> tuple[list[MailMessage], int]:
+        if size <= start:
+            return [], start
+        messages = []
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            starts = [m.start() for m in _MBOX_FROM.finditer(mm, start)]
+            if not starts:
+                return [], start
+            for begin, stop in zip(starts, starts[1:] + [size]):
+                line_end = mm.find(b"\n", begin, stop)
+                from_line = mm[begin:line_end]
+                message = _read_message(mm[line_end + 1 : min(stop, line_end + 1 + _HEAD_BYTES)])
+                status = message.get("Status", "")
+                x_status = message.get("X-Status", "")
+                received = _from_line_time(from_line)
+                if received is None:
+                    received = parse_received(message.get("Date"), 0.0)
+                messages.append(
+                    _message_from(
+                        message, mailbox, str(begin), received, "R" in status, "F" in x_status, ""
+                    )
+                )
+        return messages, size
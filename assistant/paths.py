@@ -0,0 +1,17 @@
+"""Filesystem locations for local assistant state."""
+
+import os
+from pathlib import Path
+
+APP_NAME = "my-personal-assistant"
+
+
+def data_dir() -> Path:
+    """Return the directory holding local indexes, creating it if needed.
+
+    ``ASSISTANT_DATA_DIR`` overrides the default under ``~/.local/share``.
+    """
+    override = os.environ.get("ASSISTANT_DATA_DIR")
+    path = Path(override) if override else Path.home() / ".local" / "share" / APP_NAME
+    path.mkdir(parents=True, exist_ok=True)
+    return path
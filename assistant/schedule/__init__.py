@@ -0,0 +1,28 @@
+"""Scheduling engine behind the briefing's RECOMMENDED SCHEDULE and FOCUS.
+
+``TaskStore`` keeps open reminders in due-date heaps (overdue, today,
+upcoming, undated) that update incrementally, replacing the per-call scans
+in ``list_tasks.scpt``. ``plan_day`` subtracts the day's events from the
+working hours and packs the highest-ranked tasks into the free gaps, so the
+schedule is computed rather than written by the model.
+"""
+
+from assistant.schedule.freebusy import busy_intervals, merge, overlaps, subtract
+from assistant.schedule.planner import Block, Plan, WorkDay, day_events, pack, plan_day
+from assistant.schedule.tasks import Task, TaskStore, tasks_from_components
+
+__all__ = [
+    "Block",
+    "Plan",
+    "Task",
+    "TaskStore",
+    "WorkDay",
+    "busy_intervals",
+    "day_events",
+    "merge",
+    "overlaps",
+    "pack",
+    "plan_day",
+    "subtract",
+    "tasks_from_components",
+]
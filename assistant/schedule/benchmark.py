@@ -0,0 +1,152 @@
+"""Benchmark: planning a day against thousands of reminders and a dense calendar.
+
+Writes Reminders-style VTODO exports (several lists, a third of the tasks
+undated, the rest due within two months either side of the day) and the
+calendar benchmark's .ics file, then times loading, ``plan_day``, an
+incremental edit followed by a new plan, and moving to the next day. The
+baseline buckets and sorts every task on every call, as ``listTasks`` in
+``list_tasks.scpt`` does.
+"""
+
+import itertools
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from assistant.calendar.benchmark import write_ics
+from assistant.calendar.store import CalendarStore
+from assistant.schedule.planner import WorkDay, day_events, plan_day
+from assistant.schedule.tasks import Task, TaskStore, local_day
+
+LISTS = ("Work", "Personal", "Errands", "Home", "Reading", "Projects", "Health", "Finance")
+PRIORITIES = (0, 0, 0, 1, 5, 5, 9)
+DAY = date(2026, 6, 2)
+# How many overdue tasks the heap query takes, as a briefing's focus list would.
+FOCUS_LIMIT = 20
+
+
+def _stamp(moment: datetime) -> str:
+    return moment.strftime("%Y%m%dT%H%M%S")
+
+
+def write_reminders(folder: Path, count: int, day: date = DAY, seed: int = 5) -> list[Path]:
+    """One VTODO export per list in ``LISTS``, ``count`` open tasks in all."""
+    rng = random.Random(seed)
+    todos: dict[str, list[str]] = {name: [] for name in LISTS}
+    for i in range(count):
+        name = LISTS[rng.randrange(len(LISTS))]
+        lines = ["BEGIN:VTODO", f"UID:task-{i}", f"SUMMARY:Task {i} for {name}"]
+        if rng.random() > 1 / 3:
+            due = datetime.combine(day, datetime.min.time()) + timedelta(
+                days=rng.randrange(-60, 60), hours=rng.randrange(8, 20)
+            )
+            if rng.random() < 0.5:
+                lines.append(f"DUE;VALUE=DATE:{due:%Y%m%d}")
+            else:
+                lines.append(f"DUE:{_stamp(due)}")
+        lines.append(f"PRIORITY:{rng.choice(PRIORITIES)}")
+        lines.append(f"DURATION:PT{rng.choice((15, 30, 30, 45, 60, 90))}M")
+        lines.append("END:VTODO")
+        todos[name] += lines
+    paths = []
+    for name, lines in todos.items():
+        path = folder / f"{name}.ics"
+        body = ["BEGIN:VCALENDAR", "VERSION:2.0", f"X-WR-CALNAME:{name}", *lines, "END:VCALENDAR"]
+        path.write_text("\r\n".join(body) + "\r\n")
+        paths.append(path)
+    return paths
+
+
+def linear_buckets(tasks: list[Task], start: float, end: float) -> tuple[list, list]:
+    """Baseline: walk every task, bucket it, sort the buckets."""
+    overdue, today = [], []
+    for task in tasks:
+        if task.due is None:
+            continue
+        if task.due < start:
+            overdue.append(task)
+        elif task.due < end:
+            today.append(task)
+    return sorted(overdue, key=lambda t: t.rank), sorted(today, key=lambda t: t.rank)
+
+
+def _median_ms(action, repeat: int = 50) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        action()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def run(tasks: int = 5_000) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        reminders = folder / "reminders"
+        reminders.mkdir()
+        write_reminders(reminders, tasks)
+        calendar_file = write_ics(folder / "calendar.ics", 9_500, 500, datetime(2026, 1, 1))
+
+        started = time.perf_counter()
+        store = TaskStore(day=local_day(DAY), paths=[reminders])
+        load_s = time.perf_counter() - started
+        calendar = CalendarStore([calendar_file])
+        events = day_events(calendar, DAY)
+        workday = WorkDay(DAY)
+
+        plan = plan_day(store, events, workday)
+        plan_ms = _median_ms(lambda: plan_day(store, day_events(calendar, DAY), workday))
+        same = plan_day(store, events, workday).as_dict() == plan.as_dict()
+
+        counter = itertools.count()
+
+        def edit() -> None:
+            # Bump one overdue task to high priority, then plan again.
+            task = store.overdue(1 + next(counter) % 50)[-1]
+            store.upsert(Task(task.uid, task.title, task.list_name, 1, task.due, task.all_day))
+            plan_day(store, events, workday)
+
+        edit_ms = _median_ms(edit)
+
+        all_tasks = [entry.task for entry in store._entries.values()]
+        day = local_day(DAY)
+        linear_ms = _median_ms(lambda: linear_buckets(all_tasks, *day))
+        heap_ms = _median_ms(lambda: (store.overdue(FOCUS_LIMIT), store.today()))
+
+        next_day = local_day(DAY + timedelta(days=1))
+        started = time.perf_counter()
+        store.set_day(*next_day)
+        roll_ms = (time.perf_counter() - started) * 1000
+    return {
+        "tasks": len(store),
+        "events": len(events),
+        "load_s": load_s,
+        "plan_ms": plan_ms,
+        "deterministic": same,
+        "edit_ms": edit_ms,
+        "heap_ms": heap_ms,
+        "linear_ms": linear_ms,
+        "roll_ms": roll_ms,
+        "counts": store.counts(),
+    }
+
+
+def main(tasks: int = 5_000) -> None:
+    row = run(tasks)
+    print(
+        f"{row['tasks']} open tasks, {row['events']} events on {DAY}, "
+        f"loaded in {row['load_s']:.2f}s"
+    )
+    print(f"plan_day (day query + packing):  {row['plan_ms']:7.2f} ms")
+    print(f"same plan twice:                 {row['deterministic']}")
+    print(f"edit one task + replan:          {row['edit_ms']:7.2f} ms")
+    print(f"top {FOCUS_LIMIT} overdue + today (heaps):  {row['heap_ms']:7.2f} ms")
+    print(f"bucket + sort every task:        {row['linear_ms']:7.2f} ms")
+    print(f"roll to the next day:            {row['roll_ms']:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
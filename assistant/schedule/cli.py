@@ -0,0 +1,128 @@
+"""``main.py schedule`` subcommands."""
+
+import argparse
+import json
+from datetime import date, time
+
+from assistant.bench.metrics import EXTRACT, FETCH, FILTER, SERIALIZE, stage
+from assistant.calendar.cache import ParsedCache
+from assistant.calendar.store import CalendarStore, default_calendar_dir
+from assistant.schedule import benchmark
+from assistant.schedule.planner import (
+    DEFAULT_END,
+    DEFAULT_START,
+    LUNCH,
+    WorkDay,
+    day_events,
+    plan_day,
+)
+from assistant.schedule.tasks import TaskStore, default_reminders_dir, local_day
+
+
+def _span(value: str) -> tuple[time, time]:
+    start, sep, end = value.partition("-")
+    try:
+        if not sep:
+            raise ValueError
+        return time.fromisoformat(start), time.fromisoformat(end)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected HH:MM-HH:MM, got {value!r}") from None
+
+
+def register(subparsers) -> None:
+    parser = subparsers.add_parser("schedule", help="free/busy day planner over reminders")
+    parser.add_argument(
+        "--ics",
+        action="append",
+        help="calendar .ics file or directory, repeatable (default: calendars/ in the data dir)",
+    )
+    parser.add_argument(
+        "--reminders",
+        action="append",
+        help="reminders .ics (VTODO) file or directory, repeatable "
+        "(default: reminders/ in the data dir)",
+    )
+    parser.add_argument(
+        "--cache",
+        help="directory for parsed .ics files (default: ics-cache/ in the data dir)",
+    )
+    commands = parser.add_subparsers(dest="schedule_command", required=True)
+
+    plan_parser = commands.add_parser("plan", help="recommended schedule and focus for a day")
+    plan_parser.add_argument("--date", type=date.fromisoformat, help="YYYY-MM-DD (default: today)")
+    plan_parser.add_argument(
+        "--hours", type=_span, default=(DEFAULT_START, DEFAULT_END), help="HH:MM-HH:MM"
+    )
+    plan_parser.add_argument(
+        "--lunch", type=_span, default=(LUNCH[1], LUNCH[2]), help="lunch break, HH:MM-HH:MM"
+    )
+    plan_parser.add_argument("--no-lunch", action="store_true")
+    plan_parser.add_argument(
+        "--lookahead", type=int, default=0, help="also schedule tasks due in the next N days"
+    )
+    plan_parser.add_argument("--json", action="store_true")
+    plan_parser.set_defaults(handler=_plan)
+
+    tasks_parser = commands.add_parser("tasks", help="overdue, today and upcoming reminders")
+    tasks_parser.add_argument("--date", type=date.fromisoformat, help="YYYY-MM-DD (default: today)")
+    tasks_parser.add_argument("--limit", type=int, default=50, help="tasks listed per bucket")
+    tasks_parser.set_defaults(handler=_tasks)
+
+    bench_parser = commands.add_parser("bench", help="planning latency benchmark")
+    bench_parser.add_argument("--tasks", type=int, default=5_000)
+    bench_parser.set_defaults(handler=_bench)
+
+
+def _plan(args: argparse.Namespace) -> int:
+    day = args.date or date.today()
+    breaks = () if args.no_lunch else (("Lunch", *args.lunch),)
+    workday = WorkDay(day, *args.hours, breaks)
+    cache = ParsedCache(args.cache)
+    with stage("schedule.plan", FETCH):
+        store = TaskStore(
+            day=local_day(day), paths=args.reminders or [default_reminders_dir()], cache=cache
+        )
+        calendar = CalendarStore(args.ics or [default_calendar_dir()], cache)
+    with stage("schedule.plan", FILTER):
+        plan = plan_day(store, day_events(calendar, day), workday, args.lookahead)
+    with stage("schedule.plan", SERIALIZE):
+        if args.json:
+            text = json.dumps({"success": True} | plan.as_dict(), indent=2, ensure_ascii=False)
+        else:
+            text = plan.render()
+    print(text)
+    return 0
+
+
+def _tasks(args: argparse.Namespace) -> int:
+    with stage("schedule.tasks", FETCH):
+        store = TaskStore(
+            day=local_day(args.date or date.today()),
+            paths=args.reminders or [default_reminders_dir()],
+            cache=ParsedCache(args.cache),
+        )
+    with stage("schedule.tasks", FILTER):
+        counts = store.counts()
+        overdue = store.overdue(args.limit)
+        today = store.today(args.limit)
+        upcoming = store.upcoming(args.limit)
+    with stage("schedule.tasks", EXTRACT):
+        result = {
+            "success": True,
+            "totalTasks": len(store),
+            "overdueCount": counts["overdue"],
+            "todayCount": counts["today"],
+            "upcomingCount": counts["upcoming"],
+            "overdue": [task.as_skill_record() for task in overdue],
+            "todayTasks": [task.as_skill_record() for task in today],
+            "upcoming": [task.as_skill_record() for task in upcoming],
+        }
+    with stage("schedule.tasks", SERIALIZE):
+        text = json.dumps(result, indent=2, ensure_ascii=False)
+    print(text)
+    return 0
+
+
+def _bench(args: argparse.Namespace) -> int:
+    benchmark.main(args.tasks)
+    return 0
@@ -0,0 +1,52 @@
+"""Free/busy interval arithmetic over half-open ``[start, end)`` timestamps."""
+
+from collections.abc import Iterable
+
+from assistant.calendar.store import Occurrence
+
+Interval = tuple[float, float]
+
+
+def merge(intervals: Iterable[Interval]) -> list[Interval]:
+    """Sorted, non-overlapping union of ``intervals``; touching ones are joined."""
+    merged: list[list[float]] = []
+    for start, end in sorted(intervals):
+        if end <= start:
+            continue
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+def subtract(window: Interval, busy: Iterable[Interval], min_length: float = 0.0) -> list[Interval]:
+    """The parts of ``window`` not covered by ``busy``, at least ``min_length`` long."""
+    lo, hi = window
+    gaps = []
+    cursor = lo
+    for start, end in merge(busy):
+        if start >= hi:
+            break
+        if end > cursor:
+            gaps.append((cursor, start))
+            cursor = end
+    gaps.append((cursor, hi))
+    return [(start, end) for start, end in gaps if end > start and end - start >= min_length]
+
+
+def busy_intervals(occurrences: Iterable[Occurrence]) -> list[Interval]:
+    """Merged busy time of timed events; all-day events do not block the day."""
+    return merge((occ.start_ts, occ.end_ts) for occ in occurrences if not occ.all_day)
+
+
+def overlaps(occurrences: Iterable[Occurrence]) -> list[tuple[Occurrence, Occurrence]]:
+    """Pairs of timed events that overlap, in start order (a sweep over starts)."""
+    pairs = []
+    active: list[Occurrence] = []
+    timed = (occ for occ in occurrences if not occ.all_day and occ.end_ts > occ.start_ts)
+    for occ in sorted(timed, key=lambda occ: (occ.start_ts, occ.end_ts, occ.summary)):
+        active = [other for other in active if other.end_ts > occ.start_ts]
+        pairs.extend((other, occ) for other in active)
+        active.append(occ)
+    return pairs
@@ -0,0 +1,213 @@
+"""Pack the day's tasks into the free time around its events.
+
+``plan_day`` takes the working window, removes the busy time of timed
+events and fixed breaks, and places tasks in rank order (priority, then
+earliest due) into the earliest gap that fits them. The same inputs always
+give the same plan; the briefing prints it as the RECOMMENDED SCHEDULE and
+FOCUS FOR TODAY sections.
+"""
+
+import itertools
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+
+from assistant.calendar.store import CalendarStore, Occurrence
+from assistant.schedule.freebusy import Interval, busy_intervals, overlaps, subtract
+from assistant.schedule.tasks import OVERDUE, TODAY, Task, TaskStore, local_day, priority_rank
+
+DEFAULT_START = time(9)
+DEFAULT_END = time(17)
+LUNCH = ("Lunch", time(12), time(13))
+# Gaps shorter than this are not offered to tasks or shown as open time.
+MIN_BLOCK_MINUTES = 15
+FOCUS_COUNT = 3
+# Tasks considered per plan; a long overdue backlog is cut off here.
+MAX_CANDIDATES = 200
+
+EVENT, TASK, BREAK, OPEN = "event", "task", "break", "open"
+_MARKS = ("!!!", "!!", "!", "")
+
+
+@dataclass(frozen=True, slots=True)
+class WorkDay:
+    """The day to plan and the local working hours within it."""
+
+    day: date
+    start: time = DEFAULT_START
+    end: time = DEFAULT_END
+    breaks: tuple[tuple[str, time, time], ...] = (LUNCH,)
+
+    def at(self, moment: time) -> float:
+        return datetime.combine(self.day, moment).astimezone().timestamp()
+
+    @property
+    def window(self) -> Interval:
+        return self.at(self.start), self.at(self.end)
+
+
+@dataclass(frozen=True, slots=True)
+class Block:
+    start: float
+    end: float
+    kind: str  # event, task, break or open
+    title: str
+    task: Task | None = None
+
+    def as_dict(self) -> dict:
+        return {
+            "start": datetime.fromtimestamp(self.start).astimezone().isoformat(),
+            "end": datetime.fromtimestamp(self.end).astimezone().isoformat(),
+            "kind": self.kind,
+            "title": self.title,
+            "task": self.task.as_skill_record() if self.task else None,
+        }
+
+
+@dataclass(slots=True)
+class Plan:
+    workday: WorkDay
+    blocks: list[Block]
+    focus: list[Task]
+    unscheduled: int  # overdue and today's tasks left out of the schedule
+    counts: dict[str, int]
+    conflicts: list[tuple[Occurrence, Occurrence]] = field(default_factory=list)
+
+    def render(self, heading: bool = True) -> str:
+        """The two sections in the layout morning.toml asks for."""
+        lines = ["⏰ RECOMMENDED SCHEDULE"] if heading else []
+        for block in self.blocks:
+            label = f"📅 {block.title}" if block.kind == EVENT else block.title
+            lines.append(f"• {_clock(block.start)}-{_clock(block.end)}: {label}")
+        if not self.blocks:
+            lines.append("• Nothing scheduled")
+        for first, second in self.conflicts:
+            when = _clock(second.start_ts)
+            lines.append(f"⚠️ Overlap at {when}: {first.summary} / {second.summary}")
+        if self.unscheduled:
+            lines.append(f"• {self.unscheduled} overdue/today tasks did not fit")
+        lines += ["", "💡 FOCUS FOR TODAY"]
+        day_start = local_day(self.workday.day)[0]
+        for number, task in enumerate(self.focus, 1):
+            lines.append(f"{number}. {_label(task)} - {_due(task, day_start)} ({task.list_name})")
+        if not self.focus:
+            lines.append("Nothing overdue or due today")
+        return "\n".join(lines)
+
+    def as_dict(self) -> dict:
+        return {
+            "date": self.workday.day.isoformat(),
+            "schedule": [block.as_dict() for block in self.blocks],
+            "focus": [task.as_skill_record() for task in self.focus],
+            "unscheduled": self.unscheduled,
+            "conflicts": [[first.summary, second.summary] for first, second in self.conflicts],
+            "counts": self.counts,
+        }
+
+
+def _clock(timestamp: float) -> str:
+    moment = datetime.fromtimestamp(timestamp)
+    return f"{moment.hour}:{moment.minute:02d}"
+
+
+def _label(task: Task) -> str:
+    marks = _MARKS[priority_rank(task.priority)]
+    return f"{task.title} {marks}" if marks else task.title
+
+
+def _due(task: Task, day_start: float) -> str:
+    if task.due is None:
+        return "no due date"
+    if task.due < day_start:
+        due = datetime.fromtimestamp(task.due)
+        return f"overdue since {due:%b} {due.day}"
+    if task.all_day:
+        return "due today"
+    return f"due {_clock(task.due)}"
+
+
+def day_events(calendar: CalendarStore, day: date) -> list[Occurrence]:
+    """Occurrences overlapping ``day``, local midnight to midnight."""
+    start = datetime.combine(day, time()).astimezone()
+    end = datetime.combine(day + timedelta(days=1), time()).astimezone()
+    return calendar.between(start, end)
+
+
+def pack(tasks: Iterable[Task], free: Iterable[Interval]) -> tuple[list[Block], list[Interval]]:
+    """First-fit ``tasks``, in the order given, into the ``free`` gaps.
+
+    A task with a due time goes in the earliest gap that finishes it by
+    then, if there is one. Gaps are used from the front; what is left of a
+    gap once it is shorter than ``MIN_BLOCK_MINUTES`` is dropped. Returns
+    the task blocks and the gaps still open.
+    """
+    gaps = [[start, end] for start, end in sorted(free)]
+    blocks = []
+    for task in tasks:
+        if not gaps:
+            break
+        need = task.minutes * 60
+        fits = [gap for gap in gaps if gap[1] - gap[0] >= need]
+        if not fits:
+            continue
+        deadline = None if task.due is None or task.all_day else task.due
+        on_time = (gap for gap in fits if deadline is not None and gap[0] + need <= deadline)
+        gap = next(on_time, fits[0])
+        blocks.append(Block(gap[0], gap[0] + need, TASK, _label(task), task))
+        gap[0] += need
+        if gap[1] - gap[0] < MIN_BLOCK_MINUTES * 60:
+            gaps.remove(gap)
+    return blocks, [(start, end) for start, end in gaps]
+
+
+def plan_day(
+    store: TaskStore,
+    events: Iterable[Occurrence],
+    workday: WorkDay,
+    lookahead_days: int = 0,
+) -> Plan:
+    """The schedule for ``workday``; re-buckets ``store`` around that day.
+
+    Candidates are overdue and today's tasks, plus those due within
+    ``lookahead_days`` after it, best rank first and at most
+    ``MAX_CANDIDATES`` of them.
+    """
+    day_start, day_end = local_day(workday.day)
+    store.set_day(day_start, day_end)
+    events = sorted(
+        (
+            occ
+            for occ in events
+            if not occ.all_day and occ.start_ts < day_end and occ.end_ts > day_start
+        ),
+        key=lambda occ: (occ.start_ts, occ.end_ts, occ.summary),
+    )
+    breaks = [
+        Block(workday.at(start), workday.at(end), BREAK, label)
+        for label, start, end in workday.breaks
+    ]
+    busy = busy_intervals(events) + [(block.start, block.end) for block in breaks]
+    free = subtract(workday.window, busy, MIN_BLOCK_MINUTES * 60)
+
+    until = local_day(workday.day + timedelta(days=lookahead_days))[1] if lookahead_days else None
+    candidates = list(itertools.islice(store.ranked(until), MAX_CANDIDATES))
+    placed, open_gaps = pack(candidates, free)
+
+    blocks = [
+        Block(max(occ.start_ts, day_start), min(occ.end_ts, day_end), EVENT, occ.summary)
+        for occ in events
+    ]
+    blocks += breaks + placed
+    blocks += [Block(start, end, OPEN, "Open time") for start, end in open_gaps]
+    blocks.sort(key=lambda block: (block.start, block.end, block.kind, block.title))
+
+    counts = store.counts()
+    due_now = sum(1 for block in placed if block.task.due is not None and block.task.due < day_end)
+    return Plan(
+        workday,
+        blocks,
+        candidates[:FOCUS_COUNT],
+        counts[OVERDUE] + counts[TODAY] - due_now,
+        counts,
+        overlaps(events),
+    )
@@ -0,0 +1,435 @@
+"""Due-date-indexed reminders: overdue, today, upcoming and undated heaps.
+
+Tasks come from VTODO components in .ics exports of Reminders lists (or are
+upserted directly). Each open task lives in exactly one bucket heap. Overdue
+and undated tasks are ordered by rank, so the most important come off the
+front; today and upcoming tasks are ordered by due time, so moving to a new
+day only pops the fronts of those two heaps. Updates push a fresh entry and
+mark the old one dead instead of searching the heap for it.
+"""
+
+import hashlib
+import heapq
+import logging
+import math
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, replace
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+
+from assistant.calendar import ics
+from assistant.calendar.cache import ParsedCache, Signature, file_signature
+from assistant.paths import data_dir
+
+_log = logging.getLogger(__name__)
+
+OVERDUE, TODAY, UPCOMING, UNDATED = "overdue", "today", "upcoming", "undated"
+BUCKETS = (OVERDUE, TODAY, UPCOMING, UNDATED)
+# Minutes a task is expected to take when its VTODO has no DURATION.
+DEFAULT_MINUTES = 30
+
+
+def default_reminders_dir() -> Path:
+    return data_dir() / "reminders"
+
+
+def priority_rank(priority: int) -> int:
+    """0 for high, 1 medium, 2 low, 3 none.
+
+    iCalendar priorities run 1 (highest) to 9, with 0 meaning undefined;
+    Reminders writes 1, 5 and 9.
+    """
+    if 1 <= priority <= 4:
+        return 0
+    if priority == 5:
+        return 1
+    if 6 <= priority <= 9:
+        return 2
+    return 3
+
+
+@dataclass(frozen=True, slots=True)
+class Task:
+    """One open reminder. ``due`` is a timestamp; all-day dues are local midnight."""
+
+    uid: str
+    title: str
+    list_name: str
+    priority: int = 0
+    due: float | None = None
+    all_day: bool = False
+    minutes: int = DEFAULT_MINUTES
+
+    def __reduce__(self):
+        # See ics.DateValue.__reduce__; stores cache parsed tasks by pickling.
+        return Task, tuple(getattr(self, name) for name in self.__slots__)
+
+    @property
+    def rank(self) -> tuple:
+        """Sort key for what to do first: priority, then the earliest due."""
+        due = math.inf if self.due is None else self.due
+        return (priority_rank(self.priority), due, self.title, self.uid)
+
+    def as_skill_record(self) -> dict:
+        """Shape the task like a record from list_tasks.scpt."""
+        record = {
+            "taskName": self.title,
+            "listName": self.list_name,
+            "taskPriority": self.priority,
+            "isCompleted": False,
+        }
+        if self.due is not None:
+            record["dueDate"] = datetime.fromtimestamp(self.due).astimezone().isoformat()
+        return record
+
+
+class _Entry:
+    """A heap slot for one version of a task; ``alive`` goes False when superseded."""
+
+    __slots__ = ("task", "bucket", "alive")
+
+    def __init__(self, task: Task, bucket: str) -> None:
+        self.task = task
+        self.bucket = bucket
+        self.alive = True
+
+
+def _key(task: Task, bucket: str) -> tuple:
+    if bucket in (TODAY, UPCOMING):
+        return (task.due, *task.rank)
+    return task.rank
+
+
+def _walk(heap: list) -> Iterator[Task]:
+    """Live tasks of ``heap`` in key order, without popping it.
+
+    Best-first over the implicit tree: a node's children only become
+    candidates once it has been visited, so taking ``k`` tasks costs
+    O(k log k) plus the dead entries passed on the way. The heap must not
+    change while the iterator is in use.
+    """
+    if not heap:
+        return
+    frontier = [(heap[0][0], 0)]
+    while frontier:
+        _, index = heapq.heappop(frontier)
+        entry = heap[index][-1]
+        if entry.alive:
+            yield entry.task
+        for child in (2 * index + 1, 2 * index + 2):
+            if child < len(heap):
+                heapq.heappush(frontier, (heap[child][0], child))
+
+
+def _take(tasks: Iterator[Task], limit: int | None) -> list[Task]:
+    found = []
+    for task in tasks:
+        if limit is not None and len(found) >= limit:
+            break
+        found.append(task)
+    return found
+
+
+@dataclass(slots=True)
+class _LoadedFile:
+    signature: Signature
+    tasks: dict[str, Task]
+
+
+class TaskStore:
+    """Open reminders bucketed around one day, ``[day_start, day_end)``.
+
+    ``upsert`` and ``remove`` are O(log n). ``set_day`` moves tasks between
+    buckets incrementally when the day advances. Dead entries are dropped
+    by rebuilding the heaps once they outnumber the live ones. With
+    ``paths``, ``refresh`` re-reads only the .ics files that changed and
+    applies the difference; a ``cache`` keeps the parsed files on disk for
+    the next store.
+    """
+
+    def __init__(
+        self,
+        tasks: Iterable[Task] = (),
+        day: tuple[float, float] | None = None,
+        paths: Iterable[str | Path] = (),
+        cache: ParsedCache | None = None,
+    ) -> None:
+        if day is None:
+            day = local_day(date.today())
+        self.day_start, self.day_end = day
+        self.paths = [Path(p) for p in paths]
+        self.cache = cache
+        self._entries: dict[str, _Entry] = {}
+        self._heaps: dict[str, list] = {bucket: [] for bucket in BUCKETS}
+        self._counts = dict.fromkeys(BUCKETS, 0)
+        self._dead = 0
+        self._seq = 0
+        self._files: dict[Path, _LoadedFile] = {}
+        for task in tasks:
+            self.upsert(task)
+        self.refresh()
+
+    # -- updates ----------------------------------------------------------
+
+    def _bucket(self, task: Task) -> str:
+        if task.due is None:
+            return UNDATED
+        if task.due < self.day_start:
+            return OVERDUE
+        if task.due < self.day_end:
+            return TODAY
+        return UPCOMING
+
+    def _push(self, task: Task, bucket: str) -> None:
+        entry = _Entry(task, bucket)
+        self._entries[task.uid] = entry
+        self._counts[bucket] += 1
+        self._seq += 1
+        heapq.heappush(self._heaps[bucket], (_key(task, bucket), self._seq, entry))
+
+    def _kill(self, entry: _Entry) -> None:
+        entry.alive = False
+        self._counts[entry.bucket] -= 1
+        self._dead += 1
+
+    def upsert(self, task: Task) -> None:
+        """Add ``task`` or replace the task with the same uid."""
+        old = self._entries.get(task.uid)
+        if old is not None:
+            if old.task == task:
+                return
+            self._kill(old)
+        self._push(task, self._bucket(task))
+        self._maybe_compact()
+
+    def remove(self, uid: str) -> bool:
+        """Drop a completed or deleted task; False if it was not there."""
+        entry = self._entries.pop(uid, None)
+        if entry is None:
+            return False
+        self._kill(entry)
+        self._maybe_compact()
+        return True
+
+    def set_day(self, start: float, end: float) -> None:
+        """Re-bucket around a new day.
+
+        Moving forward pops the tasks that fell due off the fronts of the
+        today and upcoming heaps; moving backward rebuilds every bucket.
+        """
+        if start < self.day_start:
+            self.day_start, self.day_end = start, end
+            self._rebuild()
+            return
+        self.day_start, self.day_end = start, end
+        moved = []
+        for bucket, bound in ((TODAY, start), (UPCOMING, end)):
+            heap = self._heaps[bucket]
+            while heap and heap[0][0][0] < bound:
+                entry = heapq.heappop(heap)[-1]
+                if entry.alive:
+                    self._counts[bucket] -= 1
+                    moved.append(entry.task)
+                else:
+                    self._dead -= 1
+        for task in moved:
+            self._push(task, self._bucket(task))
+
+    def _maybe_compact(self) -> None:
+        if self._dead > 64 and self._dead > len(self._entries):
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        tasks = [entry.task for entry in self._entries.values()]
+        self._entries.clear()
+        self._heaps = {bucket: [] for bucket in BUCKETS}
+        self._counts = dict.fromkeys(BUCKETS, 0)
+        self._dead = 0
+        by_bucket: dict[str, list] = {bucket: [] for bucket in BUCKETS}
+        for task in tasks:
+            bucket = self._bucket(task)
+            entry = _Entry(task, bucket)
+            self._entries[task.uid] = entry
+            self._seq += 1
+            by_bucket[bucket].append((_key(task, bucket), self._seq, entry))
+        for bucket, heap in by_bucket.items():
+            heapq.heapify(heap)
+            self._heaps[bucket] = heap
+            self._counts[bucket] = len(heap)
+
+    # -- files ------------------------------------------------------------
+
+    def _ics_files(self) -> list[Path]:
+        files = []
+        for path in self.paths:
+            if path.is_dir():
+                files.extend(sorted(path.glob("*.ics")))
+            elif path.exists():
+                files.append(path)
+        return files
+
+    def refresh(self) -> list[Path]:
+        """Reload the .ics files that changed since the last load; return them.
+
+        Only tasks that were added, edited, completed or deleted touch the
+        heaps.
+        """
+        changed = []
+        current = self._ics_files()
+        for path in current:
+            signature = file_signature(path)
+            loaded = self._files.get(path)
+            if loaded is not None and loaded.signature == signature:
+                continue
+            tasks = self._load(path, signature)
+            self._replace(loaded.tasks if loaded else {}, tasks)
+            self._files[path] = _LoadedFile(signature, tasks)
+            changed.append(path)
+        for path in set(self._files) - set(current):
+            self._replace(self._files.pop(path).tasks, {})
+        return changed
+
+    def _load(self, path: Path, signature: Signature) -> dict[str, Task]:
+        if self.cache is not None:
+            tasks = self.cache.get("tasks", path, signature)
+            if tasks is not None:
+                return tasks
+        tasks = {task.uid: task for task in tasks_from_components(ics.read(path), path.stem)}
+        if self.cache is not None:
+            self.cache.put("tasks", path, signature, tasks)
+        return tasks
+
+    def _replace(self, old: dict[str, Task], new: dict[str, Task]) -> None:
+        for uid in old.keys() - new.keys():
+            self.remove(uid)
+        for task in new.values():
+            self.upsert(task)
+
+    # -- queries ----------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, uid: str) -> Task | None:
+        entry = self._entries.get(uid)
+        return entry.task if entry else None
+
+    def counts(self) -> dict[str, int]:
+        return dict(self._counts)
+
+    def overdue(self, limit: int | None = None) -> list[Task]:
+        """Overdue tasks, most important first."""
+        return _take(_walk(self._heaps[OVERDUE]), limit)
+
+    def today(self, limit: int | None = None) -> list[Task]:
+        """Tasks due today, most important first."""
+        return sorted(_walk(self._heaps[TODAY]), key=lambda task: task.rank)[:limit]
+
+    def upcoming(self, limit: int | None = None) -> list[Task]:
+        """Tasks due after today, soonest first."""
+        return _take(_walk(self._heaps[UPCOMING]), limit)
+
+    def undated(self, limit: int | None = None) -> list[Task]:
+        """Tasks without a due date, most important first."""
+        return _take(_walk(self._heaps[UNDATED]), limit)
+
+    def ranked(self, until: float | None = None) -> Iterator[Task]:
+        """Overdue, today's, and upcoming tasks due before ``until``, by rank.
+
+        Lazy: the overdue heap is walked only as far as the caller reads.
+        """
+        soon = []
+        if until is not None:
+            for task in _walk(self._heaps[UPCOMING]):
+                if task.due >= until:
+                    break
+                soon.append(task)
+        current = sorted([*self.today(), *soon], key=lambda task: task.rank)
+        return heapq.merge(_walk(self._heaps[OVERDUE]), current, key=lambda task: task.rank)
+
+
+def local_day(day: date) -> tuple[float, float]:
+    """Timestamps of local midnight at the start of ``day`` and of the next day."""
+    start = datetime.combine(day, time()).astimezone()
+    end = datetime.combine(day + timedelta(days=1), time()).astimezone()
+    return start.timestamp(), end.timestamp()
+
+
+# -- VTODO --------------------------------------------------------------------
+
+
+def _text(component: ics.Component, name: str) -> str:
+    prop = component.get(name)
+    return ics.unescape(prop.value) if prop else ""
+
+
+def tasks_from_components(components: list[ics.Component], default_list: str) -> list[Task]:
+    """Open tasks from the VTODOs of parsed VCALENDARs.
+
+    Completed and cancelled tasks are skipped. A DURATION sets the task's
+    expected length; otherwise it is ``DEFAULT_MINUTES``. A task with a
+    malformed DUE or DURATION is skipped with a warning instead of failing
+    the whole list.
+    """
+    tasks = []
+    fallback_ids: dict[str, int] = {}
+    for cal in components:
+        if cal.name != "VCALENDAR":
+            continue
+        list_name = _text(cal, "X-WR-CALNAME") or default_list
+        for comp in cal.children:
+            if comp.name != "VTODO":
+                continue
+            try:
+                task = _task(comp, list_name)
+            except ics.ICSError as exc:
+                _log.warning("skipping task %r in %s: %s", _text(comp, "SUMMARY"), list_name, exc)
+                continue
+            if task is None:
+                continue
+            if not task.uid:
+                uid = _fallback_uid(comp, list_name)
+                seen = fallback_ids[uid] = fallback_ids.get(uid, 0) + 1
+                task = replace(task, uid=uid if seen == 1 else f"{uid}:{seen}")
+            tasks.append(task)
+    return tasks
+
+
+def _task(comp: ics.Component, list_name: str) -> Task | None:
+    """One open VTODO, or None if it is completed or cancelled."""
+    status = _text(comp, "STATUS").upper()
+    if status in ("COMPLETED", "CANCELLED") or comp.get("COMPLETED") is not None:
+        return None
+    due, all_day = None, False
+    prop = comp.get("DUE")
+    if prop is not None:
+        value = ics.parse_date_value(prop.value, prop.params)
+        due, all_day = value.aware().timestamp(), value.is_date
+    minutes = DEFAULT_MINUTES
+    prop = comp.get("DURATION")
+    if prop is not None:
+        minutes = max(1, round(ics.parse_duration(prop.value).total_seconds() / 60))
+    try:
+        priority = int(_text(comp, "PRIORITY") or 0)
+    except ValueError:
+        priority = 0
+    return Task(
+        uid=_text(comp, "UID"),
+        title=_text(comp, "SUMMARY"),
+        list_name=list_name,
+        priority=priority,
+        due=due,
+        all_day=all_day,
+        minutes=minutes,
+    )
+
+
+def _fallback_uid(comp: ics.Component, list_name: str) -> str:
+    """An id for a VTODO without a UID, from its list, summary and raw DUE.
+
+    It stays the same when other tasks in the list are added or completed;
+    identical tasks are told apart by a counter.
+    """
+    due = comp.get("DUE")
+    content = "\0".join((list_name, _text(comp, "SUMMARY"), due.value if due else ""))
+    return f"{list_name}:{hashlib.sha1(content.encode()).hexdigest()[:12]}"
@@ -0,0 +1,20 @@
+"""Helpers shared by the SQLite-backed indexes."""
+
+import sqlite3
+from collections.abc import Iterable, Iterator
+
+# SQLite builds before 3.32 allow at most 999 bound parameters per statement.
+IN_CHUNK = 500
+
+
+def select_in(conn: sqlite3.Connection, sql: str, values: Iterable, *params) -> Iterator[tuple]:
+    """Rows of ``sql`` ending in ``IN``, for every value in ``values``.
+
+    The values are bound in chunks of ``IN_CHUNK`` after ``params``, so an
+    arbitrarily long list never exceeds the parameter limit.
+    """
+    values = list(values)
+    for start in range(0, len(values), IN_CHUNK):
+        chunk = values[start : start + IN_CHUNK]
+        marks = ",".join("?" * len(chunk))
+        yield from conn.execute(f"{sql} ({marks})", (*params, *chunk))
@@ -0,0 +1,20 @@
+"""Inbox triage: the inbox.toml priority matrix compiled into one scorer.
+
+``TriageScorer`` assigns every message a category and a 0-100 priority
+score in a single batched pass, so the LLM only has to read the top of an
+already ranked list.
+"""
+
+from assistant.triage.automaton import KeywordAutomaton
+from assistant.triage.rules import BONUSES, CATEGORIES, Bonus, Category
+from assistant.triage.scorer import TriageResult, TriageScorer
+
+__all__ = [
+    "BONUSES",
+    "CATEGORIES",
+    "Bonus",
+    "Category",
+    "KeywordAutomaton",
+    "TriageResult",
+    "TriageScorer",
+]
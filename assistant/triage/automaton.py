@@ -0,0 +1,45 @@
+"""Multi-keyword matcher compiled into one regular expression.
+
+All keywords are folded into a trie and emitted as a single prefix-factored
+pattern, so each text is scanned once no matter how many keywords there
+are, and the regex engine never retries a shared prefix per keyword.
+"""
+
+import re
+from collections.abc import Iterable, Iterator
+
+
+def _trie_pattern(node: dict) -> str:
+    branches = [re.escape(ch) + _trie_pattern(child) for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ""
+    terminal = "" in node
+    if len(branches) == 1 and not terminal:
+        return branches[0]
+    group = "(?:" + "|".join(branches) + ")"
+    return group + "?" if terminal else group
+
+
+class KeywordAutomaton:
+    """Find whole-word occurrences of any keyword in lower-cased text.
+
+    Matches tolerate a plural ``s``/``es`` suffix and report the keyword as
+    it was registered.
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self.keywords = frozenset(keyword.lower() for keyword in keywords)
+        if not self.keywords:
+            raise ValueError("KeywordAutomaton needs at least one keyword")
+        trie: dict = {}
+        for keyword in self.keywords:
+            node = trie
+            for ch in keyword:
+                node = node.setdefault(ch, {})
+            node[""] = {}
+        self.pattern = re.compile(rf"(?<!\w)({_trie_pattern(trie)})(?:e?s)?(?!\w)")
+
+    def finditer(self, text: str, pos: int = 0) -> Iterator[tuple[int, str]]:
+        """Yield ``(offset, keyword)`` for every match in ``text``."""
+        for match in self.pattern.finditer(text, pos):
+            yield match.start(), match.group(1)
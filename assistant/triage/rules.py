@@ -0,0 +1,135 @@
+"""The inbox priority matrix from .gemini/commands/inbox.toml as data.
+
+Categories are listed in priority order. Keep these lists in sync with the
+"Detection Keywords" and "Phase 3: Priority Scoring Algorithm" sections of
+inbox.toml; the LLM prompt and the scorer should agree on what counts.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class Category:
+    """One row of the priority matrix.
+
+    ``keywords`` are matched in the subject and sender, and in the body too
+    when ``match_body`` is set; ``exclusions`` are matched anywhere and
+    disqualify the category.
+    """
+
+    name: str
+    label: str
+    base_score: int
+    keywords: tuple[str, ...]
+    exclusions: tuple[str, ...] = ()
+    match_body: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class Bonus:
+    """Points added on top of the category's base score."""
+
+    name: str
+    points: int
+    keywords: tuple[str, ...]
+    categories: tuple[str, ...] = ()  # empty: applies to every category
+
+
+CATEGORIES = (
+    Category(
+        "job",
+        "Job Opportunities",
+        100,
+        (
+            "interview", "position", "role", "opportunity", "career", "hiring",
+            "application", "candidate", "engineer", "developer", "architect",
+            "technical lead", "recruiter",
+        ),
+        exclusions=(
+            "job alert", "jobs for you", "new jobs", "daily digest", "apply now",
+            "torre", "jobalerts", "listings",
+        ),
+    ),
+    Category(
+        "urgent",
+        "Urgent / Time-Sensitive",
+        90,
+        (
+            "urgent", "asap", "immediate", "critical", "important", "expires",
+            "deadline", "due by", "action required", "please respond",
+            "needs approval", "approval needed",
+        ),
+    ),
+    Category(
+        "meeting",
+        "Meeting Requests",
+        70,
+        (
+            "meeting", "schedule", "calendar", "availability", "invite", "invitation",
+            "call", "sync", "catchup", "catch up", "1:1", "discussion", "webinar",
+            "conference", "presentation",
+        ),
+    ),
+    Category(
+        "financial",
+        "Financial Items",
+        70,
+        (
+            "payment", "invoice", "billing", "subscription", "withdraw", "renewal",
+            "expires", "domain", "account", "funds", "balance", "statement",
+        ),
+    ),
+    Category(
+        "work",
+        "Work Updates",
+        50,
+        (
+            "jira", "confluence", "github", "gitlab", "trello", "mentioned you",
+            "assigned to you", "due", "updated", "commented",
+        ),
+    ),
+    Category(
+        "newsletter",
+        "Newsletters/Promotional",
+        20,
+        (
+            "newsletter", "digest", "weekly roundup", "daily roundup", "unsubscribe",
+            "promotion", "discount", "special offer", "sale", "liked your", "followed you",
+            "new follower", "job alert", "new jobs",
+        ),
+        match_body=True,
+    ),
+)
+
+# Mail that matches no category: above bulk mail, below work notifications.
+UNCATEGORIZED = Category("other", "Other", 30, ())
+
+BONUSES = (
+    Bonus(
+        "relevance",
+        20,
+        (
+            "python", "fastapi", "django", "backend", "cloud", "aws", "kubernetes",
+            "ai", "ml", "rag", "llm", "distributed systems",
+        ),
+    ),
+    Bonus("seniority", 15, ("principal", "senior", "staff"), categories=("job",)),
+    Bonus(
+        "time",
+        10,
+        (
+            "today", "tonight", "tomorrow", "eod", "end of day", "within 24 hours",
+            "within 48 hours", "expires soon", "expiring",
+        ),
+    ),
+)
+
+# Sender reputation (+10) goes to human senders; these local parts are not.
+AUTOMATED_SENDERS = (
+    "noreply", "no-reply", "donotreply", "do-not-reply", "notifications",
+    "notification", "newsletter", "mailer-daemon", "marketing", "news", "alerts",
+    "jobalerts", "updates", "info",
+)
+SENDER_POINTS = 10
+
+MAX_SCORE = 100
@@ -0,0 +1,176 @@
+"""Batched triage scoring over the compiled priority matrix."""
+
+import re
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from email.utils import parseaddr
+from typing import Protocol
+
+from assistant.triage.automaton import KeywordAutomaton
+from assistant.triage.rules import (
+    AUTOMATED_SENDERS,
+    BONUSES,
+    CATEGORIES,
+    MAX_SCORE,
+    SENDER_POINTS,
+    UNCATEGORIZED,
+    Bonus,
+    Category,
+)
+
+class Triageable(Protocol):
+    """Anything with a subject and sender; ``body`` is optional."""
+
+    subject: str
+    sender: str
+
+
+@dataclass(frozen=True, slots=True)
+class TriageResult:
+    category: str
+    label: str
+    score: int
+    matched: tuple[str, ...]
+
+
+class TriageScorer:
+    """Score messages against every category in one batched pass.
+
+    Category keywords, exclusions and bonus keywords are compiled into a
+    ``KeywordAutomaton``. A batch is lower-cased and joined into one text so
+    it is scanned by a single ``finditer`` call, and each hit is attributed
+    to its message by walking the offsets in order. Bodies are scanned with
+    a second automaton holding only the keywords that count in a body, since
+    they are most of the text and most keywords only count in headers.
+    """
+
+    def __init__(
+        self,
+        categories: Sequence[Category] = CATEGORIES,
+        bonuses: Sequence[Bonus] = BONUSES,
+        body_limit: int | None = 4000,
+    ) -> None:
+        self.categories = {category.name: category for category in categories}
+        self._rank = {name: i for i, name in enumerate(self.categories)}
+        self.bonuses = {bonus.name: bonus for bonus in bonuses}
+        self.body_limit = body_limit
+        self._header_roles: dict[str, list[tuple[str, str]]] = {}
+        self._body_roles: dict[str, list[tuple[str, str]]] = {}
+
+        def add(keyword: str, role: tuple[str, str], in_body: bool) -> None:
+            self._header_roles.setdefault(keyword, []).append(role)
+            if in_body:
+                self._body_roles.setdefault(keyword, []).append(role)
+
+        for category in categories:
+            for keyword in category.keywords:
+                add(keyword, ("category", category.name), category.match_body)
+            for keyword in category.exclusions:
+                add(keyword, ("exclude", category.name), True)
+        for bonus in bonuses:
+            for keyword in bonus.keywords:
+                add(keyword, ("bonus", bonus.name), True)
+        self._header_automaton = KeywordAutomaton(self._header_roles)
+        self._body_automaton = KeywordAutomaton(self._body_roles)
+        self._automated = re.compile(
+            r"(?<![a-z])(?:" + "|".join(map(re.escape, AUTOMATED_SENDERS)) + r")(?![a-z])"
+        )
+        self._human_cache: dict[str, bool] = {}
+
+    def _is_human(self, sender: str) -> bool:
+        human = self._human_cache.get(sender)
+        if human is None:
+            local = parseaddr(sender)[1].partition("@")[0].lower()
+            human = bool(local) and self._automated.search(local) is None
+            self._human_cache[sender] = human
+        return human
+
+    def score(self, subject: str, sender: str = "", body: str = "") -> TriageResult:
+        return self.score_texts([(subject, sender, body)])[0]
+
+    def score_batch(self, messages: Iterable[Triageable]) -> list[TriageResult]:
+        """Score message-like objects; ``body`` is read when present."""
+        return self.score_texts(
+            (msg.subject, msg.sender, getattr(msg, "body", "") or "") for msg in messages
+        )
+
+    def score_texts(self, texts: Iterable[tuple[str, str, str]]) -> list[TriageResult]:
+        """Score ``(subject, sender, body)`` tuples, preserving order."""
+        headers: list[str] = []
+        bodies: list[str] = []
+        header_ends: list[int] = []
+        body_ends: list[int] = []
+        senders: list[str] = []
+        header_pos = body_pos = 0
+        for subject, sender, body in texts:
+            if self.body_limit is not None:
+                body = body[: self.body_limit]
+            # str.lower() can change a string's length, so offsets are taken
+            # from the lowered text. Subject and sender are scanned together.
+            header = f"{subject}\x01{sender}".lower()
+            body = body.lower()
+            header_pos += len(header)
+            body_pos += len(body)
+            headers.append(header)
+            bodies.append(body)
+            header_ends.append(header_pos)
+            body_ends.append(body_pos)
+            senders.append(sender)
+            header_pos += 1
+            body_pos += 1
+
+        hits: dict[int, tuple[set[str], set[str], set[str], list[str]]] = {}
+        for automaton, roles, text, ends in (
+            (self._header_automaton, self._header_roles, headers, header_ends),
+            (self._body_automaton, self._body_roles, bodies, body_ends),
+        ):
+            i = 0
+            for offset, keyword in automaton.finditer("\x00".join(text)):
+                while offset > ends[i]:
+                    i += 1
+                state = hits.get(i)
+                if state is None:
+                    state = hits[i] = (set(), set(), set(), [])
+                state[3].append(keyword)
+                for kind, name in roles[keyword]:
+                    state[0 if kind == "category" else 1 if kind == "exclude" else 2].add(name)
+
+        results = []
+        for i, sender in enumerate(senders):
+            state = hits.get(i)
+            sender_points = SENDER_POINTS if self._is_human(sender) else 0
+            if state is None:
+                score = UNCATEGORIZED.base_score + sender_points
+                results.append(TriageResult(UNCATEGORIZED.name, UNCATEGORIZED.label, score, ()))
+                continue
+            found, excluded, bonus, matched = state
+            eligible = found - excluded
+            if eligible:
+                category = self.categories[min(eligible, key=self._rank.__getitem__)]
+            else:
+                category = UNCATEGORIZED
+            score = category.base_score + sender_points
+            for name in bonus:
+                extra = self.bonuses[name]
+                if not extra.categories or category.name in extra.categories:
+                    score += extra.points
+            results.append(
+                TriageResult(
+                    category.name, category.label, min(score, MAX_SCORE), tuple(dict.fromkeys(matched))
+                )
+            )
+        return results
+
+    def rank(
+        self, messages: Sequence[Triageable], top: int | None = None
+    ) -> list[tuple[Triageable, TriageResult]]:
+        """Return ``(message, result)`` pairs, highest score first.
+
+        Ties go to the most recently received message when messages carry a
+        ``received_at`` timestamp.
+        """
+        scored = list(zip(messages, self.score_batch(messages)))
+        scored.sort(
+            key=lambda pair: (pair[1].score, getattr(pair[0], "received_at", 0.0)), reverse=True
+        )
+        return scored if top is None else scored[:top]
@@ -1,6 +1,6 @@
-def main():
-    print("Hello from my-personal-assistant!")
+import sys
 
+from assistant.cli import main
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,241 @@
+import json
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from assistant.articles import (
+    TOPICS,
+    Article,
+    ArticleStore,
+    MCPClient,
+    MCPError,
+    canonical_url,
+    from_mcp,
+    refresh,
+)
+from assistant.articles.benchmark import StandInServer, make_articles
+from assistant.articles.digest import group_by_category, render_weekly
+from assistant.articles.ingest import BACKFILL_DAYS, OVERLAP
+from assistant.articles.models import parse_published
+from assistant.cli import main
+
+NOW = datetime(2025, 10, 24, 12, tzinfo=timezone.utc).timestamp()
+DAY = 86400
+
+
+def article(title, link, category="Backend", published=NOW - DAY, excerpt="", source="Blog"):
+    return Article(canonical_url(link), link, title, source, category, published, excerpt)
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ArticleStore(tmp_path / "articles.sqlite3") as store:
+        yield store
+
+
+@contextmanager
+def serving(handler):
+    """The /mcp URL of ``handler`` served on a local port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/mcp"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_canonical_url_collapses_spellings_of_one_article():
+    expected = "https://netflixtechblog.com/post?id=7&page=2"
+    for link in (
+        "http://www.netflixtechblog.com/post/?page=2&id=7",
+        "https://netflixtechblog.com:443/post?id=7&utm_source=rss&page=2#comments",
+        "https://NetflixTechBlog.com/post?page=2&ref=hn&id=7",
+    ):
+        assert canonical_url(link) == expected
+    assert canonical_url("https://blog.example.com:8443/a/") == "https://blog.example.com:8443/a"
+
+
+def test_from_mcp_reads_records_and_rejects_unusable_ones():
+    record = {
+        "title": "Scaling Postgres",
+        "link": "https://www.example.com/p?utm_medium=email",
+        "feedTitle": "Example",
+        "feedCategory": "Backend",
+        "pubDate": "Thu, 23 Oct 2025 10:00:00 GMT",
+        "excerpt": "How we sharded.",
+    }
+    parsed = from_mcp(record)
+    assert parsed.url == "https://example.com/p"
+    assert parsed.link == record["link"]
+    assert parsed.published == parse_published("2025-10-23T10:00:00Z")
+    assert parsed.as_dict()["pubDate"] == "2025-10-23T10:00:00+00:00"
+    assert from_mcp(record | {"link": ""}) is None
+    assert from_mcp(record | {"pubDate": "sometime"}) is None
+    assert from_mcp(record | {"link": "https://example.com:80a/p"}) is None
+    assert from_mcp(record | {"link": "http://[::1/p"}) is None
+
+
+def test_add_dedupes_by_canonical_url_and_counts_updates(store):
+    first = article("Kafka at scale", "https://example.com/kafka")
+    again = article("Kafka at scale", "http://www.example.com/kafka/")
+    assert store.add([first, again]) == (1, 0)
+    assert store.add([again]) == (0, 0)
+    renamed = article("Kafka at scale, revisited", "https://example.com/kafka?utm_source=x")
+    assert store.add([renamed]) == (0, 1)
+    assert len(store) == 1
+    [hit] = store.search("revisited")
+    assert hit.article.title == "Kafka at scale, revisited"
+    assert store.search("scale kafka")[0].article.url == "https://example.com/kafka"
+
+
+def test_search_ranks_title_matches_above_excerpt_matches(store):
+    store.add(
+        [
+            article("Notes from the week", "https://a.example/1", excerpt="some graphql"),
+            article("GraphQL federation", "https://a.example/2", excerpt="schemas"),
+            article("Unrelated", "https://a.example/3", excerpt="kubernetes"),
+            article("Old GraphQL post", "https://a.example/4", published=NOW - 60 * DAY),
+        ]
+    )
+    hits = store.search("graphql")
+    assert [hit.article.link for hit in hits[:2]] == ["https://a.example/2", "https://a.example/4"]
+    assert hits[0].score > hits[-1].score > 0
+    assert "https://a.example/3" not in {hit.article.link for hit in hits}
+    recent = store.search("graphql", since=NOW - 7 * DAY)
+    assert {hit.article.link for hit in recent} == {"https://a.example/1", "https://a.example/2"}
+    # FTS5 syntax in user input is searched for, not parsed.
+    assert store.search('graphql" OR NOT (') != []
+    assert store.search("   ") == []
+
+
+def test_topics_match_categories_or_terms(store):
+    store.add(
+        [
+            article("Serving LLMs cheaply", "https://a.example/llm", category="Backend"),
+            article("Quarterly update", "https://a.example/ml", category="AI/ML"),
+            article("Postgres vacuum", "https://a.example/pg", category="Backend"),
+            article("Old agents", "https://a.example/old", "AI/ML", published=NOW - 30 * DAY),
+        ]
+    )
+    since = NOW - 7 * DAY
+    ai = [found.link for found in store.topic(TOPICS["ai"], since)]
+    assert sorted(ai) == ["https://a.example/llm", "https://a.example/ml"]
+    backend = {found.link for found in store.topic(TOPICS["backend"], since)}
+    assert backend == {"https://a.example/llm", "https://a.example/pg"}
+    assert len(store.topic(TOPICS["tech"], since)) == 3
+    assert len(store.topic(TOPICS["tech"], since, limit=1)) == 1
+    assert store.topic(TOPICS["cloud"], since) == []
+
+
+def test_refresh_backfills_then_waits_for_the_ttl_then_asks_for_the_delta(store):
+    records = make_articles(250, NOW, days=20)
+    with StandInServer(records) as server:
+        client = MCPClient(server.url)
+        first = refresh(store, client, ttl=3600, now=NOW)
+        assert (first.calls, first.added, first.updated) == (3, 250, 0)
+        assert len(store) == 250
+        since = parse_published(server.calls[0][1]["since"])
+        assert since == pytest.approx(NOW - BACKFILL_DAYS * DAY, abs=1)
+
+        skipped = refresh(store, client, ttl=3600, now=NOW + 60)
+        assert skipped.skipped and len(server.calls) == 3
+
+        server.add(make_articles(5, NOW + 7200, days=0.01, seed=3, start=250))
+        newest = first.state.newest
+        delta = refresh(store, client, ttl=3600, now=NOW + 7200)
+        assert (delta.calls, delta.added, delta.updated) == (1, 5, 0)
+        assert delta.fetched < 20
+        assert parse_published(server.calls[-1][1]["since"]) == pytest.approx(
+            newest - OVERLAP, abs=1
+        )
+        assert len(store) == 255
+        assert delta.state.synced_at == NOW + 7200
+
+
+def test_refresh_reads_event_streams_and_keeps_state_on_errors(store):
+    with StandInServer(make_articles(10, NOW, days=2), stream=True) as server:
+        report = refresh(store, MCPClient(server.url), now=NOW)
+        assert report.added == 10
+        with pytest.raises(MCPError, match="no tool"):
+            MCPClient(server.url).call_tool("get_article", {})
+    state = store.sync_state("engblogs")
+    with pytest.raises(MCPError):
+        refresh(store, MCPClient(server.url, timeout=1), force=True, now=NOW + 1)
+    assert store.sync_state("engblogs") == state
+
+
+def test_garbled_replies_are_mcp_errors_and_commands_answer_locally(store, tmp_path, capsys):
+    class Garbled(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(b"<html>502 Bad Gateway</html>")
+
+        def log_message(self, *args):
+            pass
+
+    with serving(Garbled) as url:
+        with pytest.raises(MCPError, match="unreadable reply to initialize"):
+            refresh(store, MCPClient(url), now=NOW)
+        path = str(tmp_path / "cli.sqlite3")
+        assert main(["articles", "--store", path, "--mcp-url", url, "search", "x", "--json"]) == 0
+    out = capsys.readouterr()
+    assert "answering locally" in out.err
+    assert json.loads(out.out)["stale"] is True
+
+
+def test_misshapen_replies_are_mcp_errors():
+    replies = []
+
+    class Misshapen(BaseHTTPRequestHandler):
+        def do_POST(self):
+            message = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            if "id" in message:
+                reply = replies[-1] if message["method"] == "tools/call" else {"result": {}}
+                self.wfile.write(json.dumps({"id": message["id"], **reply}).encode())
+
+        def log_message(self, *args):
+            pass
+
+    cases = [
+        ({"error": "rate limited"}, "tools/call: rate limited"),
+        ({"result": ["not", "an", "object"]}, "expected a result object, got list"),
+        ({"result": {"content": {"type": "text"}}}, "expected a list of content blocks"),
+        ({"result": {"content": ["[]", None]}}, "expected a list of content blocks"),
+        ({"result": {"content": [{"type": "text", "text": 7}]}}, "expected a JSON result"),
+    ]
+    with serving(Misshapen) as url:
+        for reply, error in cases:
+            replies.append(reply)
+            with pytest.raises(MCPError, match=error):
+                MCPClient(url).call_tool("search_articles", {})
+
+
+def test_weekly_groups_by_category_largest_first(store):
+    store.add(
+        [
+            article("A", "https://a.example/a", category="Cloud", published=NOW - 2 * DAY),
+            article("B", "https://a.example/b", category="Backend", published=NOW - 3 * DAY),
+            article("C", "https://a.example/c", category="Backend", published=NOW - DAY),
+            article("D", "https://a.example/d", category="Backend", published=NOW - 9 * DAY),
+        ]
+    )
+    week = store.since(NOW - 7 * DAY)
+    groups = group_by_category(week)
+    assert [(name, [a.title for a in members]) for name, members in groups] == [
+        ("Backend", ["C", "B"]),
+        ("Cloud", ["A"]),
+    ]
+    digest = render_weekly(week)
+    assert digest.index("## Backend") < digest.index("## Cloud")
+    assert "*Blog • October 23, 2025*" in digest
+    assert "**3 articles** tracked this week" in digest
@@ -0,0 +1,156 @@
+import asyncio
+import json
+import random
+import threading
+
+import pytest
+
+from assistant.bench import (
+    FETCH,
+    FILTER,
+    SERIALIZE,
+    Histogram,
+    Recorder,
+    Scale,
+    build,
+    compare,
+    run,
+    stage,
+)
+from assistant.bench import metrics
+from assistant.briefing import FunctionCollector, collect_briefing
+from assistant.cli import main
+
+TINY = Scale(messages=300, events=40, series=10, tasks=60, transactions=800)
+
+
+@pytest.fixture
+def recorder():
+    recorder = Recorder()
+    previous = metrics.install(recorder)
+    yield recorder
+    metrics.install(previous)
+
+
+def exact(samples, q):
+    ordered = sorted(samples)
+    return ordered[max(1, -(-len(ordered) * q // 100)) - 1]
+
+
+def test_histogram_percentiles_are_within_a_bucket_and_merge():
+    rng = random.Random(1)
+    samples = [rng.lognormvariate(-6, 1.5) for _ in range(5_000)]
+    first, second = Histogram(), Histogram()
+    for i, seconds in enumerate(samples):
+        (first if i % 2 else second).add(seconds)
+    first.merge(second)
+    for q in (50, 95, 99):
+        assert first.percentile(q) == pytest.approx(exact(samples, q), rel=metrics.GROWTH - 1)
+    assert first.count == 5_000 and first.high == max(samples) and first.low == min(samples)
+    assert first.percentile(100) == max(samples)
+    restored = Histogram.from_dict(json.loads(json.dumps(first.as_dict())))
+    assert restored.summary() == first.summary()
+    assert Histogram().percentile(50) == 0.0
+
+
+def test_stage_records_only_while_a_recorder_is_installed(recorder):
+    metrics.install(None)
+    with stage("mail.counts", FETCH):
+        pass
+    metrics.install(recorder)
+    assert recorder.snapshot() == {}
+
+    def work():
+        for _ in range(100):
+            with stage("briefing.tasks", FETCH):
+                pass
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    with pytest.raises(KeyError), stage("mail.counts", SERIALIZE):
+        raise KeyError
+    recorded = recorder.snapshot()
+    assert recorded["briefing.tasks"][FETCH].count == 400
+    assert recorded["mail.counts"][SERIALIZE].count == 1
+
+
+def test_flush_merges_into_the_metrics_file(tmp_path, recorder):
+    path = tmp_path / "metrics.json"
+    recorder.record("finance.analyze", FILTER, 0.002)
+    recorder.flush(path)
+    recorder.record("finance.analyze", FILTER, 0.004)
+    recorder.record("calendar.events", FETCH, 0.1)
+    recorder.flush(path)
+    assert recorder.snapshot() == {}
+    stored = metrics.load(path)
+    assert stored["finance.analyze"][FILTER].count == 2
+    assert stored["finance.analyze"][FILTER].high == 0.004
+    assert set(stored) == {"calendar.events", "finance.analyze"}
+    path.write_text('{"version": 99}')
+    with pytest.raises(metrics.MetricsError):
+        metrics.load(path)
+
+
+def test_commands_and_collectors_record_stages(tmp_path, monkeypatch, capsys):
+    dataset = build(tmp_path / "data", TINY)
+    monkeypatch.setenv("ASSISTANT_DATA_DIR", str(tmp_path))
+    monkeypatch.setenv(metrics.METRICS_ENV, "1")
+    assert main(["mail", "--index", str(dataset.mail_index), "triage", "8760", "--top", "5"]) == 0
+    assert len(json.loads(capsys.readouterr().out)["ranked"]) == 5
+    assert metrics.active() is None
+    stages = metrics.load(tmp_path / "metrics.json")["mail.triage"]
+    assert list(stages) == list(metrics.STAGES)
+    index = str(dataset.mail_index)
+    assert main(["mail", "--index", index, "sync", "--maildir", str(dataset.maildir)]) == 0
+    assert "unchanged" in capsys.readouterr().out
+    stages = metrics.load(tmp_path / "metrics.json")["mail.sync"]
+    assert list(stages) == [FETCH, SERIALIZE]
+
+    (tmp_path / "metrics.json").write_text('{"version": 99}')
+    assert main(["mail", "--index", index, "counts"]) == 0
+    assert "metrics not saved" in capsys.readouterr().err
+
+    recorder = Recorder()
+    metrics.install(recorder)
+    try:
+        asyncio.run(collect_briefing([FunctionCollector("tasks", "Tasks", lambda: "- done")]))
+    finally:
+        metrics.install(None)
+    assert recorder.snapshot()["briefing.tasks"][FETCH].count == 1
+
+
+def test_suite_runs_every_workload_on_a_synthetic_data_set(tmp_path):
+    dataset = build(tmp_path, TINY)
+    assert len(list((dataset.maildir / "cur").iterdir())) == TINY.messages
+    results = run(dataset, iterations=3, warmup=0, min_seconds=0)
+    groups = [result.workload.group for result in results]
+    assert groups == ["inbox", "inbox", "calendar", "tasks", "tasks", "finance"]
+    for result in results:
+        summary = result.summary()
+        assert summary["calls"] == 3 and summary["outputBytes"] > 0
+        assert summary["p50Ms"] <= summary["p95Ms"] <= summary["p99Ms"]
+        assert FETCH in summary["stages"]
+    assert list(results[1].summary()["stages"]) == list(metrics.STAGES)
+    [finance] = run(dataset, ["finance"], iterations=2, warmup=0, min_seconds=0)
+    assert finance.workload.name == "finance.expenses"
+
+
+def test_compare_flags_real_slowdowns_only():
+    def report(ops, p50, p95):
+        return {"workloads": {"w": {"opsPerSec": ops, "p50Ms": p50, "p95Ms": p95}}}
+
+    baseline = report(100.0, 10.0, 12.0)
+    changes = compare(report(70.0, 14.0, 12.5), baseline, threshold=0.25)
+    assert {c.metric: c.regressed for c in changes} == {
+        "opsPerSec": True,
+        "p50Ms": True,
+        "p95Ms": False,
+    }
+    # Twice as slow, but by less than the noise floor.
+    fast = compare(report(1000.0, 0.8, 0.9), report(2000.0, 0.4, 0.5), threshold=0.25)
+    assert not any(c.regressed for c in fast)
+    assert fast[1].ratio == 2.0
+    assert compare(report(70.0, 14.0, 12.5), {"workloads": {}}) == []
@@ -0,0 +1,106 @@
+import asyncio
+import sys
+import time
+
+import pytest
+
+from assistant.briefing import (
+    FAILED,
+    FRESH,
+    STALE,
+    BriefingStats,
+    FunctionCollector,
+    ResultCache,
+    SubprocessCollector,
+    collect_briefing,
+    stream_briefing,
+)
+from assistant.briefing.benchmark import StubCollector
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResultCache(tmp_path / "cache.json")
+
+
+def test_sections_stream_in_completion_order(cache):
+    collectors = [StubCollector("slow", 0.3), StubCollector("fast", 0.01), StubCollector("mid", 0.1)]
+    sections = asyncio.run(collect_briefing(collectors, cache))
+    assert [s.name for s in sections] == ["fast", "mid", "slow"]
+    assert all(s.status == FRESH for s in sections)
+    stats = BriefingStats.from_sections(sections)
+    assert stats.first_section_s < 0.1
+    assert stats.total_s < 0.45
+
+
+def test_first_section_is_delivered_before_slow_sources_finish(cache):
+    async def first():
+        started = time.perf_counter()
+        stream = stream_briefing([StubCollector("slow", 2, timeout=3), StubCollector("fast", 0.01)], cache)
+        section = await anext(stream)
+        waited = time.perf_counter() - started
+        await stream.aclose()  # cancels the slow collector
+        return section, waited
+
+    section, waited = asyncio.run(first())
+    assert section.name == "fast"
+    assert waited < 0.5
+
+
+def test_timeout_falls_back_to_stale_cache(cache):
+    cache.put("tasks", "- cached task", collected_at=1_000.0)
+    started = time.perf_counter()
+    sections = asyncio.run(collect_briefing([StubCollector("tasks", 5, timeout=0.1)], cache))
+    assert time.perf_counter() - started < 1
+    [section] = sections
+    assert section.status == STALE
+    assert section.content == "- cached task"
+    assert section.collected_at == 1_000.0
+    assert "timed out" in section.error
+    assert "stale" in section.render()
+
+
+def test_failure_without_cache_is_reported(cache):
+    [section] = asyncio.run(collect_briefing([StubCollector("news", 0, fail=True)], cache))
+    assert section.status == FAILED
+    assert section.error == "news unavailable"
+    assert "unavailable" in section.render()
+
+
+def test_fresh_results_refresh_the_cache(tmp_path, cache):
+    asyncio.run(collect_briefing([StubCollector("inbox", 0)], cache))
+    reloaded = ResultCache(tmp_path / "cache.json")
+    assert reloaded.get("inbox").content == "inbox content"
+
+
+def test_subprocess_collector_and_kill_on_timeout(cache):
+    ok = SubprocessCollector("echo", "Echo", (sys.executable, "-c", "print('hi')"), timeout=5)
+    hung = SubprocessCollector(
+        "hung", "Hung", (sys.executable, "-c", "import time; time.sleep(30)"), timeout=0.3
+    )
+    broken = SubprocessCollector("broken", "Broken", (sys.executable, "-c", "raise SystemExit(3)"))
+    missing = SubprocessCollector("missing", "Missing", ("definitely-not-a-command",))
+    started = time.perf_counter()
+    sections = {s.name: s for s in asyncio.run(collect_briefing([ok, hung, broken, missing], cache))}
+    assert time.perf_counter() - started < 5
+    assert sections["echo"].content == "hi"
+    assert sections["hung"].status == FAILED
+    assert sections["broken"].error == "exit status 3"
+    assert "not found" in sections["missing"].error
+
+
+def test_hung_sync_function_does_not_block(cache):
+    collector = FunctionCollector("sync", "Sync", lambda: time.sleep(30) or "late", timeout=0.1)
+    started = time.perf_counter()
+    [section] = asyncio.run(collect_briefing([collector], cache))
+    assert time.perf_counter() - started < 1
+    assert section.status == FAILED
+
+
+def test_sync_and_async_functions(cache):
+    async def coro():
+        return "async"
+
+    collectors = [FunctionCollector("a", "A", coro), FunctionCollector("s", "S", lambda: "sync")]
+    sections = {s.name: s.content for s in asyncio.run(collect_briefing(collectors, cache))}
+    assert sections == {"a": "async", "s": "sync"}
@@ -0,0 +1,239 @@
+import os
+import random
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from assistant.calendar import CalendarStore, IntervalTree, RRule, RRuleError, store
+from assistant.calendar.cache import ParsedCache
+from assistant.calendar.ics import ICSError, parse_duration
+
+NY = ZoneInfo("America/New_York")
+
+
+def expand(rule: str, start: datetime, limit: int = 10, until: datetime | None = None):
+    instances = []
+    for instance in RRule.parse(rule, until=until).iter(start):
+        instances.append(instance)
+        if len(instances) == limit:
+            break
+    return instances
+
+
+def test_weekly_byday_with_interval():
+    start = datetime(2026, 1, 6, 9)  # Tuesday
+    got = expand("FREQ=WEEKLY;INTERVAL=2;BYDAY=TU,TH", start, 4)
+    assert got == [
+        datetime(2026, 1, 6, 9),
+        datetime(2026, 1, 8, 9),
+        datetime(2026, 1, 20, 9),
+        datetime(2026, 1, 22, 9),
+    ]
+
+
+def test_monthly_last_friday_and_count():
+    got = expand("FREQ=MONTHLY;BYDAY=-1FR;COUNT=3", datetime(2026, 1, 30, 17), 10)
+    assert got == [datetime(2026, 1, 30, 17), datetime(2026, 2, 27, 17), datetime(2026, 3, 27, 17)]
+
+
+def test_monthly_day_31_skips_short_months():
+    got = expand("FREQ=MONTHLY", datetime(2026, 1, 31), 3)
+    assert got == [datetime(2026, 1, 31), datetime(2026, 3, 31), datetime(2026, 5, 31)]
+
+
+def test_monthly_bysetpos_last_weekday():
+    got = expand("FREQ=MONTHLY;BYDAY=MO,TU,WE,TH,FR;BYSETPOS=-1", datetime(2026, 1, 1), 3)
+    assert got == [datetime(2026, 1, 30), datetime(2026, 2, 27), datetime(2026, 3, 31)]
+
+
+def test_yearly_bymonth_nth_weekday():
+    # US daylight saving starts on the second Sunday of March.
+    got = expand("FREQ=YEARLY;BYMONTH=3;BYDAY=2SU", datetime(2026, 3, 8, 2), 2)
+    assert got == [datetime(2026, 3, 8, 2), datetime(2027, 3, 14, 2)]
+
+
+def test_yearly_leap_day_only_in_leap_years():
+    assert expand("FREQ=YEARLY", datetime(2024, 2, 29), 2) == [datetime(2024, 2, 29), datetime(2028, 2, 29)]
+
+
+def test_daily_until_is_inclusive():
+    got = expand("FREQ=DAILY", datetime(2026, 1, 1, 8), 10, until=datetime(2026, 1, 3, 8))
+    assert got == [datetime(2026, 1, d, 8) for d in (1, 2, 3)]
+
+
+def test_lazy_expansion_matches_full_expansion():
+    rule = RRule.parse("FREQ=WEEKLY;INTERVAL=3;BYDAY=MO,FR")
+    start = datetime(2020, 1, 3, 10)
+    after = datetime(2026, 6, 1)
+    full = [d for d in rule.iter(start) if d >= after][:5]
+    lazy = [d for d in rule.iter(start, after) if d >= after][:5]
+    assert lazy == full
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        "FREQ=HOURLY",
+        "FREQ=DAILY;BYHOUR=9",
+        "FREQ=DAILY;COUNT=2;UNTIL=20260101",
+        "FREQ=WEEKLY;BYDAY=XX",
+        "FREQ=DAILY;COUNT=0",
+        "FREQ=DAILY;INTERVAL=0",
+    ],
+)
+def test_unsupported_rules_are_rejected(rule):
+    with pytest.raises(RRuleError):
+        RRule.parse(rule)
+
+
+def test_duration_parsing():
+    assert parse_duration("PT1H30M") == timedelta(hours=1, minutes=30)
+    assert parse_duration("P1W") == timedelta(weeks=1)
+    assert parse_duration("-P1DT2H") == -timedelta(days=1, hours=2)
+
+
+def test_interval_tree_matches_brute_force():
+    rng = random.Random(3)
+    items = []
+    for i in range(2000):
+        start = rng.uniform(0, 10_000)
+        items.append((start, start + rng.choice((0, rng.uniform(0, 200))), i))
+    items.append((5000.0, float("inf"), "forever"))
+    tree = IntervalTree(items)
+    for _ in range(200):
+        lo = rng.uniform(-100, 10_100)
+        hi = lo + rng.uniform(0, 500)
+        expected = {item for start, end, item in items if start <= hi and end >= lo}
+        assert set(tree.overlapping(lo, hi)) == expected
+
+
+def write_calendar(path, events: str, name: str = "Work"):
+    path.write_text(f"BEGIN:VCALENDAR\r\nX-WR-CALNAME:{name}\r\n{events}END:VCALENDAR\r\n")
+
+
+STANDUP = """BEGIN:VEVENT\r
+UID:standup\r
+SUMMARY:Daily\\, standup\r
+DTSTART;TZID=America/New_York:20260302T093000\r
+DTEND;TZID=America/New_York:20260302T094500\r
+RRULE:FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR\r
+EXDATE;TZID=America/New_York:20260304T093000\r
+END:VEVENT\r
+BEGIN:VEVENT\r
+UID:standup\r
+RECURRENCE-ID;TZID=America/New_York:20260305T093000\r
+SUMMARY:Standup (moved)\r
+DTSTART;TZID=America/New_York:20260305T110000\r
+DTEND;TZID=America/New_York:20260305T111500\r
+END:VEVENT\r
+BEGIN:VEVENT\r
+UID:offsite\r
+SUMMARY:Offsite\r
+DTSTART;VALUE=DATE:20260306\r
+DTEND;VALUE=DATE:20260307\r
+END:VEVENT\r
+"""
+
+
+def window(day_from: int, day_to: int):
+    return datetime(2026, 3, day_from, tzinfo=NY), datetime(2026, 3, day_to, tzinfo=NY)
+
+
+def test_store_applies_exdate_and_overrides(tmp_path):
+    write_calendar(tmp_path / "work.ics", STANDUP)
+    store = CalendarStore([tmp_path])
+    got = [(o.summary, o.start.strftime("%d %H:%M")) for o in store.between(*window(2, 7))]
+    assert got == [
+        ("Daily, standup", "02 09:30"),
+        ("Daily, standup", "03 09:30"),
+        ("Standup (moved)", "05 11:00"),
+        ("Offsite", "06 00:00"),
+        ("Daily, standup", "06 09:30"),
+    ]
+    assert all(o.calendar == "Work" for o in store.between(*window(2, 7)))
+
+
+def test_store_keeps_wall_time_across_dst(tmp_path):
+    write_calendar(tmp_path / "work.ics", STANDUP)
+    store = CalendarStore([tmp_path / "work.ics"])
+    # DST starts 2026-03-08 in New York; the meeting stays at 09:30 local.
+    starts = [o.start.astimezone(NY) for o in store.between(*window(6, 12))]
+    assert [s.strftime("%H:%M") for s in starts if s.tzname() == "EDT"] == ["09:30"] * 3
+    assert starts[-1].utcoffset() == timedelta(hours=-4)
+
+
+def test_store_reloads_changed_file(tmp_path):
+    path = tmp_path / "work.ics"
+    write_calendar(path, STANDUP)
+    store = CalendarStore([tmp_path])
+    assert len(store.between(*window(2, 7))) == 5
+
+    write_calendar(path, STANDUP.replace("BYDAY=MO,TU,WE,TH,FR", "BYDAY=MO"))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert [o.summary for o in store.between(*window(2, 7))] == [
+        "Daily, standup",
+        "Standup (moved)",
+        "Offsite",
+    ]
+
+
+def test_store_reuses_parsed_files_across_instances(tmp_path, monkeypatch):
+    path = tmp_path / "cal" / "work.ics"
+    path.parent.mkdir()
+    write_calendar(path, STANDUP)
+    cache = ParsedCache(tmp_path / "cache")
+    expected = CalendarStore([path], cache).between(*window(2, 7))
+
+    def fail(*args):
+        raise AssertionError("parsed a file that was cached")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(store, "events_from_components", fail)
+        assert CalendarStore([path], cache).between(*window(2, 7)) == expected
+
+    write_calendar(path, STANDUP.replace("BYDAY=MO,TU,WE,TH,FR", "BYDAY=MO"))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert len(CalendarStore([path], cache).between(*window(2, 7))) == 3
+    for entry in (tmp_path / "cache").iterdir():
+        entry.write_bytes(b"not a pickle")
+    assert len(CalendarStore([path], cache).between(*window(2, 7))) == 3
+
+
+def test_store_skips_bad_events_and_unsupported_rules(tmp_path, caplog):
+    broken = """BEGIN:VEVENT\r
+UID:hourly\r
+SUMMARY:Pomodoro\r
+DTSTART;TZID=America/New_York:20260303T140000\r
+DTEND;TZID=America/New_York:20260303T142500\r
+RRULE:FREQ=HOURLY;INTERVAL=2\r
+END:VEVENT\r
+BEGIN:VEVENT\r
+UID:garbled\r
+SUMMARY:Garbled\r
+DTSTART:2026-03-03\r
+END:VEVENT\r
+BEGIN:VEVENT\r
+UID:lunch\r
+SUMMARY:Lunch\r
+a stray line with no value\r
+DTSTART;TZID=America/New_York:20260304T120000\r
+DTEND;TZID=America/New_York:20260304T130000\r
+END:VEVENT\r
+"""
+    write_calendar(tmp_path / "work.ics", STANDUP + broken)
+    store = CalendarStore([tmp_path])
+    got = [(o.summary, o.start.strftime("%d %H:%M")) for o in store.between(*window(2, 7))]
+    assert ("Pomodoro", "03 14:00") in got
+    assert [summary for summary, _ in got].count("Pomodoro") == 1
+    assert ("Lunch", "04 12:00") in got
+    assert len(got) == 7 and "Garbled" not in {summary for summary, _ in got}
+    assert "unsupported FREQ 'HOURLY'" in caplog.text
+    assert "skipping event 'garbled'" in caplog.text
+    assert "dropping content line without a value: 'a stray line with no value'" in caplog.text
+
+    write_calendar(tmp_path / "work.ics", STANDUP + "END:VTODO\r\n")
+    with pytest.raises(ICSError, match="unbalanced END:VTODO"):
+        store.refresh()
@@ -0,0 +1,231 @@
+import json
+from datetime import date
+
+import numpy as np
+import pytest
+
+from assistant.cli import main
+from assistant.finance import (
+    CSVFormatError,
+    TransactionStore,
+    budget,
+    categorize,
+    expenses,
+    import_csv,
+    monthly_by_category,
+    parse_period,
+)
+from assistant.finance.analysis import load_budget
+from assistant.finance.categories import CATEGORY_NAMES
+from assistant.finance.reader import from_days, parse_amount, parse_date
+
+TODAY = date(2025, 2, 28)
+
+LEDGER = """date,description,amount
+2025-01-15,Grocery Store,-125.50
+2025-01-16,Direct Deposit,3500.00
+01/17/2025,Electric Company,-89.23
+2025-01-18,Corner Coffee,-4.50
+2025-01-18,Corner Coffee,-4.50
+2025-01-19,Monthly service FEE,(12.00)
+2025-01-20,Transfer to savings,-500
+2025-02-03,SQ *CAFE ROMA,-18.00
+2025-02-04,not a number,abc
+2025-02-05,zero amount,0.00
+2099-01-01,from the future,-1.00
+"""
+
+
+def write(path, text):
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def names(codes):
+    return [CATEGORY_NAMES[code] for code in codes]
+
+
+def test_categorize_matches_keywords_at_word_starts():
+    got = categorize(["Monthly service fee", "Corner Coffee", "NETFLIX.COM", "Audible Books", "??"])
+    assert names(got) == ["fees", "uncategorized", "entertainment", "education", "uncategorized"]
+
+
+def test_categorize_first_category_wins():
+    # "utilities" is listed under housing and bills; housing comes first.
+    assert names(categorize(["City utilities"])) == ["housing"]
+
+
+def test_parse_date_formats():
+    assert from_days(parse_date("2025-01-15")) == date(2025, 1, 15)
+    assert from_days(parse_date("01/02/2025")) == date(2025, 1, 2)
+    assert from_days(parse_date("01/02/2025", dayfirst=True)) == date(2025, 2, 1)
+    assert from_days(parse_date("25/12/2024")) == date(2024, 12, 25)
+    assert parse_date("2025-02-30") is None
+
+
+def test_parse_amount_formats():
+    assert parse_amount("$1,234.50") == 1234.5
+    assert parse_amount("(12.00)") == -12.0
+    assert np.isnan(parse_amount("n/a"))
+
+
+def test_import_streams_chunks_and_reports(tmp_path):
+    store = TransactionStore(tmp_path / "store")
+    report = import_csv(store, write(tmp_path / "jan.csv", LEDGER), chunk_rows=3, today=TODAY)
+    assert report.imported == 8
+    assert report.rejected == 3
+    assert report.duplicates == 0
+    assert report.date_range == (date(2025, 1, 15), date(2025, 2, 3))
+    assert len(store) == 8
+    assert store.column("amount").tolist() == [
+        -12550, 350000, -8923, -450, -450, -1200, -50000, -1800,
+    ]
+    assert names(store.column("category")) == [
+        "food_dining", "income", "uncategorized", "uncategorized", "uncategorized",
+        "fees", "transfer", "food_dining",
+    ]
+    assert store.descriptions([0, 7]) == ["Grocery Store", "SQ *CAFE ROMA"]
+    assert store.accounts == [{"name": "checking", "type": "checking"}]
+
+
+def test_reimport_skips_duplicates_but_keeps_repeated_rows(tmp_path):
+    store = TransactionStore(tmp_path / "store")
+    source = write(tmp_path / "jan.csv", LEDGER)
+    import_csv(store, source, today=TODAY)
+    again = import_csv(TransactionStore(tmp_path / "store"), source, today=TODAY)
+    assert again.imported == 0 and again.duplicates == 8
+
+    # An overlapping export: both known coffees, a third one that day and a new row.
+    overlap = "date,description,amount\n" + "2025-01-18,Corner Coffee,-4.50\n" * 3
+    overlap += "2025-02-10,Rent payment,-2000\n"
+    report = import_csv(store, write(tmp_path / "overlap.csv", overlap), today=TODAY)
+    assert report.duplicates == 2
+    assert report.imported == 2
+    assert len(store) == 10
+
+
+def test_reimport_with_another_chunk_size_adds_nothing(tmp_path):
+    store = TransactionStore(tmp_path / "store")
+    text = "date,description,amount\n" + "2025-01-18,Corner Coffee,-4.50\n" * 3
+    source = write(tmp_path / "coffee.csv", text)
+    assert import_csv(store, source, chunk_rows=2, today=TODAY).imported == 3
+    again = import_csv(store, source, today=TODAY)
+    assert (again.imported, again.duplicates) == (0, 3)
+    assert import_csv(store, source, chunk_rows=1, today=TODAY).imported == 0
+
+    # A later export with a fourth coffee, split across a chunk boundary.
+    more = write(tmp_path / "more.csv", text + "2025-01-18,Corner Coffee,-4.50\n")
+    report = import_csv(store, more, chunk_rows=3, today=TODAY)
+    assert (report.imported, report.duplicates) == (1, 3)
+    assert len(store) == 4
+
+
+def test_same_rows_in_another_account_are_not_duplicates(tmp_path):
+    store = TransactionStore(tmp_path / "store")
+    source = write(tmp_path / "jan.csv", LEDGER)
+    import_csv(store, source, account_type="checking", today=TODAY)
+    report = import_csv(store, source, account_type="credit", today=TODAY)
+    assert report.imported == 8
+    assert set(store.column("account").tolist()) == {0, 1}
+
+
+def test_category_and_account_columns(tmp_path):
+    text = "date,description,amount,category,account\n"
+    text += "2025-01-02,Mystery shop,-10,Food & Dining,Visa\n"
+    text += "2025-01-03,Uber ride,-20,,Amex\n"
+    store = TransactionStore(tmp_path / "store")
+    import_csv(store, write(tmp_path / "cards.csv", text), account_type="credit", today=TODAY)
+    assert names(store.column("category")) == ["food_dining", "transportation"]
+    assert [a["name"] for a in store.accounts] == ["Visa", "Amex"]
+
+
+def test_missing_columns_raise(tmp_path):
+    with pytest.raises(CSVFormatError):
+        import_csv(TransactionStore(tmp_path / "store"), write(tmp_path / "bad.csv", "date,memo\n"))
+
+
+def test_cli_reports_bad_input_without_a_traceback(tmp_path, capsys):
+    store = str(tmp_path / "store")
+    bad = str(write(tmp_path / "bad.csv", "date,memo\n"))
+    argv = ["finance", "--store", store, "import", "--source", bad, "--type", "checking"]
+    assert main(argv) == 1
+    assert "missing column(s)" in capsys.readouterr().err
+    assert main(["finance", "--store", store, "analyze", "--type", "expenses", "--period", "x"]) == 1
+    assert "unknown period 'x'" in capsys.readouterr().err
+
+
+def test_failed_import_rolls_back(tmp_path, monkeypatch):
+    store = TransactionStore(tmp_path / "store")
+    source = write(tmp_path / "jan.csv", LEDGER)
+    import_csv(store, source, today=TODAY)
+
+    def explode(*args, **kwargs):
+        raise RuntimeError("disk on fire")
+
+    monkeypatch.setattr("assistant.finance.ingest.transaction_hashes", explode)
+    with pytest.raises(RuntimeError):
+        import_csv(store, write(tmp_path / "feb.csv", "date,description,amount\n2025-02-01,x,-1\n"))
+    assert len(store) == 8
+    reopened = TransactionStore(tmp_path / "store")
+    assert len(reopened) == 8
+    assert (tmp_path / "store" / "amount.col").stat().st_size == 8 * 8
+
+
+def test_interrupted_write_is_cut_off_on_open(tmp_path):
+    store = TransactionStore(tmp_path / "store")
+    import_csv(store, write(tmp_path / "jan.csv", LEDGER), today=TODAY)
+    with open(tmp_path / "store" / "date.col", "ab") as handle:
+        handle.write(b"\x00" * 12)
+    reopened = TransactionStore(tmp_path / "store")
+    assert len(reopened.column("date")) == 8
+    assert (tmp_path / "store" / "date.col").stat().st_size == 8 * 4
+
+
+def test_monthly_rollup(tmp_path):
+    store = TransactionStore(tmp_path / "store")
+    import_csv(store, write(tmp_path / "jan.csv", LEDGER), today=TODAY)
+    rollup = monthly_by_category(store, parse_period("all"))
+    assert rollup.months == ["2025-01", "2025-02"]
+    food = CATEGORY_NAMES.index("food_dining")
+    income = CATEGORY_NAMES.index("income")
+    assert rollup.spent[:, food].tolist() == [12550, 1800]
+    assert rollup.received[0, income] == 350000
+    assert rollup.count.sum() == 8
+
+
+def test_expenses_analysis_excludes_transfers(tmp_path):
+    store = TransactionStore(tmp_path / "store")
+    import_csv(store, write(tmp_path / "jan.csv", LEDGER), today=TODAY)
+    result = expenses(store, parse_period("2025-01"))
+    assert result["totalExpenses"] == 235.73
+    assert result["categories"][0]["category"] == "food_dining"
+    assert "transfer" not in {row["category"] for row in result["categories"]}
+    assert [row["amount"] for row in result["topExpenses"][:2]] == [125.5, 89.23]
+    assert result["monthly"] == {"2025-01": 235.73}
+
+
+def test_budget_variance(tmp_path):
+    store = TransactionStore(tmp_path / "store")
+    import_csv(store, write(tmp_path / "jan.csv", LEDGER), today=TODAY)
+    plan_file = write(tmp_path / "budget.json", json.dumps({"Food & Dining": 100, "fees": 20}))
+    plan = load_budget(plan_file)
+    result = budget(store, parse_period("2025-Q1"), plan)
+    assert result["budgetMonths"] == 3
+    food, fees = result["categories"]
+    assert (food["category"], food["budget"], food["actual"], food["status"]) == (
+        "food_dining", 300.0, 143.5, "under",
+    )
+    assert fees["variance"] == -48.0
+    assert {row["category"] for row in result["unbudgeted"]} == {"uncategorized"}
+
+
+def test_parse_period_forms():
+    today = date(2025, 5, 20)
+    assert from_days(parse_period("this-quarter", today).start) == date(2025, 4, 1)
+    assert from_days(parse_period("ytd", today).start) == date(2025, 1, 1)
+    rolling = parse_period("last-3-months", today)
+    assert rolling.end - rolling.start == 90
+    q4 = parse_period("2024-Q4", today)
+    assert (from_days(q4.start), from_days(q4.end)) == (date(2024, 10, 1), date(2025, 1, 1))
+    with pytest.raises(ValueError):
+        parse_period("fortnight", today)
@@ -0,0 +1,263 @@
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from assistant.mail import MailIndex, MaildirSource, MboxSource, is_actionable, sync
+from assistant.cli import main
+from assistant.mail.benchmark import build_maildir, write_message
+from assistant.mail.sources import BODY_HEAD_CHARS, BODY_TAIL_CHARS
+from assistant.triage import TriageScorer
+
+NOW = int(time.time())
+
+
+@pytest.fixture
+def index(tmp_path):
+    with MailIndex(tmp_path / "index.sqlite3") as idx:
+        yield idx
+
+
+def _age(folder: Path) -> None:
+    stale = NOW - 3600
+    for sub in ("cur", "new", "tmp"):
+        os.utime(folder / sub, (stale, stale))
+
+
+def test_actionable_matches_case_insensitively():
+    assert is_actionable("URGENT: invoice")
+    assert is_actionable("Please Review the PR")
+    assert not is_actionable("Lunch on Friday")
+
+
+def test_maildir_initial_sync_indexes_every_message(tmp_path, index):
+    maildir = build_maildir(tmp_path / "Maildir", 50, NOW)
+    [report] = sync(index, MaildirSource(maildir))
+    assert report.mailbox == "INBOX"
+    assert report.added == 50
+    assert index.message_count() == 50
+
+
+def test_maildir_unchanged_folder_is_skipped(tmp_path, index):
+    maildir = build_maildir(tmp_path / "Maildir", 20, NOW)
+    sync(index, MaildirSource(maildir))
+    [report] = sync(index, MaildirSource(maildir))
+    assert report.skipped
+
+
+def test_maildir_new_delivery_and_watermark(tmp_path, index):
+    maildir = build_maildir(tmp_path / "Maildir", 20, NOW)
+    sync(index, MaildirSource(maildir))
+    write_message(maildir, "new", 999, NOW - 30)
+    [report] = sync(index, MaildirSource(maildir))
+    assert (report.added, report.changed, report.removed) == (1, 0, 0)
+    mark = index.watermark("INBOX")
+    assert mark.received_at == NOW - 30
+    assert mark.message_id == f"<999.{NOW - 30}@bench.local>"
+
+
+def test_maildir_move_flag_change_and_delete(tmp_path, index):
+    maildir = tmp_path / "Maildir"
+    build_maildir(maildir, 0, NOW)
+    fresh = write_message(maildir, "new", 1, NOW - 60)
+    doomed = write_message(maildir, "cur", 2, NOW - 120)
+    _age(maildir)
+    sync(index, MaildirSource(maildir))
+    assert index.counts(NOW - 3600).unread == 2
+
+    fresh.rename(maildir / "cur" / (fresh.name + ":2,FS"))
+    doomed.unlink()
+    [report] = sync(index, MaildirSource(maildir))
+    assert (report.added, report.changed, report.removed) == (0, 1, 1)
+    assert index.counts(NOW - 3600).unread == 0
+    assert index.keys_at("INBOX", "cur") == {fresh.name.split(":")[0]: (True, True)}
+
+
+class _CountingView:
+    """Passes through to the index, counting the keys each lookup asks about."""
+
+    def __init__(self, index):
+        self.index = index
+        self.keys_read = 0
+
+    def keys_at(self, mailbox, location):
+        found = self.index.keys_at(mailbox, location)
+        self.keys_read += len(found)
+        return found
+
+    def locations(self, mailbox, keys):
+        self.keys_read += len(keys)
+        return self.index.locations(mailbox, keys)
+
+    def listing(self, mailbox, location):
+        return self.index.listing(mailbox, location)
+
+
+def test_maildir_flag_change_reads_only_the_renamed_file(tmp_path, index):
+    maildir = build_maildir(tmp_path / "Maildir", 200, NOW)
+    sync(index, MaildirSource(maildir))
+    assert len(index.listing("INBOX", "cur")) == 200
+    unread = min((maildir / "cur").glob("*:2,F"))
+    key = unread.name.split(":")[0]
+    unread.rename(unread.with_name(f"{key}:2,FS"))
+
+    view = _CountingView(index)
+    delta = MaildirSource(maildir).delta("INBOX", index.watermark("INBOX").cursor, view)
+    assert (delta.changed, delta.added, delta.removed) == ({key: ("cur", True, True)}, [], set())
+    assert view.keys_read == 0
+
+    # An index written before listings were stored falls back to the full diff.
+    index._conn.execute("DELETE FROM listings")
+    delta = MaildirSource(maildir).delta("INBOX", index.watermark("INBOX").cursor, view)
+    assert (delta.changed, delta.added, delta.removed) == ({key: ("cur", True, True)}, [], set())
+    assert view.keys_read == 200
+    index.apply("INBOX", delta.added, delta.changed, delta.removed, delta.cursor, delta.listings)
+    assert index.counts(0).unread == 19
+    assert key in {name.split(":")[0] for name in index.listing("INBOX", "cur")}
+
+
+def test_locations_looks_up_more_keys_than_one_statement_can_bind(tmp_path, index):
+    maildir = build_maildir(tmp_path / "Maildir", 1_200, NOW)
+    sync(index, MaildirSource(maildir))
+    keys = [path.name.split(":")[0] for path in (maildir / "cur").iterdir()]
+    assert index.locations("INBOX", [*keys, "missing"]) == dict.fromkeys(keys, "cur")
+
+
+def test_maildir_counts_match_scan_inbox_semantics(tmp_path, index):
+    maildir = tmp_path / "Maildir"
+    build_maildir(maildir, 0, NOW)
+    write_message(maildir, "cur", 3, NOW - 60, flags="F")  # "Invoice" - unread, flagged
+    write_message(maildir, "cur", 3 + 6, NOW - 60, flags="FS")  # read: ignored
+    write_message(maildir, "cur", 4, NOW - 60)  # "URGENT: action required" - actionable
+    write_message(maildir, "cur", 5, NOW - 86400 * 3)  # outside 24h window
+    sync(index, MaildirSource(maildir))
+    counts = index.counts(NOW - 86400)
+    assert (counts.unread, counts.actionable, counts.flagged) == (2, 1, 1)
+
+
+def test_maildir_account_tree_names_mailboxes(tmp_path, index):
+    build_maildir(tmp_path / "mail" / "work", 3, NOW)
+    build_maildir(tmp_path / "mail" / "work" / ".Archive", 2, NOW)
+    build_maildir(tmp_path / "mail" / "home", 1, NOW)
+    source = MaildirSource(tmp_path / "mail")
+    assert source.mailboxes() == ["home/INBOX", "work/INBOX", "work/Archive"]
+    sync(index, source)
+    assert index.message_count("work/Archive") == 2
+    # Each folder holds one unread message; only the inboxes count by default.
+    assert index.counts(0).unread == 2
+    assert {msg.mailbox for msg in index.unread(0)} == {"home/INBOX", "work/INBOX"}
+    assert index.counts(0, ["work/Archive"]).unread == 1
+    assert [msg.mailbox for msg in index.unread(0, mailboxes=["work/Archive"])] == ["work/Archive"]
+
+
+def test_body_snippets_are_indexed_for_triage(tmp_path, index, capsys):
+    maildir = tmp_path / "Maildir"
+    build_maildir(maildir, 0, NOW)
+    footer = "Unsubscribe from these emails"
+    (maildir / "cur" / f"{NOW - 60}.plain.host:2,").write_bytes(
+        (
+            "From: Dana <dana@example.com>\r\nSubject: Hello\r\n\r\n"
+            + "Some news. " * 500
+            + footer
+        ).encode()
+    )
+    (maildir / "cur" / f"{NOW - 120}.html.host:2,").write_bytes(
+        b"From: Lee <lee@example.com>\r\nSubject: Quick note\r\nMIME-Version: 1.0\r\n"
+        b'Content-Type: multipart/alternative; boundary="b"\r\n\r\n'
+        b"--b\r\nContent-Type: text/html; charset=utf-8\r\n"
+        b"Content-Transfer-Encoding: quoted-printable\r\n\r\n"
+        b"<style>p {}</style><p>Can we talk <b>tomorrow</b>?&nbsp;=E2=80=94 Lee</p>\r\n"
+        b"--b--\r\n"
+    )
+    sync(index, MaildirSource(maildir))
+    bodies = {msg.subject: msg.body for msg in index.unread(0)}
+    assert bodies["Quick note"] == "Can we talk tomorrow ? \u2014 Lee"
+    assert bodies["Hello"].endswith(footer)
+    assert len(bodies["Hello"]) == BODY_HEAD_CHARS + 1 + BODY_TAIL_CHARS
+
+    assert main(["mail", "--index", str(index.path), "triage", "1"]) == 0
+    ranked = {row["subject"]: row for row in json.loads(capsys.readouterr().out)["ranked"]}
+    assert ranked["Hello"]["category"] == "Newsletters/Promotional"
+    scorer = TriageScorer()
+    without_body = scorer.score("Quick note", "Lee <lee@example.com>").score
+    assert ranked["Quick note"]["score"] > without_body
+
+
+def test_index_from_before_body_snippets_is_migrated(tmp_path):
+    path = tmp_path / "old.sqlite3"
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE messages (mailbox TEXT NOT NULL, key TEXT NOT NULL, "
+            "location TEXT NOT NULL DEFAULT '', message_id TEXT NOT NULL, sender TEXT NOT NULL, "
+            "subject TEXT NOT NULL, received_at REAL NOT NULL, is_read INTEGER NOT NULL, "
+            "is_flagged INTEGER NOT NULL, is_actionable INTEGER NOT NULL, "
+            "PRIMARY KEY (mailbox, key)) WITHOUT ROWID"
+        )
+        conn.execute(
+            "INSERT INTO messages VALUES ('INBOX', 'k', 'cur', '<m>', 'a@b.c', 'Hi', ?, 0, 0, 0)",
+            (NOW,),
+        )
+    with MailIndex(path) as index:
+        [old] = index.unread(0)
+        assert (old.subject, old.body) == ("Hi", "")
+        write_message(build_maildir(tmp_path / "Maildir", 0, NOW), "new", 1, NOW - 30)
+        sync(index, MaildirSource(tmp_path / "Maildir"))
+        assert index.unread(0)[0].body == "Body text."
+
+
+def _mbox_message(seq: int, status: str = "") -> bytes:
+    stamp = time.strftime("%a %b %d %H:%M:%S %Y", time.gmtime(NOW - seq))
+    lines = [
+        f"From sender{seq}@example.com {stamp}",
+        f"Message-ID: <m{seq}@example.com>",
+        f"From: Sender <sender{seq}@example.com>",
+        f"Subject: Meeting {seq}",
+    ]
+    if status:
+        lines.append(f"Status: {status}")
+    return ("\n".join(lines) + "\n\nbody\n>From the body, escaped as mboxrd does\n\n").encode()
+
+
+def test_mbox_appends_are_read_from_the_previous_offset(tmp_path, index):
+    path = tmp_path / "inbox.mbox"
+    path.write_bytes(_mbox_message(1) + _mbox_message(2, "RO"))
+    [first] = sync(index, MboxSource(path))
+    assert first.added == 2
+
+    with open(path, "ab") as fh:
+        fh.write(_mbox_message(3))
+    [second] = sync(index, MboxSource(path))
+    assert (second.added, second.removed) == (1, 0)
+    assert index.message_count("INBOX") == 3
+    assert index.counts(0).unread == 2
+
+    [third] = sync(index, MboxSource(path))
+    assert third.skipped
+
+
+def test_mbox_rewrite_triggers_full_rescan(tmp_path, index):
+    path = tmp_path / "inbox.mbox"
+    path.write_bytes(_mbox_message(1) + _mbox_message(2) + _mbox_message(3))
+    sync(index, MboxSource(path))
+    path.write_bytes(_mbox_message(1, "RO") + _mbox_message(3))
+    [report] = sync(index, MboxSource(path))
+    assert report.removed >= 1
+    assert index.message_count("INBOX") == 2
+    assert index.counts(0).unread == 1
+
+
+def test_incremental_sync_does_not_reparse_indexed_messages(tmp_path, index, monkeypatch):
+    maildir = build_maildir(tmp_path / "Maildir", 200, NOW)
+    sync(index, MaildirSource(maildir))
+    write_message(maildir, "new", 500, NOW - 5)
+
+    loaded = []
+    original = MaildirSource._load
+    monkeypatch.setattr(
+        MaildirSource, "_load", lambda self, path, *a: loaded.append(path) or original(self, path, *a)
+    )
+    sync(index, MaildirSource(maildir))
+    assert len(loaded) == 1
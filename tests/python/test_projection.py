@@ -0,0 +1,105 @@
+import json
+
+import numpy as np
+import pytest
+
+from assistant.cli import main
+from assistant.finance.projection import (
+    MAX_MONTHS,
+    SCENARIOS,
+    DebtPayoffPlan,
+    RetirementPlan,
+    SavingsPlan,
+    Scenario,
+    project,
+    report_points,
+)
+
+FLAT = Scenario("flat", 0.0, 0.0, 0.06, 0.0)
+
+
+def test_seed_reproduces_bands_inline_and_in_a_pool():
+    plan = RetirementPlan(35, 65, 50_000, 500, 3_000)
+    inline = project(plan, SCENARIOS, months=120, paths=5_000, seed=42, workers=0)
+    pooled = project(plan, SCENARIOS, months=120, paths=5_000, seed=42, workers=2)
+    for a, b in zip(inline, pooled):
+        for q in a.bands:
+            np.testing.assert_array_equal(a.bands[q], b.bands[q])
+        assert a.success_rate == b.success_rate
+    other = project(plan, ["moderate"], months=120, paths=5_000, seed=43, workers=0)
+    assert not np.array_equal(inline[1].bands[50], other[0].bands[50])
+
+
+def test_zero_volatility_matches_expected_path():
+    plan = SavingsPlan(10_000, 500, goal_amount=20_000)
+    (result,) = project(plan, [FLAT], months=24, paths=100, seed=1)
+    for band in result.bands.values():
+        np.testing.assert_allclose(band, result.expected)
+    monthly = 1.06 ** (1 / 12) - 1
+    closed = 10_000 * (1 + monthly) ** 24 + 500 * ((1 + monthly) ** 24 - 1) / monthly
+    assert result.expected[-1] == pytest.approx(closed)
+    assert result.success_rate == 1.0
+
+
+def test_mean_growth_matches_scenario_return():
+    plan = SavingsPlan(100_000, 0, goal_amount=0)
+    (result,) = project(plan, ["aggressive"], months=120, paths=20_000, seed=7, step=120)
+    # The median trails the mean under lognormal returns; the mean tracks 10%/year.
+    assert result.bands[50][-1] < result.expected[-1]
+    assert result.bands[5][-1] < result.bands[50][-1] < result.bands[95][-1]
+    assert result.expected[-1] == pytest.approx(100_000 * 1.10**10)
+
+
+def test_retirement_success_rate():
+    safe = RetirementPlan(60, 65, 1_000_000, 0, monthly_withdrawal=1_000)
+    broke = RetirementPlan(60, 65, 10_000, 0, monthly_withdrawal=5_000)
+    (ok,) = project(safe, ["conservative"], months=360, paths=2_000, seed=1)
+    (bad,) = project(broke, ["conservative"], months=360, paths=2_000, seed=1)
+    assert ok.success_rate > 0.99
+    assert bad.success_rate == 0.0
+    assert bad.bands[95][-1] == 0.0
+
+
+def test_debt_is_paid_off_at_the_apr_whatever_the_scenario():
+    plan = DebtPayoffPlan(10_000, 0.12, 500)  # paid off in month 23
+    (late,) = project(plan, ["aggressive"], months=22, paths=50, seed=1)
+    (paid,) = project(plan, ["aggressive"], months=24, paths=50, seed=1)
+    assert late.success_rate == 0.0 and paid.success_rate == 1.0
+    assert paid.expected[1] == pytest.approx(10_000 * 1.01 - 500)
+    assert paid.bands[5][1] == paid.bands[95][1] == pytest.approx(paid.expected[1])
+    assert paid.bands[50][-1] == 0.0
+    (never,) = project(DebtPayoffPlan(10_000, 0.12, 100), months=MAX_MONTHS, paths=10)
+    assert never.success_rate == 0.0
+
+
+def test_withdrawals_start_at_retirement_and_track_expense_growth():
+    plan = RetirementPlan(64, 65, 0, 100, monthly_withdrawal=1_000)
+    flows = plan.cashflows(SCENARIOS["moderate"], 24)
+    assert (flows[:12] > 0).all() and (flows[12:] < 0).all()
+    assert flows[23] == pytest.approx(-1_000 * 1.03 ** (23 / 12))
+
+
+def test_report_points_and_odd_path_counts():
+    assert report_points(12).tolist() == list(range(13))
+    assert report_points(130).tolist()[-3:] == [108, 120, 130]
+    (result,) = project(SavingsPlan(0, 100, 0), ["moderate"], months=6, paths=2_345, seed=1)
+    assert result.paths == 2_345
+    assert len(result.as_dict()["points"]) == 7
+
+
+def test_months_out_of_range():
+    with pytest.raises(ValueError):
+        project(SavingsPlan(0, 0, 0), months=0)
+
+
+def test_cli_clamps_the_horizon_and_rejects_bad_arguments(capsys):
+    argv = ["finance", "project", "--paths", "100", "--workers", "0", "--seed", "1"]
+    assert main([*argv, "--current-age", "10"]) == 0
+    assert json.loads(capsys.readouterr().out)["months"] == MAX_MONTHS
+    debt = ["--type", "debt", "--balance", "5000", "--apr", "0.2", "--monthly-payment", "300"]
+    assert main([*argv, *debt, "--months", "24"]) == 0
+    assert json.loads(capsys.readouterr().out)["projections"][0]["successRate"] == 1.0
+    for bad in (["--paths", "0"], ["--months", str(MAX_MONTHS + 1)], ["--current-age", "-1"]):
+        with pytest.raises(SystemExit):
+            main([*argv, *bad])
+        assert "must be" in capsys.readouterr().err
@@ -0,0 +1,235 @@
+import random
+from datetime import date, datetime, time, timedelta, timezone
+
+from assistant.calendar.cache import ParsedCache
+from assistant.calendar.ics import parse
+from assistant.calendar.store import Occurrence
+from assistant.schedule import (
+    Task,
+    TaskStore,
+    WorkDay,
+    merge,
+    overlaps,
+    pack,
+    plan_day,
+    subtract,
+    tasks_from_components,
+)
+from assistant.schedule.benchmark import linear_buckets, write_reminders
+from assistant.schedule.planner import BREAK, EVENT, OPEN, TASK
+from assistant.schedule import tasks as tasks_module
+from assistant.schedule.tasks import local_day
+
+DAY = date(2026, 3, 10)
+START, END = local_day(DAY)
+HOUR = 3600
+
+
+def at(hours: float, day: date = DAY) -> float:
+    return datetime.combine(day, time()).astimezone().timestamp() + hours * HOUR
+
+
+def task(uid, priority=0, due=None, minutes=30, title=None, all_day=False):
+    return Task(uid, title or uid, "Work", priority, due, all_day, minutes)
+
+
+def event(summary, start, end, all_day=False):
+    zone = datetime.now().astimezone().tzinfo
+    return Occurrence(summary, summary, at(start), at(end), zone, "", "Work", False, all_day)
+
+
+def test_tasks_land_in_buckets_and_follow_updates():
+    store = TaskStore(
+        [
+            task("late", 5, at(-30)),
+            task("now", 9, at(10)),
+            task("soon", 1, at(40)),
+            task("someday", 1),
+        ],
+        day=(START, END),
+    )
+    assert store.counts() == {"overdue": 1, "today": 1, "upcoming": 1, "undated": 1}
+    store.upsert(task("soon", 1, at(11)))
+    store.upsert(task("late", 5, at(-30)))  # unchanged: no new entry
+    assert [t.uid for t in store.today()] == ["soon", "now"]
+    assert store.remove("now") and not store.remove("now")
+    assert store.counts() == {"overdue": 1, "today": 1, "upcoming": 0, "undated": 1}
+    assert len(store) == 3 and store.get("now") is None
+
+
+def test_set_day_moves_tasks_forward_and_back():
+    store = TaskStore(
+        [task("a", due=at(10)), task("b", due=at(30)), task("c", due=at(60))], day=(START, END)
+    )
+    store.set_day(*local_day(DAY + timedelta(days=1)))
+    assert [t.uid for t in store.overdue()] == ["a"]
+    assert [t.uid for t in store.today()] == ["b"]
+    assert [t.uid for t in store.upcoming()] == ["c"]
+    store.set_day(*local_day(DAY + timedelta(days=3)))
+    assert [t.uid for t in store.overdue()] == ["a", "b", "c"]
+    store.set_day(START, END)
+    assert store.counts() == {"overdue": 0, "today": 1, "upcoming": 2, "undated": 0}
+
+
+def test_heaps_agree_with_a_linear_scan_under_random_edits():
+    rng = random.Random(3)
+    store = TaskStore(day=(START, END))
+    live: dict[str, Task] = {}
+    for step in range(3000):
+        uid = f"t{rng.randrange(400)}"
+        if rng.random() < 0.2:
+            store.remove(uid)
+            live.pop(uid, None)
+        else:
+            due = None if rng.random() < 0.2 else at(rng.uniform(-72, 72))
+            live[uid] = task(uid, rng.choice((0, 1, 5, 9)), due, title=f"T{step}")
+            store.upsert(live[uid])
+    overdue, today = linear_buckets(list(live.values()), START, END)
+    assert store.overdue() == overdue
+    assert store.overdue(5) == overdue[:5]
+    assert store.today() == today
+    assert list(store.ranked()) == sorted(overdue + today, key=lambda t: t.rank)
+    upcoming = sorted((t for t in live.values() if t.due and t.due >= END), key=lambda t: t.due)
+    assert [t.uid for t in store.upcoming()] == [t.uid for t in upcoming]
+    assert len(store._entries) == len(live)
+
+
+def test_vtodo_exports_load_and_reload_incrementally(tmp_path):
+    write_reminders(tmp_path, 200, DAY)
+    store = TaskStore(day=(START, END), paths=[tmp_path])
+    assert len(store) == 200
+    assert {t.list_name for t in store.overdue()} <= {p.stem for p in tmp_path.glob("*.ics")}
+    work = tmp_path / "Work.ics"
+    text = work.read_text()
+    todo = "BEGIN:VTODO\r\nUID:extra\r\nSUMMARY:Extra\r\nDUE;VALUE=DATE:20260310\r\n"
+    todo += "PRIORITY:1\r\nEND:VTODO\r\n"
+    work.write_text(text.replace("END:VCALENDAR", todo + "END:VCALENDAR"))
+    assert store.refresh() == [work]
+    assert len(store) == 201
+    extra = store.get("extra")
+    assert extra.all_day and extra.due == START and store.today()[0] == extra
+    (tmp_path / "Home.ics").unlink()
+    store.refresh()
+    assert all(t.list_name != "Home" for t in store.overdue())
+
+
+def test_cached_exports_give_the_same_buckets(tmp_path, monkeypatch):
+    lists = tmp_path / "lists"
+    lists.mkdir()
+    write_reminders(lists, 200, DAY)
+    cache = ParsedCache(tmp_path / "cache")
+    fresh = TaskStore(day=(START, END), paths=[lists], cache=cache)
+    monkeypatch.setattr(tasks_module, "tasks_from_components", None)  # a reparse would fail
+    cached = TaskStore(day=(START, END), paths=[lists], cache=cache)
+    assert cached.counts() == fresh.counts()
+    assert cached.overdue() == fresh.overdue() and cached.undated() == fresh.undated()
+
+
+def test_tasks_from_components_skips_completed_and_reads_duration():
+    components = parse(
+        "BEGIN:VCALENDAR\nX-WR-CALNAME:Errands\n"
+        "BEGIN:VTODO\nUID:1\nSUMMARY:Buy milk\nDUE:20260310T170000Z\nPRIORITY:5\n"
+        "DURATION:PT45M\nEND:VTODO\n"
+        "BEGIN:VTODO\nUID:2\nSUMMARY:Done\nSTATUS:COMPLETED\nEND:VTODO\n"
+        "BEGIN:VTODO\nUID:3\nSUMMARY:Also done\nCOMPLETED:20260301T100000Z\nEND:VTODO\n"
+        "END:VCALENDAR\n"
+    )
+    [milk] = tasks_from_components(components, "fallback")
+    assert (milk.list_name, milk.priority, milk.minutes) == ("Errands", 5, 45)
+    assert milk.due == datetime(2026, 3, 10, 17, tzinfo=timezone.utc).timestamp()
+
+
+def test_malformed_reminders_are_skipped_and_uidless_ids_are_stable(caplog):
+    def load(*todos):
+        body = "".join(f"BEGIN:VTODO\n{todo}END:VTODO\n" for todo in todos)
+        return tasks_from_components(parse(f"BEGIN:VCALENDAR\n{body}END:VCALENDAR\n"), "Home")
+
+    bad_due = "UID:1\nSUMMARY:Bad due\nDUE:2026-03-10\n"
+    bad_duration = "UID:2\nSUMMARY:Bad duration\nDURATION:90 minutes\n"
+    done = "SUMMARY:Done already\nSTATUS:COMPLETED\n"
+    water = "SUMMARY:Water plants\nDUE;VALUE=DATE:20260310\n"
+    call = "SUMMARY:Call mum\n"
+    assert [t.title for t in load(bad_due, bad_duration, call)] == ["Call mum"]
+    assert "skipping task 'Bad due' in Home" in caplog.text
+    assert "skipping task 'Bad duration' in Home" in caplog.text
+
+    ids = [t.uid for t in load(water, call, call)]
+    assert len(set(ids)) == 3
+    assert [t.uid for t in load(done, water, call, call)] == ids
+
+
+def test_interval_arithmetic():
+    assert merge([(5, 7), (1, 3), (2, 4), (4, 4.5), (8, 8)]) == [(1, 4.5), (5, 7)]
+    assert subtract((0, 10), [(2, 3), (2.5, 4), (9, 12), (-5, 1)]) == [(1, 2), (4, 9)]
+    assert subtract((0, 10), [(1, 1.5), (6, 7)], min_length=2) == [(1.5, 6), (7, 10)]
+    assert subtract((0, 10), []) == [(0, 10)]
+    a, b, c = event("A", 9, 10), event("B", 9.5, 11), event("C", 10, 10.5)
+    assert [(x.summary, y.summary) for x, y in overlaps([c, b, a])] == [("A", "B"), ("B", "C")]
+
+
+def test_pack_is_first_fit_in_rank_order_and_respects_due_times():
+    gaps = [(at(9), at(10)), (at(11), at(13))]
+    tasks = [
+        task("big", 1, minutes=90),
+        task("a", 1),
+        task("deadline", 5, due=at(12)),
+        task("b", 9, minutes=60),
+    ]
+    blocks, left = pack(tasks, gaps)
+    placed = {block.task.uid: (block.start, block.end) for block in blocks}
+    assert placed["big"] == (at(11), at(12.5))
+    assert placed["a"] == (at(9), at(9.5))
+    assert placed["deadline"] == (at(9.5), at(10))
+    assert "b" not in placed
+    assert left == [(at(12.5), at(13))]
+    assert all(block.kind == TASK for block in blocks)
+
+
+def test_plan_day_packs_around_events_and_is_deterministic():
+    store = TaskStore(
+        [
+            task("overdue-high", 1, at(-20), minutes=60),
+            task("today-low", 9, at(16)),
+            task("today-none", 0, at(0), all_day=True),
+            task("tomorrow", 1, at(30)),
+        ],
+        day=(START, END),
+    )
+    events = [
+        event("Standup", 9, 9.5),
+        event("Review", 10.5, 11.5),
+        event("Clash", 11, 12),
+        event("Offsite", 0, 24, all_day=True),
+    ]
+    workday = WorkDay(DAY)
+    plan = plan_day(store, events, workday)
+    schedule = [(b.kind, b.title, b.start, b.end) for b in plan.blocks]
+    assert schedule[:4] == [
+        (EVENT, "Standup", at(9), at(9.5)),
+        (TASK, "overdue-high !!!", at(9.5), at(10.5)),
+        (EVENT, "Review", at(10.5), at(11.5)),
+        (EVENT, "Clash", at(11), at(12)),
+    ]
+    assert (BREAK, "Lunch", at(12), at(13)) in schedule
+    assert (TASK, "today-low !", at(13), at(13.5)) in schedule
+    assert (OPEN, "Open time", at(14), at(17)) in schedule
+    assert all(b.title != "tomorrow" for b in plan.blocks)
+    assert [t.uid for t in plan.focus] == ["overdue-high", "today-low", "today-none"]
+    assert plan.unscheduled == 0
+    assert [(a.summary, b.summary) for a, b in plan.conflicts] == [("Review", "Clash")]
+    assert plan_day(store, events, workday).as_dict() == plan.as_dict()
+
+    text = plan.render()
+    assert text.startswith("⏰ RECOMMENDED SCHEDULE\n• 9:00-9:30: 📅 Standup")
+    assert "⚠️ Overlap at 11:00: Review / Clash" in text
+    assert "1. overdue-high !!! - overdue since Mar 9 (Work)" in text
+    ahead = plan_day(store, events, workday, lookahead_days=1)
+    assert "tomorrow !!!" in {b.title for b in ahead.blocks}
+
+
+def test_plan_day_reports_tasks_that_do_not_fit():
+    store = TaskStore([task(f"t{i}", due=at(-1), minutes=120) for i in range(6)], day=(START, END))
+    plan = plan_day(store, [], WorkDay(DAY, breaks=()))
+    assert sum(b.kind == TASK for b in plan.blocks) == 4
+    assert plan.unscheduled == 2
+    assert "2 overdue/today tasks did not fit" in plan.render()
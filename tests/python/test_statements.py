@@ -0,0 +1,141 @@
+from datetime import date
+
+import pytest
+
+from assistant.finance import TransactionStore
+from assistant.finance.benchmark import write_pdf, write_statements
+from assistant.finance.reader import from_days
+from assistant.finance.statements import (
+    ExtractSummary,
+    Statement,
+    StatementCache,
+    StatementError,
+    extract,
+    import_statements,
+    parse_lines,
+    to_batch,
+)
+
+TODAY = date(2025, 2, 28)
+
+PAGE = """Sample Bank
+Statement Period: December 15, 2024 through January 14, 2025
+Trans Post Description Amount
+12/16 12/17 BLUE BOTTLE CAFE 4.50
+12/31 01/02 Delta Airline 412.00
+Jan 3 Payment - Thank You 500.00 CR
+01/05 Monthly service fee (12.00)
+01/14 New Balance 1,234.56
+Total fees 12.00
+"""
+
+
+def statement(lines, period=(), source="x.pdf"):
+    return Statement(source, "0" * 64, 1, list(lines), list(period), cached=False)
+
+
+def test_parse_lines_reads_rows_and_header_dates():
+    lines, period = parse_lines(PAGE)
+    assert lines == [
+        ("12/16", "BLUE BOTTLE CAFE", "4.50"),
+        ("12/31", "Delta Airline", "412.00"),
+        ("Jan 3", "Payment - Thank You", "500.00 CR"),
+        ("01/05", "Monthly service fee", "(12.00)"),
+    ]
+    assert period == ["December 15, 2024", "January 14, 2025"]
+
+
+def test_rows_take_the_year_from_the_statement_period():
+    batch = to_batch(statement(*parse_lines(PAGE)), today=TODAY, charges_positive=True)
+    assert [from_days(day) for day in batch.dates] == [
+        date(2024, 12, 16), date(2024, 12, 31), date(2025, 1, 3), date(2025, 1, 5),
+    ]
+    # Card charges are printed positive; CR marks the payment as money in.
+    assert batch.amounts.tolist() == [-450, -41200, 50000, 1200]
+
+
+def test_checking_amounts_keep_their_sign_and_bad_rows_are_dropped():
+    lines = [
+        ("2025-01-02", "Payroll", "3,500.00"),
+        ("Jan 20, 2025", "Rent", "-2,000.00"),
+        ("02/30/2025", "no such day", "-1.00"),
+        ("2099-01-01", "future", "-1.00"),
+        ("2025-01-03", "zero", "0.00"),
+    ]
+    batch = to_batch(statement(lines), today=TODAY)
+    assert batch.amounts.tolist() == [350000, -200000]
+    assert batch.rejected == 3
+
+
+def test_extract_caches_by_content(tmp_path):
+    pytest.importorskip("pdfplumber")
+    paths = write_statements(tmp_path / "pdf", 3, rows=70)
+    cache = StatementCache(tmp_path / "cache")
+    cold = list(extract(paths, cache, workers=0))
+    assert [s.cached for s in cold] == [False] * 3
+    assert [s.pages for s in cold] == [2] * 3
+    assert [len(s.lines) for s in cold] == [70] * 3
+
+    # A renamed copy is still cached; a rewritten statement is read again.
+    renamed = tmp_path / "renamed.pdf"
+    renamed.write_bytes(paths[0].read_bytes())
+    write_statements(tmp_path / "pdf", 1, rows=10)
+    twice = tmp_path / "twice.pdf"
+    twice.write_bytes(paths[1].read_bytes())
+    summary = ExtractSummary()
+    warm = list(extract([*paths, renamed, twice], cache, workers=0, summary=summary))
+    assert [(s.source, s.cached, len(s.lines)) for s in warm] == [
+        (str(paths[0]), False, 10),
+        (str(paths[1]), True, 70),
+        (str(paths[2]), True, 70),
+        (str(renamed), True, 70),
+    ]
+    assert warm[3].lines == cold[0].lines
+    assert (summary.statements, summary.cached, summary.pages, summary.repeated) == (4, 3, 1, 1)
+
+
+def test_import_statements_streams_into_the_store(tmp_path):
+    pytest.importorskip("pdfplumber")
+    paths = write_statements(tmp_path / "pdf", 2, rows=30, first=date(2024, 12, 1))
+    store = TransactionStore(tmp_path / "store")
+    cache = StatementCache(tmp_path / "cache")
+    report, summary = import_statements(store, paths, cache=cache, workers=0, today=TODAY)
+    assert (report.imported, summary.pages, summary.cached) == (60, 2, 0)
+    assert report.date_range == (date(2024, 12, 1), date(2025, 1, 31))
+    (first,) = extract(paths[:1], cache)
+    assert first.cached
+    assert store.descriptions([0]) == [first.lines[0][1]]
+
+    again, summary = import_statements(store, paths, cache=cache, workers=0, today=TODAY)
+    assert (again.imported, again.duplicates, summary.cached) == (0, 60, 2)
+
+
+def test_pool_reads_page_ranges_in_order(tmp_path, monkeypatch):
+    pytest.importorskip("pdfplumber")
+    monkeypatch.setattr("assistant.finance.statements.POOL_THRESHOLD", 0)
+    monkeypatch.setattr("assistant.finance.statements.PAGES_PER_TASK", 1)
+    paths = write_statements(tmp_path / "pdf", 2, rows=120)
+    inline = {s.source: s for s in extract(paths, workers=0)}
+    pooled = {s.source: s for s in extract(paths, workers=2)}
+    assert list(pooled) == list(inline) == [str(path) for path in paths]
+    for source, read in pooled.items():
+        assert read.pages == 3
+        assert read.lines == inline[source].lines
+        assert read.period == inline[source].period
+
+
+def test_unreadable_pdf(tmp_path):
+    pytest.importorskip("pdfplumber")
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"not a pdf")
+    with pytest.raises(StatementError):
+        list(extract([broken], workers=0))
+    with pytest.raises(StatementError):
+        list(extract([tmp_path / "missing.pdf"], workers=0))
+
+
+def test_write_pdf_escapes_text(tmp_path):
+    pytest.importorskip("pdfplumber")
+    path = write_pdf(tmp_path / "one.pdf", [["01/02/2025 Cafe (Main St) \\ 2 -4.50"]])
+    (read,) = extract([path], workers=0)
+    assert read.lines == [("01/02/2025", "Cafe (Main St) \\ 2", "-4.50")]
@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+
+import pytest
+
+from assistant.triage import KeywordAutomaton, TriageScorer
+
+
+@dataclass
+class Message:
+    subject: str
+    sender: str
+    body: str = ""
+    received_at: float = 0.0
+
+
+@pytest.fixture(scope="module")
+def scorer():
+    return TriageScorer()
+
+
+def test_automaton_matches_whole_words_and_plurals():
+    automaton = KeywordAutomaton(["ai", "call", "calendar", "due by"])
+    text = "email about ai calls, calendar invites due by friday"
+    assert [kw for _, kw in automaton.finditer(text)] == ["ai", "call", "calendar", "due by"]
+
+
+def test_automaton_rejects_empty_keyword_set():
+    with pytest.raises(ValueError):
+        KeywordAutomaton([])
+
+
+def test_job_opportunity_scores_highest(scorer):
+    result = scorer.score("Interview: Senior Python Engineer", "Jane <jane@acme.io>")
+    assert result.category == "job"
+    assert result.score == 100
+
+
+def test_job_board_digest_is_excluded_from_jobs(scorer):
+    result = scorer.score(
+        "Job Alert: 30 new jobs for Senior Engineer", "LinkedIn <jobalerts-noreply@linkedin.com>"
+    )
+    assert result.category == "newsletter"
+    assert result.score == 20
+
+
+def test_highest_priority_category_wins(scorer):
+    result = scorer.score("Urgent: invoice payment overdue", "Billing <noreply@vendor.com>")
+    assert result.category == "urgent"
+    assert result.score == 90
+
+
+def test_bonuses_apply(scorer):
+    base = scorer.score("Meeting invite", "noreply@calendar.example")
+    assert base.score == 70
+    assert scorer.score("Meeting invite for today", "noreply@calendar.example").score == 80
+    assert scorer.score("Meeting invite", "Sam <sam@example.com>").score == 80
+    # Seniority only counts for job opportunities.
+    assert scorer.score("Meeting with senior staff", "noreply@calendar.example").score == 70
+
+
+def test_body_only_counts_for_body_keywords(scorer):
+    result = scorer.score("Hello", "friend@example.com", "can we schedule a meeting?")
+    assert result.category == "other"
+    result = scorer.score("This week", "news@example.com", "... click to unsubscribe")
+    assert result.category == "newsletter"
+
+
+def test_batch_matches_individual_scoring(scorer):
+    messages = [
+        Message("Interview request", "Recruiter <r@corp.com>"),
+        Message("", "", ""),
+        Message("Your statement is ready", "bank@example.com", "Unsubscribe"),
+        Message("[JIRA] assigned to you", "jira@corp.atlassian.net"),
+    ]
+    batch = scorer.score_batch(messages)
+    assert batch == [scorer.score(m.subject, m.sender, m.body) for m in messages]
+    assert [r.category for r in batch] == ["job", "other", "financial", "work"]
+
+
+def test_unicode_lowercasing_keeps_offsets_aligned(scorer):
+    messages = [Message("İİİİ updated", "x@example.com"), Message("Invoice", "y@example.com")]
+    assert [r.category for r in scorer.score_batch(messages)] == ["work", "financial"]
+
+
+def test_rank_orders_by_score_then_recency(scorer):
+    messages = [
+        Message("Weekly newsletter", "news@x.com", received_at=3),
+        Message("Invoice due", "billing@x.com", received_at=1),
+        Message("Invoice ready", "billing@x.com", received_at=2),
+        Message("Interview", "hr@x.com", received_at=0),
+    ]
+    ranked = scorer.rank(messages, top=3)
+    assert [m.subject for m, _ in ranked] == ["Interview", "Invoice ready", "Invoice due"]